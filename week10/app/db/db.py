@@ -1,30 +1,307 @@
 """
 Database connection module.
 Handles SQLite database connections.
+
+Connections are drawn from a small per-database pool instead of being
+opened and closed for every query. Callers keep using the usual
+connect_database() / conn.close() pattern: close() hands the connection
+back to the pool rather than tearing it down.
 """
+import os
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 
 # Database path
 DB_PATH = Path("DATA") / "intelligence_platform.db"
 
+# Number of idle connections kept open per database file
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+
+# Named pragma profiles applied to every new connection, in order.
+# journal_mode must come first: it cannot be changed once query_only is on.
+# WAL is stored in the database file itself, so it is only switched on for
+# databases the app creates; existing files keep their journal mode.
+PROFILES = {
+    "oltp": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -16000),        # ~16 MB page cache
+        ("mmap_size", 67108864),       # 64 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 5000),        # ms
+    ],
+    "bulk_load": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "OFF"),
+        ("cache_size", -262144),       # ~256 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 30000),
+    ],
+    "read_only_analytics": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -65536),        # ~64 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 10000),
+        ("query_only", "ON"),
+    ],
+}
+
+# Profile used when none is passed explicitly
+DEFAULT_PROFILE = os.getenv("DB_PROFILE", "oltp")
+
+
+def is_new_database(db_path):
+    """
+    Check whether a database file has not been created yet.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        bool: True if the file is missing or empty
+    """
+    return not os.path.exists(db_path) or os.path.getsize(db_path) == 0
+
+
+def apply_profile(conn, profile=None, new_database=False):
+    """
+    Apply a named pragma profile to a connection.
+
+    Args:
+        conn: Database connection
+        profile: Profile name from PROFILES (default: DB_PROFILE env var)
+        new_database: The connection created the database file; only
+            then is journal_mode=WAL applied
+
+    Returns:
+        str: Name of the profile that was applied
+    """
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{profile}'. "
+            f"Choose one of: {', '.join(PROFILES)}"
+        )
+    for pragma, value in PROFILES[profile]:
+        if pragma == "journal_mode" and value == "WAL" and not new_database:
+            continue
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return profile
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3.Connection that returns itself to its pool on close().
+
+    It is still a real sqlite3.Connection, so pandas (read_sql_query,
+    to_sql) and cursor code work with it unchanged.
+    """
+
+    _pool = None
+    _checked_out = False
+
+    def close(self):
+        """Return the connection to its pool (or close it if unpooled)."""
+        if self._pool is None:
+            super().close()
+        elif self._checked_out:
+            self._pool.release(self)
+
+    def close_for_real(self):
+        """Close the underlying SQLite handle."""
+        self._pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of SQLite connections for a single database file.
+
+    acquire() hands out a healthy connection (reusing an idle one when
+    possible) and release() takes it back. At most `size` idle
+    connections are kept; extra connections opened under load are closed
+    when they are returned, so a caller that forgets to close never
+    starves the others.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE, profile=None):
+        """
+        Create a pool for one database file.
+
+        Args:
+            db_path: Path to the database file
+            size: Maximum number of idle connections to keep open
+            profile: Pragma profile applied to each new connection
+        """
+        self.db_path = str(db_path)
+        self.size = max(int(size), 1)
+        self.profile = profile or DEFAULT_PROFILE
+        if self.profile not in PROFILES:
+            raise ValueError(f"Unknown database profile '{self.profile}'")
+        self._idle = queue.LifoQueue(maxsize=self.size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'discarded': 0}
+
+        # Ensure DATA directory exists (once per pool, not per query)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _new_connection(self):
+        new_database = is_new_database(self.db_path)
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False
+        )
+        apply_profile(conn, self.profile, new_database)
+        conn._pool = self
+        self._count('created')
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        self._count('discarded')
+        try:
+            conn.close_for_real()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self):
+        """
+        Check a connection out of the pool.
+
+        Returns:
+            PooledConnection: Connection owned by the caller until close()
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool has been closed")
+
+        conn = None
+        while conn is None:
+            try:
+                candidate = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._new_connection()
+                break
+            if self._is_healthy(candidate):
+                conn = candidate
+                self._count('reused')
+            else:
+                self._discard(candidate)
+
+        conn._checked_out = True
+        return conn
+
+    def release(self, conn):
+        """
+        Return a checked-out connection to the pool.
+
+        Any transaction left open by the caller is rolled back so the
+        next borrower starts from a clean state.
+
+        Args:
+            conn: Connection previously returned by acquire()
+        """
+        conn._checked_out = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        if self._closed:
+            self._discard(conn)
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def close(self):
+        """Close every idle connection and stop handing out new ones."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close_for_real()
+
 
-def connect_database(db_path=DB_PATH):
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=DB_PATH, size=None, profile=None):
+    """
+    Get (or create) the connection pool for a database file.
+
+    Each (file, profile) pair gets its own pool so that, for example,
+    read-only analytics connections are never handed to writers.
+
+    Args:
+        db_path: Path to the database file
+        size: Idle pool size; only used when the pool is first created
+        profile: Pragma profile name (default: DB_PROFILE env var)
+
+    Returns:
+        ConnectionPool: Pool shared by all callers of this database
+    """
+    profile = profile or DEFAULT_PROFILE
+    key = (os.path.abspath(db_path), profile)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(key[0], size or POOL_SIZE, profile)
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools():
+    """Close every pool (e.g. before deleting the database file)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+def connect_database(db_path=DB_PATH, profile=None):
     """
     Connect to the SQLite database.
     Creates the database file if it doesn't exist.
 
+    The connection comes from the shared pool; call close() on it (or
+    close_database) to hand it back.
+
     Args:
         db_path: Path to the database file
+        profile: Pragma profile name: "oltp", "bulk_load" or
+            "read_only_analytics" (default: DB_PROFILE env var, else "oltp")
 
     Returns:
         sqlite3.Connection: Database connection object
     """
-    # Ensure DATA directory exists
-    db_path = Path(db_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    return sqlite3.connect(str(db_path))
+    return get_pool(db_path, profile=profile).acquire()
 
 
 def close_database(conn):
@@ -5,7 +5,6 @@ from pathlib import Path
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-import pandas as pd
 
 # Path setup
 ROOT = Path(__file__).resolve().parents[1]
@@ -13,6 +12,8 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from services.database_manager import DatabaseManager
+from services.search_service import SearchService
+from services.summary_service import SummaryService
 from models.security_incident import SecurityIncident
 
 # Check login
@@ -25,77 +26,66 @@ st.title("🛡️ Cybersecurity Dashboard")
 # Initialize database
 @st.cache_resource
 def get_db():
-    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"))
+    # Reruns re-read unchanged tables, so cache results until a write lands
+    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"),
+                           result_cache_mb=32)
 
 db = get_db()
 
-# Helper function to fetch incidents as objects
-def fetch_all_incidents():
-    """Fetch all incidents and return as SecurityIncident objects."""
-    rows = db.fetch_all(
-        """SELECT id, date, incident_type, severity, status,
-           description, reported_by
-           FROM cyber_incidents
-           ORDER BY id DESC"""
-    )
-
-    incidents = []
-    for row in rows:
-        incident = SecurityIncident(
-            incident_id=row["id"],
-            incident_date=row["date"],  # Changed from incident_date to date
-            incident_type=row["incident_type"],
-            severity=row["severity"],
-            status=row["status"],
-            description=row["description"],
-            reported_by=row["reported_by"]
-        )
-        incidents.append(incident)
+# Rows per page in the incidents table
+PAGE_SIZE = 50
 
-    return incidents
+@st.cache_resource
+def get_search():
+    return SearchService(db)
 
-def get_incidents_dataframe():
-    """Get incidents as a pandas DataFrame for display."""
-    incidents = fetch_all_incidents()
-    if not incidents:
-        return pd.DataFrame()
+search = get_search()
 
-    data = [incident.to_dict() for incident in incidents]
-    return pd.DataFrame(data)
+@st.cache_resource
+def get_summaries():
+    return SummaryService(db)
+
+summaries = get_summaries()
+
+# Helper function to turn the current page into objects
+def incidents_on_page(page_df):
+    """Build SecurityIncident objects for the rows of one table page."""
+    return [
+        SecurityIncident(
+            incident_id=int(row["ID"]),
+            incident_date=row["Date"],
+            incident_type=row["Type"],
+            severity=row["Severity"],
+            status=row["Status"],
+            description=row["Description"],
+            reported_by=row["Reported By"]
+        )
+        for row in page_df.to_dict("records")
+    ]
+
+def get_incidents_page(after=None):
+    """Get one page of incidents (newest first) and the next page's cursor."""
+    # Columnar fetch: no per-row SecurityIncident/dict round trip
+    return db.fetch_page(
+        """SELECT id AS "ID", date AS "Date", incident_type AS "Type",
+           severity AS "Severity", status AS "Status",
+           description AS "Description", reported_by AS "Reported By"
+           FROM cyber_incidents""",
+        after=after, limit=PAGE_SIZE, key="ID",
+        dtypes={"ID": "int64", "Type": "category",
+                "Severity": "category", "Status": "category"}
+    )
 
 def get_incident_statistics():
-    """Calculate statistics from incidents."""
-    incidents = fetch_all_incidents()
+    """Get incident statistics from the trigger-maintained summary table."""
+    stats = summaries.incident_statistics()
 
-    if not incidents:
+    if stats["by_type"].empty:
         return None
 
-    # Count by type
-    type_counts = {}
-    severity_counts = {}
-    status_counts = {}
-
-    for incident in incidents:
-        # By type
-        incident_type = incident.get_incident_type()
-        type_counts[incident_type] = type_counts.get(incident_type, 0) + 1
-
-        # By severity
-        severity = incident.get_severity()
-        severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-        # By status
-        status = incident.get_status()
-        status_counts[status] = status_counts.get(status, 0) + 1
-
-    return {
-        "by_type": pd.DataFrame(list(type_counts.items()), columns=["incident_type", "count"]),
-        "by_severity": pd.DataFrame(list(severity_counts.items()), columns=["severity", "count"]),
-        "by_status": pd.DataFrame(list(status_counts.items()), columns=["status", "count"])
-    }
+    return stats
 
 # ---------------- Fetch Data ----------------
-df = get_incidents_dataframe()
 stats = get_incident_statistics()
 
 # ---------------- Visualization ----------------
@@ -139,13 +129,45 @@ if stats:
         )
         st.plotly_chart(fig3, use_container_width=True)
 
+# ---------------- Full-Text Search ----------------
+search_text = st.text_input("🔎 Search incident descriptions", placeholder="e.g., ransomware, phish*")
+
+if search_text.strip():
+    try:
+        results = search.search_incidents(search_text, limit=50)
+    except ValueError:
+        # Only punctuation (e.g. "*"), no words left to search for
+        st.info("Type a word to search for.")
+    else:
+        if results.empty:
+            st.info("No matches found.")
+        else:
+            st.caption(f"Top {len(results)} matches, best first")
+            st.dataframe(results.drop(columns=["score"]), use_container_width=True)
+
 # ---------------- Display Incidents Table ----------------
 st.subheader("📋 All Cybersecurity Incidents")
 
-if df.empty:
+# Keyset pagination: each rerun fetches a single page of rows
+cursors = st.session_state.setdefault("incident_cursors", [None])
+page_df, next_cursor = get_incidents_page(cursors[-1])
+
+if page_df.empty and len(cursors) == 1:
     st.info("No incidents found. Add your first incident below!")
 else:
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(page_df, use_container_width=True)
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ Newer", disabled=len(cursors) == 1, key="incident_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.caption(f"Page {len(cursors)} · {PAGE_SIZE} rows per page")
+    with col_next:
+        if st.button("Older ▶", disabled=next_cursor is None, key="incident_next"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 # ---------------- CRUD Operations ----------------
 
@@ -170,11 +192,11 @@ with st.expander("➕ Add Incident", expanded=False):
         else:
             st.warning("Please fill in all required fields")
 
+# The Update/Delete selectors offer the incidents on the current page
+incidents = incidents_on_page(page_df)
+
 # Update Incident
 with st.expander("✏️ Update Incident Status", expanded=False):
-    # Get all incidents for selection
-    incidents = fetch_all_incidents()
-
     if incidents:
         # Create selection options
         incident_options = {f"ID {inc.get_id()}: {inc.get_incident_type()}": inc.get_id()
@@ -213,8 +235,6 @@ with st.expander("✏️ Update Incident Status", expanded=False):
 
 # Delete Incident
 with st.expander("🗑️ Delete Incident", expanded=False):
-    incidents = fetch_all_incidents()
-
     if incidents:
         incident_options = {f"ID {inc.get_id()}: {inc.get_incident_type()} [{inc.get_severity()}]": inc.get_id()
                           for inc in incidents}
@@ -5,7 +5,6 @@ from pathlib import Path
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-import pandas as pd
 
 # Path setup
 ROOT = Path(__file__).resolve().parents[1]
@@ -25,69 +24,99 @@ st.title("📊 Data Science Dashboard")
 # Initialize database
 @st.cache_resource
 def get_db():
-    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"))
+    # Reruns re-read unchanged tables, so cache results until a write lands
+    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"),
+                           result_cache_mb=32)
 
 db = get_db()
 
+# Rows per page in the datasets table
+PAGE_SIZE = 50
+
+# Datasets shown in the size chart
+SIZE_CHART_LIMIT = 20
+
 # Helper functions
-def fetch_all_datasets():
-    """Fetch all datasets and return as Dataset objects."""
-    rows = db.fetch_all(
-        """SELECT id, dataset_name, category, source, last_updated,
-           record_count, file_size_mb
+def datasets_on_page(page_df):
+    """Build Dataset objects for the rows of one table page."""
+    return [
+        Dataset(
+            dataset_id=int(row["ID"]),
+            dataset_name=row["Name"],
+            category=row["Category"],
+            source=row["Source"],
+            upload_date=row["Upload Date"],
+            record_count=row["Records"],
+            file_size_mb=row["Size (MB)"]
+        )
+        for row in page_df.to_dict("records")
+    ]
+
+def get_dataset_totals():
+    """Dataset count and record/size totals, aggregated in SQL."""
+    return db.fetch_all(
+        """SELECT COUNT(*) AS datasets,
+           COALESCE(SUM(record_count), 0) AS records,
+           COALESCE(SUM(file_size_mb), 0) AS size_mb
+           FROM datasets_metadata"""
+    )[0]
+
+def get_records_by_category():
+    """Total records per category for the pie chart."""
+    return db.fetch_columns(
+        """SELECT category AS "Category", SUM(record_count) AS "Records"
            FROM datasets_metadata
-           ORDER BY id DESC"""
+           GROUP BY category""",
+        dtypes={"Category": "category"}
     )
 
-    datasets = []
-    for row in rows:
-        dataset = Dataset(
-            dataset_id=row["id"],
-            dataset_name=row["dataset_name"],
-            category=row["category"],
-            source=row["source"],
-            upload_date=row["last_updated"],  # Changed from upload_date to last_updated
-            record_count=row["record_count"],
-            file_size_mb=row["file_size_mb"]
-        )
-        datasets.append(dataset)
-
-    return datasets
-
-def get_datasets_dataframe():
-    """Get datasets as a pandas DataFrame for display."""
-    datasets = fetch_all_datasets()
-    if not datasets:
-        return pd.DataFrame()
+def get_largest_datasets(limit=SIZE_CHART_LIMIT):
+    """The largest datasets by file size for the size chart."""
+    return db.fetch_columns(
+        """SELECT dataset_name AS "Name", category AS "Category",
+           file_size_mb AS "Size (MB)"
+           FROM datasets_metadata
+           ORDER BY file_size_mb DESC
+           LIMIT ?""",
+        (limit,),
+        dtypes={"Category": "category", "Size (MB)": "float64"}
+    )
 
-    data = [dataset.to_dict() for dataset in datasets]
-    return pd.DataFrame(data)
+def get_datasets_page(after=None):
+    """Get one page of datasets (newest first) and the next page's cursor."""
+    return db.fetch_page(
+        """SELECT id AS "ID", dataset_name AS "Name", category AS "Category",
+           source AS "Source", last_updated AS "Upload Date",
+           record_count AS "Records", file_size_mb AS "Size (MB)"
+           FROM datasets_metadata""",
+        after=after, limit=PAGE_SIZE, key="ID",
+        dtypes={"ID": "int64", "Category": "category", "Source": "category",
+                "Size (MB)": "float64"}
+    )
 
 # ---------------- Fetch Data ----------------
-df = get_datasets_dataframe()
+totals = get_dataset_totals()
 
 # ---------------- Visualizations ----------------
-if not df.empty:
+if totals["datasets"]:
     st.subheader("📊 Dataset Statistics")
 
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.metric("Total Datasets", len(df))
+        st.metric("Total Datasets", totals["datasets"])
 
     with col2:
-        total_records = df["Records"].sum()
-        st.metric("Total Records", f"{total_records:,}")
+        st.metric("Total Records", f"{int(totals['records']):,}")
 
     with col3:
-        total_size = df["Size (MB)"].sum()
-        st.metric("Total Size", f"{total_size:.2f} MB")
+        st.metric("Total Size", f"{totals['size_mb']:.2f} MB")
 
     col1, col2 = st.columns(2)
 
     with col1:
         fig1 = px.pie(
-            df,
+            get_records_by_category(),
             names="Category",
             values="Records",
             title="Records by Category"
@@ -96,10 +125,10 @@ if not df.empty:
 
     with col2:
         fig2 = px.bar(
-            df,
+            get_largest_datasets(),
             x="Name",
             y="Size (MB)",
-            title="Dataset Sizes",
+            title=f"Largest {SIZE_CHART_LIMIT} Datasets",
             color="Category"
         )
         st.plotly_chart(fig2, use_container_width=True)
@@ -107,10 +136,26 @@ if not df.empty:
 # ---------------- Display Datasets Table ----------------
 st.subheader("📋 All Datasets")
 
-if df.empty:
+# Keyset pagination: each rerun fetches a single page of rows
+cursors = st.session_state.setdefault("dataset_cursors", [None])
+page_df, next_cursor = get_datasets_page(cursors[-1])
+
+if page_df.empty and len(cursors) == 1:
     st.info("No datasets found. Add your first dataset below!")
 else:
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(page_df, use_container_width=True)
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ Newer", disabled=len(cursors) == 1, key="dataset_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.caption(f"Page {len(cursors)} · {PAGE_SIZE} rows per page")
+    with col_next:
+        if st.button("Older ▶", disabled=next_cursor is None, key="dataset_next"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 # ---------------- CRUD Operations ----------------
 
@@ -135,10 +180,11 @@ with st.expander("➕ Add Dataset Metadata", expanded=False):
         else:
             st.warning("Please fill in all required fields (Name, Category, Source)")
 
+# The Update/Delete selectors offer the datasets on the current page
+datasets = datasets_on_page(page_df)
+
 # Update Dataset
 with st.expander("🛠️ Update Dataset Metadata", expanded=False):
-    datasets = fetch_all_datasets()
-
     if datasets:
         # Create selection options
         dataset_options = {f"ID {ds.get_id()}: {ds.get_name()}": ds.get_id()
@@ -187,8 +233,6 @@ with st.expander("🛠️ Update Dataset Metadata", expanded=False):
 
 # Delete Dataset
 with st.expander("🗑️ Delete Dataset", expanded=False):
-    datasets = fetch_all_datasets()
-
     if datasets:
         dataset_options = {f"ID {ds.get_id()}: {ds.get_name()} ({ds.get_category()})": ds.get_id()
                          for ds in datasets}
@@ -5,7 +5,6 @@ from pathlib import Path
 import streamlit as st
 import plotly.express as px
 from datetime import datetime
-import pandas as pd
 
 # Path setup
 ROOT = Path(__file__).resolve().parents[1]
@@ -13,6 +12,8 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from services.database_manager import DatabaseManager
+from services.search_service import SearchService
+from services.summary_service import SummaryService
 from models.it_ticket import ITTicket
 
 # Check login
@@ -25,81 +26,134 @@ st.title("💻 IT Ticket Dashboard")
 # Initialize database
 @st.cache_resource
 def get_db():
-    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"))
+    # Reruns re-read unchanged tables, so cache results until a write lands
+    return DatabaseManager(str(ROOT / "database" / "intelligence_platform.db"),
+                           result_cache_mb=32)
 
 db = get_db()
 
-# Helper functions
-def fetch_all_tickets():
-    """Fetch all tickets and return as ITTicket objects."""
-    rows = db.fetch_all(
-        """SELECT id, ticket_id, priority, status, category,
-           subject, description, created_date
-           FROM it_tickets
-           ORDER BY id DESC"""
-    )
+@st.cache_resource
+def get_search():
+    return SearchService(db)
 
-    tickets = []
-    for row in rows:
-        ticket = ITTicket(
-            ticket_id=row["id"],
-            ticket_ref=row["ticket_id"],
-            priority=row["priority"],
-            status=row["status"],
-            category=row["category"],
-            subject=row["subject"],
-            description=row["description"],
-            created_date=row["created_date"]
-        )
-        tickets.append(ticket)
+search = get_search()
+
+@st.cache_resource
+def get_summaries():
+    return SummaryService(db)
+
+summaries = get_summaries()
 
-    return tickets
+# Rows per page in the tickets table
+PAGE_SIZE = 50
 
-def get_tickets_dataframe():
-    """Get tickets as a pandas DataFrame for display."""
-    tickets = fetch_all_tickets()
-    if not tickets:
-        return pd.DataFrame()
+# Helper functions
+def tickets_on_page(page_df):
+    """Build ITTicket objects for the rows of one table page."""
+    return [
+        ITTicket(
+            ticket_id=int(row["ID"]),
+            ticket_ref=row["Ticket Ref"],
+            priority=row["Priority"],
+            status=row["Status"],
+            category=row["Category"],
+            subject=row["Subject"],
+            description=row["Description"],
+            created_date=row["Created"]
+        )
+        for row in page_df.to_dict("records")
+    ]
+
+def get_tickets_page(after=None):
+    """Get one page of tickets (newest first) and the next page's cursor."""
+    # Columnar fetch: no per-row ITTicket/dict round trip
+    return db.fetch_page(
+        """SELECT id AS "ID", ticket_id AS "Ticket Ref", priority AS "Priority",
+           status AS "Status", category AS "Category", subject AS "Subject",
+           description AS "Description", created_date AS "Created",
+           COALESCE(assigned_to, 'Unassigned') AS "Assigned To"
+           FROM it_tickets""",
+        after=after, limit=PAGE_SIZE, key="ID",
+        dtypes={"ID": "int64", "Priority": "category", "Status": "category",
+                "Category": "category", "Assigned To": "category"}
+    )
 
-    data = [ticket.to_dict() for ticket in tickets]
-    return pd.DataFrame(data)
+def get_priority_status_counts():
+    """Ticket counts per (priority, status) pair for the overview chart."""
+    return db.fetch_df(
+        """SELECT priority AS "Priority", status AS "Status", COUNT(*) AS "Tickets"
+           FROM it_tickets
+           GROUP BY priority, status"""
+    )
 
 # ---------------- Fetch Data ----------------
-df = get_tickets_dataframe()
+status_counts = summaries.ticket_statistics()["by_status"]
 
 # ---------------- Visualization ----------------
-if not df.empty:
+if not status_counts.empty:
     st.subheader("📊 Tickets Overview")
 
+    by_status = dict(zip(status_counts["status"], status_counts["count"]))
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.metric("Total Tickets", len(df))
+        st.metric("Total Tickets", int(status_counts["count"].sum()))
 
     with col2:
-        open_tickets = len(df[df["Status"] == "Open"])
-        st.metric("Open Tickets", open_tickets)
+        st.metric("Open Tickets", int(by_status.get("Open", 0)))
 
     with col3:
-        resolved_tickets = len(df[df["Status"] == "Resolved"])
-        st.metric("Resolved Tickets", resolved_tickets)
+        st.metric("Resolved Tickets", int(by_status.get("Resolved", 0)))
 
-    fig = px.histogram(
-        df,
+    fig = px.bar(
+        get_priority_status_counts(),
         x="Priority",
+        y="Tickets",
         color="Status",
         title="Tickets by Priority and Status",
         barmode="group"
     )
     st.plotly_chart(fig, use_container_width=True)
 
+# ---------------- Full-Text Search ----------------
+search_text = st.text_input("🔎 Search ticket subjects and descriptions", placeholder="e.g., password reset, vpn*")
+
+if search_text.strip():
+    try:
+        results = search.search_tickets(search_text, limit=50)
+    except ValueError:
+        # Only punctuation (e.g. "*"), no words left to search for
+        st.info("Type a word to search for.")
+    else:
+        if results.empty:
+            st.info("No matches found.")
+        else:
+            st.caption(f"Top {len(results)} matches, best first")
+            st.dataframe(results.drop(columns=["score"]), use_container_width=True)
+
 # ---------------- Display Tickets Table ----------------
 st.subheader("📋 All Tickets")
 
-if df.empty:
+# Keyset pagination: each rerun fetches a single page of rows
+cursors = st.session_state.setdefault("ticket_cursors", [None])
+page_df, next_cursor = get_tickets_page(cursors[-1])
+
+if page_df.empty and len(cursors) == 1:
     st.info("No tickets found. Create your first ticket below!")
 else:
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(page_df, use_container_width=True)
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("◀ Newer", disabled=len(cursors) == 1, key="ticket_prev"):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.caption(f"Page {len(cursors)} · {PAGE_SIZE} rows per page")
+    with col_next:
+        if st.button("Older ▶", disabled=next_cursor is None, key="ticket_next"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 # ---------------- CRUD Operations ----------------
 
@@ -125,10 +179,11 @@ with st.expander("➕ Create Ticket", expanded=False):
         else:
             st.warning("Please fill in all required fields (Ticket ID, Subject, Description)")
 
+# The Update/Delete selectors offer the tickets on the current page
+tickets = tickets_on_page(page_df)
+
 # Update Ticket Status
 with st.expander("🛠️ Update Ticket Status", expanded=False):
-    tickets = fetch_all_tickets()
-
     if tickets:
         # Create selection options
         ticket_options = {f"ID {tk.get_id()}: {tk.get_ticket_ref()} - {tk.get_subject()}": tk.get_id()
@@ -168,8 +223,6 @@ with st.expander("🛠️ Update Ticket Status", expanded=False):
 
 # Delete Ticket
 with st.expander("🗑️ Delete Ticket", expanded=False):
-    tickets = fetch_all_tickets()
-
     if tickets:
         ticket_options = {f"ID {tk.get_id()}: {tk.get_ticket_ref()} - {tk.get_subject()} [{tk.get_priority()}]": tk.get_id()
                         for tk in tickets}
@@ -1,7 +1,11 @@
 """Service classes for the Multi-Domain Intelligence Platform."""
 
 from .database_manager import DatabaseManager
+from .async_database_manager import AsyncDatabaseManager
 from .auth_manager import AuthManager, SimpleHasher
+from .search_service import SearchService
+from .summary_service import SummaryService
 from .ai_assistant import AIAssistant
 
-__all__ = ['DatabaseManager', 'AuthManager', 'SimpleHasher', 'AIAssistant']
+__all__ = ['DatabaseManager', 'AsyncDatabaseManager', 'AuthManager', 'SimpleHasher', 'SearchService',
+           'SummaryService', 'AIAssistant']
@@ -0,0 +1,116 @@
+"""AsyncDatabaseManager service class."""
+
+import asyncio
+import itertools
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+import pandas as pd
+from services.database_manager import DatabaseManager
+
+
+class AsyncDatabaseManager:
+    """Awaitable facade over DatabaseManager for asyncio code.
+
+    Calls run on a bounded thread pool. Every worker thread reads through
+    its own SQLite connection and writes go through DatabaseManager's
+    single writer thread, so many coroutines can share one database file
+    without blocking the event loop or each other.
+
+    A timeout or cancellation interrupts a read that is already running,
+    but only while that call is still the one running on its worker. A
+    write that has already reached the writer thread still completes;
+    only the wait for it is abandoned.
+    """
+
+    def __init__(self, db_path: str, max_workers: int = 8,
+                 profile: Optional[str] = None, timeout: Optional[float] = None):
+        self._db = DatabaseManager(db_path, profile=profile)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sqlite-async"
+        )
+        self._timeout = timeout
+        # Worker thread ident -> id of the call it is running
+        self._running: Dict[int, int] = {}
+        self._running_lock = threading.Lock()
+        self._call_ids = itertools.count()
+
+    def get_sync_manager(self) -> DatabaseManager:
+        """Get the underlying DatabaseManager (e.g. for stats())."""
+        return self._db
+
+    async def _run(self, fn: Callable[..., Any], *args: Any,
+                   timeout: Optional[float] = None) -> Any:
+        """Run fn(*args) on a worker, interrupting it on timeout/cancel."""
+        call_id = next(self._call_ids)
+        worker: Dict[str, Any] = {}
+
+        def call() -> Any:
+            conn = self._db._reader()
+            ident = threading.get_ident()
+            with self._running_lock:
+                self._running[ident] = call_id
+                worker["ident"], worker["conn"] = ident, conn
+            try:
+                return fn(*args)
+            finally:
+                with self._running_lock:
+                    del self._running[ident]
+                # An interrupt can outlive the statement it was aimed at;
+                # start the worker's next call on a fresh connection
+                if worker.get("interrupted"):
+                    self._db._discard_reader()
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, call)
+        try:
+            return await asyncio.wait_for(
+                future, timeout if timeout is not None else self._timeout
+            )
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # Holding the lock keeps the worker from moving on to another
+            # call between the check and the interrupt
+            with self._running_lock:
+                if self._running.get(worker.get("ident")) == call_id:
+                    worker["interrupted"] = True
+                    worker["conn"].interrupt()
+            raise
+
+    async def execute_query(self, sql: str, params: Iterable[Any] = (),
+                            timeout: Optional[float] = None) -> sqlite3.Cursor:
+        """Execute a write query (INSERT, UPDATE, DELETE)."""
+        return await self._run(self._db.execute_query, sql, tuple(params),
+                               timeout=timeout)
+
+    async def fetch_one(self, sql: str, params: Iterable[Any] = (),
+                        timeout: Optional[float] = None) -> Optional[sqlite3.Row]:
+        """Fetch a single row."""
+        return await self._run(self._db.fetch_one, sql, tuple(params),
+                               timeout=timeout)
+
+    async def fetch_all(self, sql: str, params: Iterable[Any] = (),
+                        timeout: Optional[float] = None) -> List[sqlite3.Row]:
+        """Fetch all rows."""
+        return await self._run(self._db.fetch_all, sql, tuple(params),
+                               timeout=timeout)
+
+    async def fetch_df(self, sql: str, params: Iterable[Any] = (),
+                       timeout: Optional[float] = None) -> pd.DataFrame:
+        """Fetch results as a pandas DataFrame."""
+        return await self._run(self._db.fetch_df, sql, tuple(params),
+                               timeout=timeout)
+
+    async def close(self) -> None:
+        """Stop the worker pool and close all connections."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        self._db.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
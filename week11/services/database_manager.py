@@ -1,42 +1,444 @@
 """DatabaseManager service class."""
 
+import os
+import queue
 import sqlite3
-from typing import Any, Iterable, Optional, List
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Set, Tuple, Union
+import numpy as np
 import pandas as pd
+from services.pagination import decode_cursor, encode_cursor
+from services.query_stats import QueryStats
+from services.result_cache import (
+    ANY_TABLE, ResultCache, read_tables, schema_tables, trigger_targets,
+    written_table
+)
+from services.snapshot_service import SnapshotService
+
+# Named pragma profiles applied on connect, in order.
+# journal_mode must come first: it cannot be changed once query_only is on.
+# WAL is stored in the database file itself, so it is only switched on for
+# databases the manager creates; existing files keep their journal mode.
+PROFILES: Dict[str, List[Tuple[str, Any]]] = {
+    "oltp": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -16000),        # ~16 MB page cache
+        ("mmap_size", 67108864),       # 64 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 5000),        # ms
+    ],
+    "bulk_load": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "OFF"),
+        ("cache_size", -262144),       # ~256 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 30000),
+    ],
+    "read_only_analytics": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -65536),        # ~64 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 10000),
+        ("query_only", "ON"),
+    ],
+}
+
 
 class DatabaseManager:
-    """Handles SQLite database connections and queries."""
+    """Handles SQLite database connections and queries.
+
+    Reads run on a connection owned by the calling thread, so concurrent
+    Streamlit sessions read in parallel. Writes are queued to a single
+    writer thread that owns the only write connection, which keeps them
+    serialized without locking the readers out.
+
+    Inside a ``with db.transaction():`` block the calling thread has the
+    writer to itself: statements are not committed until the block ends,
+    and reads go through the writer so they see the pending changes.
+
+    With result_cache_mb > 0, fetch_all/fetch_df results are kept in an LRU
+    cache keyed by the exact SQL text and parameters. An entry is dropped
+    once a write through this manager touches one of the tables it read
+    (directly, through a trigger or through a view), or once PRAGMA
+    data_version shows a commit from some other connection.
 
-    def __init__(self, db_path: str):
+    With replica_path set (":memory:" or a file path), reads can pass
+    read_from="replica" to run against a backup-API snapshot that is at
+    most replica_max_staleness seconds old, keeping heavy analytics off
+    the live database file.
+    """
+
+    _STOP = object()
+
+    def __init__(self, db_path: str, profile: Optional[str] = None,
+                 slow_query_ms: float = 100.0, explain_slow: bool = False,
+                 slow_log_size: int = 100, result_cache_mb: float = 0,
+                 replica_path: Optional[str] = None,
+                 replica_max_staleness: float = 30.0):
         self._db_path = db_path
-        self._connection: Optional[sqlite3.Connection] = None
+        self._profile = profile or os.getenv("DB_PROFILE", "oltp")
+        if self._profile not in PROFILES:
+            raise ValueError(
+                f"Unknown database profile '{self._profile}'. "
+                f"Choose one of: {', '.join(PROFILES)}"
+            )
+        self._local = threading.local()
+        self._readers: Dict[int, Tuple[threading.Thread, sqlite3.Connection]] = {}
+        self._lock = threading.Lock()
+        self._write_queue: "queue.Queue" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Held by a thread for the whole of its transaction() scope
+        self._txn_lock = threading.RLock()
+        self._stats = QueryStats(slow_query_ms, slow_log_size)
+        self._explain_slow = explain_slow
+        self._cache: Optional[ResultCache] = None
+        if result_cache_mb > 0:
+            self._cache = ResultCache(int(result_cache_mb * 1024 * 1024))
+        # Source table -> tables its triggers write to (writer thread only)
+        self._trigger_map: Optional[Dict[str, Set[str]]] = None
+        # Table/view -> tables it reads, with the ANY_TABLE version it
+        # was loaded at (reloaded after DDL)
+        self._schema: Optional[Tuple[int, Dict[str, Set[str]]]] = None
+        # Commits made by the writer, and its last PRAGMA data_version
+        self._commits = 0
+        self._writer_data_version: Optional[int] = None
+        self._replica: Optional[SnapshotService] = None
+        if replica_path is not None:
+            self._replica = SnapshotService(db_path, replica_path, replica_max_staleness)
 
-    def connect(self) -> None:
-        """Establish database connection."""
-        if self._connection is None:
+    def get_profile(self) -> str:
+        """Get the name of the pragma profile used on connect."""
+        return self._profile
+
+    def _apply_profile(self, conn: sqlite3.Connection,
+                       new_database: bool = False) -> None:
+        """Apply the selected pragma profile to a fresh connection.
+        journal_mode=WAL is only applied when new_database is True."""
+        for pragma, value in PROFILES[self._profile]:
+            if pragma == "journal_mode" and value == "WAL" and not new_database:
+                continue
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new connection with the selected profile."""
+        new_database = (not os.path.exists(self._db_path)
+                        or os.path.getsize(self._db_path) == 0)
+        # check_same_thread=False only so close() can tidy up from any thread;
+        # each connection is still used by exactly one thread.
+        conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_profile(conn, new_database)
+        # Test the connection
+        conn.execute("SELECT 1")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get the calling thread's read connection, opening it if needed."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
             try:
-                self._connection = sqlite3.connect(self._db_path, check_same_thread=False)
-                self._connection.row_factory = sqlite3.Row
-                # Test the connection
-                self._connection.execute("SELECT 1")
+                conn = self._open()
             except Exception as e:
                 print(f"Database connection error: {e}")
                 raise
+            self._local.conn = conn
+            current = threading.current_thread()
+            with self._lock:
+                # Close connections left behind by threads that have exited
+                for ident, (thread, old) in list(self._readers.items()):
+                    if not thread.is_alive():
+                        old.close()
+                        del self._readers[ident]
+                self._readers[current.ident] = (current, conn)
+        return conn
+
+    def _discard_reader(self) -> None:
+        """Close the calling thread's read connection; its next read
+        opens a new one."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        self._local.data_version = None
+        with self._lock:
+            self._readers.pop(threading.get_ident(), None)
+        conn.close()
+
+    def _writer_loop(self, ready: Future) -> None:
+        """Run queued write jobs one at a time on the writer connection."""
+        try:
+            conn = self._open()
+        except Exception as e:
+            ready.set_exception(e)
+            return
+        ready.set_result(True)
+
+        while True:
+            item = self._write_queue.get()
+            if item is self._STOP:
+                break
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(job(conn))
+            except BaseException as e:
+                future.set_exception(e)
+        conn.close()
+
+    def _submit_write(self, job: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run job(conn) on the writer thread and wait for its result."""
+        if self._writer is None:
+            self.connect()
+        future: Future = Future()
+        self._write_queue.put((job, future))
+        return future.result()
+
+    def _in_transaction(self) -> bool:
+        """Return True if the calling thread is inside transaction()."""
+        return getattr(self._local, "txn_depth", 0) > 0
+
+    def _write(self, job: Callable[[sqlite3.Connection], Any], sql: str) -> Any:
+        """Run a write job, committing it unless a transaction is open."""
+        table = written_table(sql)
+        with self._txn_lock:
+            if self._in_transaction():
+                self._local.txn_tables.add(table)
+                return self._submit_write(job)
+
+            def autocommit(conn: sqlite3.Connection) -> Any:
+                try:
+                    result = job(conn)
+                    conn.commit()
+                except BaseException:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    raise
+                self._commits += 1
+                if self._cache is not None:
+                    self._cache.bump(self._affected_tables(conn, [table]))
+                return result
+
+            return self._submit_write(autocommit)
+
+    def _affected_tables(self, conn: sqlite3.Connection,
+                         tables: Iterable[str]) -> Set[str]:
+        """Add the tables that triggers write to when tables are written.
+        Runs on the writer thread; DDL (ANY_TABLE) reloads the trigger map."""
+        tables = set(tables)
+        if ANY_TABLE in tables or self._trigger_map is None:
+            self._trigger_map = trigger_targets(conn)
+        for table in list(tables):
+            tables |= self._trigger_map.get(table, set())
+        return tables
+
+    def _read(self, job: Callable[[sqlite3.Connection], Any],
+              read_from: str = "primary") -> Any:
+        """Run a read job on this thread's reader, or on the writer while
+        a transaction is open so uncommitted changes are visible."""
+        if read_from == "replica":
+            if self._replica is None:
+                raise ValueError("read_from='replica' needs a replica_path")
+            return job(self._replica.connection())
+        if read_from != "primary":
+            raise ValueError(f"Unknown read_from '{read_from}'")
+        if self._in_transaction():
+            return self._submit_write(job)
+        return job(self._reader())
+
+    def _check_external(self, conn: sqlite3.Connection) -> None:
+        """Invalidate the whole cache if a connection other than this
+        manager's writer committed since the calling thread last checked.
+
+        PRAGMA data_version of the thread's reader changes on any other
+        connection's commit, including our writer's. Only when the writer
+        has also committed in the meantime is the writer asked: its own
+        data_version ignores its own commits.
+        """
+        commits = self._commits
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        seen = getattr(self._local, "data_version", None)
+        if seen is None or (version != seen and commits != self._local.commits):
+            writer_version = self._submit_write(
+                lambda conn: conn.execute("PRAGMA data_version").fetchone()[0]
+            )
+            with self._lock:
+                changed = writer_version != self._writer_data_version
+                self._writer_data_version = writer_version
+            if changed:
+                self._cache.bump([ANY_TABLE])
+        elif version != seen:
+            self._cache.bump([ANY_TABLE])
+        self._local.data_version = version
+        self._local.commits = commits
+
+    def _schema_tables(self, conn: sqlite3.Connection) -> Dict[str, Set[str]]:
+        """Get the table/view map used by read_tables, reloading it after
+        DDL (any ANY_TABLE bump)."""
+        version = self._cache.versions(())[ANY_TABLE]
+        schema = self._schema
+        if schema is None or schema[0] != version:
+            schema = (version, schema_tables(conn))
+            self._schema = schema
+        return schema[1]
+
+    def _cached_read(self, kind: str, sql: str, params: Tuple[Any, ...],
+                     job: Callable[[sqlite3.Connection], Any],
+                     read_from: str = "primary") -> Any:
+        """Serve a read from the result cache, filling it on a miss."""
+        if self._cache is None or self._in_transaction() or read_from != "primary":
+            return self._read(job, read_from)
+        conn = self._reader()
+        self._check_external(conn)
+        tables = read_tables(sql, self._schema_tables(conn))
+        if not tables:
+            return job(conn)
+
+        key = (kind, sql, params)
+        result = self._cache.get(key)
+        if result is None:
+            # Snapshot versions before running so a concurrent write
+            # makes the new entry stale rather than silently wrong.
+            versions = self._cache.versions(tables)
+            result = job(conn)
+            self._cache.put(key, result, versions)
+        return result.copy() if isinstance(result, pd.DataFrame) else list(result)
+
+    def clear_cache(self) -> None:
+        """Drop all cached query results."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    @contextmanager
+    def transaction(self) -> Iterator["DatabaseManager"]:
+        """Group writes into one transaction.
+
+        Commits when the block exits normally and rolls back if it raises.
+        Nested scopes join the outermost transaction.
+        """
+        with self._txn_lock:
+            depth = getattr(self._local, "txn_depth", 0)
+            if depth == 0:
+                self._submit_write(lambda conn: conn.execute("BEGIN IMMEDIATE"))
+                self._local.txn_tables = set()
+            self._local.txn_depth = depth + 1
+            try:
+                yield self
+            except BaseException:
+                self._local.txn_depth = depth
+                if depth == 0:
+                    self._submit_write(lambda conn: conn.rollback())
+                raise
+            self._local.txn_depth = depth
+            if depth == 0:
+                tables = self._local.txn_tables
+
+                def commit(conn: sqlite3.Connection) -> None:
+                    conn.commit()
+                    self._commits += 1
+                    if self._cache is not None:
+                        self._cache.bump(self._affected_tables(conn, tables))
+
+                self._submit_write(commit)
+
+    def _explain(self, sql: str, params: Tuple[Any, ...]) -> Optional[List[str]]:
+        """Capture EXPLAIN QUERY PLAN output for a statement."""
+        try:
+            rows = self._reader().execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+            return [row["detail"] for row in rows]
+        except sqlite3.Error as e:
+            return [f"EXPLAIN failed: {e}"]
+
+    def _record(self, kind: str, sql: str, params: Tuple[Any, ...],
+                started: float, rows: int) -> None:
+        """Record timing and row count for a finished statement."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        plan = None
+        if self._explain_slow and self._stats.is_slow(elapsed_ms):
+            plan = self._explain(sql, params)
+        self._stats.record(kind, sql, params, elapsed_ms, rows, plan)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get query statistics: per-statement latency histograms and row
+        counts keyed by normalized SQL (hottest first), the slow-query log
+        and, when enabled, result cache and replica refresh metrics."""
+        stats = self._stats.snapshot()
+        if self._cache is not None:
+            stats["cache"] = self._cache.stats()
+        if self._replica is not None:
+            stats["replica"] = self._replica.stats()
+        return stats
+
+    def refresh_replica(self) -> None:
+        """Take a fresh replica snapshot now."""
+        if self._replica is None:
+            raise ValueError("No replica configured (pass replica_path)")
+        self._replica.refresh()
+
+    def start_replica_refresh(self, interval: float) -> None:
+        """Refresh the replica in the background every interval seconds."""
+        if self._replica is None:
+            raise ValueError("No replica configured (pass replica_path)")
+        self._replica.start(interval)
+
+    def reset_stats(self) -> None:
+        """Clear collected query statistics."""
+        self._stats.reset()
+
+    def connect(self) -> None:
+        """Establish database connection."""
+        with self._lock:
+            if self._writer is None:
+                ready: Future = Future()
+                writer = threading.Thread(
+                    target=self._writer_loop,
+                    args=(ready,),
+                    name=f"sqlite-writer:{self._db_path}",
+                    daemon=True,
+                )
+                writer.start()
+                try:
+                    ready.result()
+                except Exception as e:
+                    print(f"Database connection error: {e}")
+                    raise
+                self._writer = writer
+        self._reader()
 
     def close(self) -> None:
         """Close database connection."""
-        if self._connection is not None:
-            self._connection.close()
-            self._connection = None
+        with self._lock:
+            writer, self._writer = self._writer, None
+            readers, self._readers = self._readers, {}
+        if writer is not None:
+            self._write_queue.put(self._STOP)
+            writer.join()
+        for _, conn in readers.values():
+            conn.close()
+        if self._replica is not None:
+            self._replica.stop()
+        self._local = threading.local()
 
     def execute_query(self, sql: str, params: Iterable[Any] = ()) -> sqlite3.Cursor:
         """Execute a write query (INSERT, UPDATE, DELETE)."""
-        if self._connection is None:
-            self.connect()
+        params = tuple(params)
+
+        def job(conn: sqlite3.Connection) -> sqlite3.Cursor:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            return cur
+
         try:
-            cur = self._connection.cursor()
-            cur.execute(sql, tuple(params))
-            self._connection.commit()
+            started = time.perf_counter()
+            cur = self._write(job, sql)
+            self._record("execute", sql, params, started, cur.rowcount)
             return cur
         except Exception as e:
             print(f"Execute query error: {e}")
@@ -44,45 +446,204 @@ class DatabaseManager:
             print(f"Params: {params}")
             raise
 
-    def fetch_one(self, sql: str, params: Iterable[Any] = ()) -> Optional[sqlite3.Row]:
-        """Fetch a single row."""
-        if self._connection is None:
-            self.connect()
+    def execute_many(self, sql: str, rows: Iterable[Iterable[Any]]) -> int:
+        """Execute a write query once per parameter tuple in a single
+        transaction. rows may be any iterable, including a generator; it is
+        consumed lazily. Returns the number of rows affected."""
+        def job(conn: sqlite3.Connection) -> int:
+            return conn.executemany(sql, (tuple(row) for row in rows)).rowcount
+
+        try:
+            started = time.perf_counter()
+            with self.transaction():
+                affected = self._write(job, sql)
+            self._record("execute_many", sql, (), started, affected)
+            return affected
+        except Exception as e:
+            print(f"Execute many error: {e}")
+            print(f"SQL: {sql}")
+            raise
+
+    def fetch_one(self, sql: str, params: Iterable[Any] = (),
+                  read_from: str = "primary") -> Optional[sqlite3.Row]:
+        """Fetch a single row. read_from="replica" reads the snapshot."""
+        params = tuple(params)
         try:
-            cur = self._connection.cursor()
-            cur.execute(sql, tuple(params))
-            return cur.fetchone()
+            started = time.perf_counter()
+            row = self._read(lambda conn: conn.execute(sql, params).fetchone(),
+                             read_from)
+            self._record("fetch_one", sql, params, started, 0 if row is None else 1)
+            return row
         except Exception as e:
             print(f"Fetch one error: {e}")
             print(f"SQL: {sql}")
             print(f"Params: {params}")
             raise
 
-    def fetch_all(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
-        """Fetch all rows."""
-        if self._connection is None:
-            self.connect()
+    def fetch_all(self, sql: str, params: Iterable[Any] = (),
+                  read_from: str = "primary") -> List[sqlite3.Row]:
+        """Fetch all rows. read_from="replica" reads the snapshot."""
+        params = tuple(params)
         try:
-            cur = self._connection.cursor()
-            cur.execute(sql, tuple(params))
-            return cur.fetchall()
+            started = time.perf_counter()
+            rows = self._cached_read(
+                "fetch_all", sql, params,
+                lambda conn: conn.execute(sql, params).fetchall(),
+                read_from
+            )
+            self._record("fetch_all", sql, params, started, len(rows))
+            return rows
         except Exception as e:
             print(f"Fetch all error: {e}")
             print(f"SQL: {sql}")
             print(f"Params: {params}")
             raise
 
-    def fetch_df(self, sql: str, params: Iterable[Any] = ()) -> pd.DataFrame:
-        """Fetch results as a pandas DataFrame."""
-        if self._connection is None:
-            self.connect()
+    def fetch_df(self, sql: str, params: Iterable[Any] = (),
+                 read_from: str = "primary") -> pd.DataFrame:
+        """Fetch results as a pandas DataFrame. read_from="replica" reads
+        the snapshot."""
+        params = tuple(params)
         try:
-            return pd.read_sql_query(sql, self._connection, params=list(params))
+            started = time.perf_counter()
+            df = self._cached_read(
+                "fetch_df", sql, params,
+                lambda conn: pd.read_sql_query(sql, conn, params=list(params)),
+                read_from
+            )
+            self._record("fetch_df", sql, params, started, len(df))
+            return df
         except Exception as e:
             print(f"Fetch dataframe error: {e}")
             print(f"SQL: {sql}")
             raise
 
+    @staticmethod
+    def _read_columns(conn: sqlite3.Connection, sql: str, params: Tuple[Any, ...],
+                      dtypes: Dict[str, Any], chunk_size: int) -> Dict[str, Any]:
+        """Read a result set column by column into NumPy arrays.
+
+        Rows come off the cursor as plain tuples in chunks of chunk_size and
+        are transposed straight into per-column arrays; "category" columns
+        are stored as int32 codes plus one copy of each distinct value.
+        """
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        names = [col[0] for col in cur.description]
+        specs = [dtypes.get(name) for name in names]
+        chunks: List[List[np.ndarray]] = [[] for _ in names]
+        categories: List[Dict[Any, int]] = [{} for _ in names]
+
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            for i, values in enumerate(zip(*rows)):
+                spec = specs[i]
+                if spec == "category":
+                    codes = categories[i]
+                    chunk = np.fromiter(
+                        (-1 if v is None else codes.setdefault(v, len(codes)) for v in values),
+                        dtype=np.int32, count=len(values),
+                    )
+                elif spec is None:
+                    chunk = np.empty(len(values), dtype=object)
+                    chunk[:] = values
+                else:
+                    chunk = np.array(values, dtype=spec)
+                chunks[i].append(chunk)
+
+        columns: Dict[str, Any] = {}
+        for i, name in enumerate(names):
+            spec = specs[i]
+            if spec == "category":
+                codes = (np.concatenate(chunks[i]) if chunks[i]
+                         else np.empty(0, dtype=np.int32))
+                columns[name] = pd.Categorical.from_codes(codes, list(categories[i]))
+            elif chunks[i]:
+                columns[name] = np.concatenate(chunks[i])
+            else:
+                columns[name] = np.empty(0, dtype=object if spec is None else spec)
+        return columns
+
+    def fetch_columns(self, sql: str, params: Iterable[Any] = (),
+                      dtypes: Optional[Dict[str, Any]] = None,
+                      chunk_size: int = 10000, as_frame: bool = True,
+                      read_from: str = "primary") -> Any:
+        """Fetch results column by column, without building a Python
+        object per row.
+
+        dtypes maps column names to a NumPy dtype (e.g. "int64",
+        "float64") or "category" for low-cardinality text such as
+        severity or status. Other columns are inferred when building a
+        DataFrame and left as object arrays otherwise. Returns a DataFrame,
+        or a dict of arrays (pd.Categorical for category columns) when
+        as_frame is False. read_from="replica" reads the snapshot.
+        """
+        params = tuple(params)
+        dtypes = dtypes or {}
+
+        def job(conn: sqlite3.Connection) -> Any:
+            columns = self._read_columns(conn, sql, params, dtypes, chunk_size)
+            if not as_frame:
+                return columns
+            df = pd.DataFrame(columns, copy=False)
+            inferred = [name for name in df.columns if name not in dtypes]
+            if inferred:
+                df[inferred] = df[inferred].infer_objects()
+            return df
+
+        try:
+            started = time.perf_counter()
+            if as_frame:
+                kind = f"fetch_columns:{sorted(dtypes.items())!r}"
+                result = self._cached_read(kind, sql, params, job, read_from)
+                rows = len(result)
+            else:
+                result = self._read(job, read_from)
+                rows = len(next(iter(result.values()), ()))
+            self._record("fetch_columns", sql, params, started, rows)
+            return result
+        except Exception as e:
+            print(f"Fetch columns error: {e}")
+            print(f"SQL: {sql}")
+            print(f"Params: {params}")
+            raise
+
+    def fetch_page(self, sql: str, params: Iterable[Any] = (),
+                   after: Optional[Union[str, int]] = None, limit: int = 50,
+                   key: str = "id", dtypes: Optional[Dict[str, Any]] = None,
+                   read_from: str = "primary") -> Tuple[pd.DataFrame, Optional[str]]:
+        """Fetch one page of sql, ordered by key descending, with keyset
+        pagination.
+
+        sql is a SELECT without ORDER BY/LIMIT whose result includes the
+        integer key column (e.g. the table id or its alias). Each page
+        seeks past the last key of the previous one instead of using
+        OFFSET, so every page costs the same however deep it is. Returns
+        (page, cursor token for the next page or None on the last page);
+        pass the token back as after.
+        """
+        params = tuple(params)
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        quoted = '"' + key.replace('"', '""') + '"'
+        page_sql = f"SELECT * FROM ({sql}) AS page"
+        if after is not None:
+            page_sql += f" WHERE {quoted} < ?"
+            params += (decode_cursor(after),)
+        # One extra row tells whether another page follows
+        page_sql += f" ORDER BY {quoted} DESC LIMIT ?"
+        params += (limit + 1,)
+
+        df = self.fetch_columns(page_sql, params, dtypes=dtypes, read_from=read_from)
+        next_cursor = None
+        if len(df) > limit:
+            df = df.iloc[:limit]
+            next_cursor = encode_cursor(df[key].iloc[-1])
+        return df, next_cursor
+
     def __enter__(self):
         """Context manager entry."""
         self.connect()
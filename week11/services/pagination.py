@@ -0,0 +1,25 @@
+"""Cursor tokens for keyset (seek) pagination."""
+
+import base64
+import binascii
+from typing import Union
+
+
+def encode_cursor(last_id: int) -> str:
+    """Opaque, URL-safe token pointing after row id last_id."""
+    return base64.urlsafe_b64encode(f"id:{int(last_id)}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: Union[str, int]) -> int:
+    """Row id stored in a cursor token. Plain ints pass through; malformed
+    tokens raise ValueError."""
+    if isinstance(token, int):
+        return token
+    try:
+        text = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        prefix, value = text.split(":", 1)
+        if prefix != "id":
+            raise ValueError
+        return int(value)
+    except (ValueError, UnicodeDecodeError, TypeError, binascii.Error):
+        raise ValueError(f"Invalid cursor: {token!r}") from None
@@ -0,0 +1,113 @@
+"""QueryStats helper class for DatabaseManager instrumentation."""
+
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 5, 10, 50, 100, 500, 1000)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and replace literals with '?' so that
+    statements differing only in constants share one stats entry."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _bucket_label(ms: float) -> str:
+    for bound in LATENCY_BUCKETS_MS:
+        if ms <= bound:
+            return f"<={bound}ms"
+    return f">{LATENCY_BUCKETS_MS[-1]}ms"
+
+
+class QueryStats:
+    """Collects per-statement latency, row counts and a slow-query log."""
+
+    def __init__(self, slow_query_ms: float = 100.0, slow_log_size: int = 100):
+        self._slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._queries: Dict[str, Dict[str, Any]] = {}
+        self._slow_log: deque = deque(maxlen=slow_log_size)
+
+    def get_slow_query_ms(self) -> float:
+        """Get the slow-query threshold in milliseconds."""
+        return self._slow_query_ms
+
+    def is_slow(self, elapsed_ms: float) -> bool:
+        """Return True if a statement took longer than the threshold."""
+        return elapsed_ms >= self._slow_query_ms
+
+    def record(self, kind: str, sql: str, params: Tuple[Any, ...],
+               elapsed_ms: float, rows: int, plan: Optional[List[str]] = None) -> None:
+        """Record one executed statement."""
+        key = normalize_sql(sql)
+        rows = max(rows, 0)
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None:
+                entry = {
+                    "kind": kind,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "rows": 0,
+                    "histogram": {},
+                }
+                self._queries[key] = entry
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["rows"] += rows
+            label = _bucket_label(elapsed_ms)
+            entry["histogram"][label] = entry["histogram"].get(label, 0) + 1
+
+            if self.is_slow(elapsed_ms):
+                self._slow_log.append({
+                    "at": time.time(),
+                    "kind": kind,
+                    "sql": key,
+                    # Only the count: values can be usernames or password hashes
+                    "param_count": len(params),
+                    "ms": round(elapsed_ms, 3),
+                    "rows": rows,
+                    "plan": plan,
+                })
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of all statistics, hottest statements first."""
+        with self._lock:
+            queries = []
+            for sql, entry in self._queries.items():
+                queries.append({
+                    "sql": sql,
+                    "kind": entry["kind"],
+                    "count": entry["count"],
+                    "total_ms": round(entry["total_ms"], 3),
+                    "avg_ms": round(entry["total_ms"] / entry["count"], 3),
+                    "max_ms": round(entry["max_ms"], 3),
+                    "rows": entry["rows"],
+                    "histogram": dict(entry["histogram"]),
+                })
+            slow = list(self._slow_log)
+
+        queries.sort(key=lambda q: q["total_ms"], reverse=True)
+        return {
+            "slow_query_ms": self._slow_query_ms,
+            "queries": queries,
+            "slow_queries": slow,
+        }
+
+    def reset(self) -> None:
+        """Clear all collected statistics."""
+        with self._lock:
+            self._queries.clear()
+            self._slow_log.clear()
@@ -0,0 +1,202 @@
+"""ResultCache helper class for DatabaseManager query results."""
+
+import re
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set, Tuple
+import pandas as pd
+
+_WRITE_TARGET = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|"
+    r"UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_IDENTIFIER = re.compile(r"[A-Za-z_]\w*")
+_TRIGGER_WRITES = re.compile(
+    r"\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|"
+    r"UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+
+# Pseudo-table bumped by statements whose target can't be determined
+# (DDL, PRAGMA, ...); every cached entry depends on it.
+ANY_TABLE = "*"
+
+
+def written_table(sql: str) -> str:
+    """Get the table modified by a write statement, or ANY_TABLE."""
+    match = _WRITE_TARGET.match(sql)
+    return match.group(1).lower() if match else ANY_TABLE
+
+
+def read_tables(sql: str, schema: Dict[str, Set[str]]) -> Set[str]:
+    """Get the tables a SELECT statement may read, as a superset: every
+    identifier naming a table or view (see schema_tables) counts, however
+    it is joined. Empty, meaning "don't cache", if the statement names
+    none of them or a view that could not be resolved."""
+    names = {name.lower() for name in _IDENTIFIER.findall(_STRING_LITERAL.sub("", sql))}
+    tables: Set[str] = set()
+    for name in names & schema.keys():
+        tables |= schema[name]
+    return set() if ANY_TABLE in tables else tables
+
+
+def schema_tables(conn: sqlite3.Connection) -> Dict[str, Set[str]]:
+    """Map every table to itself and every view to the tables it reads,
+    following views built on other views."""
+    tables: Dict[str, Set[str]] = {}
+    views: Dict[str, str] = {}
+    for kind, name, sql in conn.execute(
+            "SELECT type, name, sql FROM sqlite_master WHERE type IN ('table', 'view') "
+            "UNION ALL "
+            "SELECT type, name, sql FROM sqlite_temp_master WHERE type IN ('table', 'view')"):
+        if kind == "table":
+            tables[name.lower()] = {name.lower()}
+        else:
+            views[name.lower()] = sql or ""
+
+    # Views may reference views defined after them; repeat until stable
+    pending = dict(views)
+    while pending:
+        resolved = {}
+        for name, sql in pending.items():
+            refs = {ref.lower() for ref in _IDENTIFIER.findall(_STRING_LITERAL.sub("", sql))}
+            refs.discard(name)
+            if refs & (pending.keys() - {name}):
+                continue
+            resolved[name] = read_tables(sql, tables) or {ANY_TABLE}
+        if not resolved:
+            # Circular views: mark them unresolvable
+            resolved = {name: {ANY_TABLE} for name in pending}
+        tables.update(resolved)
+        for name in resolved:
+            del pending[name]
+    return tables
+
+
+def trigger_targets(conn: sqlite3.Connection) -> Dict[str, Set[str]]:
+    """Map each table to every other table its triggers write to,
+    following triggers that fire further triggers."""
+    tables = {row[0].lower() for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    direct: Dict[str, Set[str]] = {}
+    for table, sql in conn.execute(
+            "SELECT tbl_name, sql FROM sqlite_master WHERE type = 'trigger'"):
+        body = re.split(r"\bBEGIN\b", sql, maxsplit=1, flags=re.IGNORECASE)[-1]
+        targets = {name.lower() for name in _TRIGGER_WRITES.findall(body)} & tables
+        direct.setdefault(table.lower(), set()).update(targets)
+
+    closure: Dict[str, Set[str]] = {}
+    for table in direct:
+        seen: Set[str] = set()
+        pending = list(direct[table])
+        while pending:
+            target = pending.pop()
+            if target not in seen:
+                seen.add(target)
+                pending.extend(direct.get(target, ()))
+        seen.discard(table)
+        closure[table] = seen
+    return closure
+
+
+def estimate_size(result: Any) -> int:
+    """Rough size in bytes of a cached result."""
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(index=True, deep=True).sum())
+    size = sys.getsizeof(result)
+    for row in result:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
+
+
+class ResultCache:
+    """Memory-bounded LRU cache of query results.
+
+    Each entry remembers the write counters of the tables it read (and of
+    ANY_TABLE) at the time it was filled; it is only served while they are
+    unchanged.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Dict[str, int], int]]" = OrderedDict()
+        self._bytes = 0
+        self._table_versions: Dict[str, int] = {}
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def bump(self, tables: Iterable[str]) -> None:
+        """Mark tables as written so entries reading them go stale."""
+        with self._lock:
+            for table in tables:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+
+    def versions(self, tables: Iterable[str]) -> Dict[str, int]:
+        """Snapshot the write counters of tables (plus ANY_TABLE)."""
+        with self._lock:
+            return {
+                table: self._table_versions.get(table, 0)
+                for table in set(tables) | {ANY_TABLE}
+            }
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return a still-valid cached result, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            result, versions, size = entry
+            stale = any(
+                self._table_versions.get(table, 0) != version
+                for table, version in versions.items()
+            )
+            if stale:
+                del self._entries[key]
+                self._bytes -= size
+                self._counters["invalidations"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return result
+
+    def put(self, key: Hashable, result: Any, versions: Dict[str, int]) -> None:
+        """Store a result, evicting least recently used entries as needed."""
+        size = estimate_size(result)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (result, versions, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[2]
+                self._counters["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/eviction counters and current memory use."""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
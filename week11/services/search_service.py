@@ -0,0 +1,107 @@
+"""SearchService for full-text search over incidents and tickets."""
+
+from typing import Dict, List, Tuple
+import pandas as pd
+from services.database_manager import DatabaseManager
+
+# FTS5 mirror -> (source table, indexed text columns)
+FTS_TABLES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "incidents_fts": ("cyber_incidents", ("description",)),
+    "tickets_fts": ("it_tickets", ("subject", "description")),
+}
+
+
+def fts_sql(fts_table: str) -> List[str]:
+    """Statements creating an external-content FTS5 mirror, the triggers
+    keeping it in sync, and indexing the rows already present."""
+    source, columns = FTS_TABLES[fts_table]
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    delete_old = (f"INSERT INTO {fts_table} ({fts_table}, rowid, {cols}) "
+                  f"VALUES ('delete', old.id, {old_values});")
+    insert_new = f"INSERT INTO {fts_table} (rowid, {cols}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{cols}, content='{source}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {cols} ON {source} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression requiring every
+    word. Words are quoted; a trailing * keeps prefix matching."""
+    terms = []
+    for word in str(text).split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ("*" if prefix else ""))
+    if not terms:
+        raise ValueError("Search text is empty")
+    return " ".join(terms)
+
+
+class SearchService:
+    """Ranked full-text search (bm25 + highlighted snippets).
+
+    The FTS5 tables are created on first use if the database doesn't have
+    them yet; afterwards triggers keep them in step with every write.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+        self._ready = False
+
+    def ensure_index(self) -> None:
+        """Create any missing FTS5 mirrors and their triggers."""
+        if self._ready:
+            return
+        rows = self._db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+            tuple(FTS_TABLES),
+        )
+        existing = {row["name"] for row in rows}
+        missing = [name for name in FTS_TABLES if name not in existing]
+        if missing:
+            with self._db.transaction():
+                for fts_table in missing:
+                    for sql in fts_sql(fts_table):
+                        self._db.execute_query(sql)
+        self._ready = True
+
+    def search_incidents(self, query: str, limit: int = 20) -> pd.DataFrame:
+        """Incidents whose description matches query, best first."""
+        self.ensure_index()
+        return self._db.fetch_df(
+            """SELECT c.id, c.date, c.incident_type, c.severity, c.status,
+               snippet(incidents_fts, 0, '**', '**', '…', 12) AS snippet,
+               bm25(incidents_fts) AS score
+               FROM incidents_fts
+               JOIN cyber_incidents c ON c.id = incidents_fts.rowid
+               WHERE incidents_fts MATCH ?
+               ORDER BY score
+               LIMIT ?""",
+            (fts_query(query), limit),
+        )
+
+    def search_tickets(self, query: str, limit: int = 20) -> pd.DataFrame:
+        """Tickets whose subject or description matches query, best first."""
+        self.ensure_index()
+        return self._db.fetch_df(
+            """SELECT t.id, t.ticket_id, t.priority, t.status, t.subject,
+               snippet(tickets_fts, -1, '**', '**', '…', 12) AS snippet,
+               bm25(tickets_fts) AS score
+               FROM tickets_fts
+               JOIN it_tickets t ON t.id = tickets_fts.rowid
+               WHERE tickets_fts MATCH ?
+               ORDER BY score
+               LIMIT ?""",
+            (fts_query(query), limit),
+        )
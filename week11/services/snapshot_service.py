@@ -0,0 +1,156 @@
+"""SnapshotService for read-only dashboard replicas."""
+
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+_replica_ids = itertools.count(1)
+
+
+class SnapshotService:
+    """Keeps a periodically refreshed read-only copy of a SQLite database.
+
+    The copy is taken with sqlite3's online backup API, either into a
+    shared in-memory database (replica_path=":memory:") or into a file
+    that is swapped in atomically. Each refresh produces a new generation;
+    reader threads reopen their connection when the generation changes,
+    so a refresh never blocks or disturbs a query already running.
+    """
+
+    def __init__(self, db_path: str, replica_path: str = ":memory:",
+                 max_staleness: float = 30.0):
+        self._db_path = db_path
+        self._replica_path = replica_path
+        self._max_staleness = max_staleness
+        self._id = next(_replica_ids)
+        self._lock = threading.Lock()
+        # Serializes refreshes; held for the whole backup
+        self._refresh_lock = threading.RLock()
+        self._local = threading.local()
+        self._generation = 0
+        self._uri: Optional[str] = None
+        # Keeps the current in-memory generation alive between readers
+        self._holder: Optional[sqlite3.Connection] = None
+        self._refreshed_at = 0.0
+        self._metrics = {"refreshes": 0, "last_refresh_ms": 0.0,
+                         "total_refresh_ms": 0.0, "pages": 0}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _target(self, generation: int):
+        """Open the destination of the next snapshot."""
+        if self._replica_path == ":memory:":
+            uri = f"file:replica_{self._id}_{generation}?mode=memory&cache=shared"
+            return sqlite3.connect(uri, uri=True, check_same_thread=False), uri, None
+        tmp_path = f"{self._replica_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        uri = f"file:{os.path.abspath(self._replica_path)}?mode=ro"
+        return sqlite3.connect(tmp_path), uri, tmp_path
+
+    def refresh(self) -> None:
+        """Take a new snapshot and make it the current generation."""
+        with self._refresh_lock:
+            started = time.perf_counter()
+            generation = self._generation + 1
+            target, uri, tmp_path = self._target(generation)
+            source = sqlite3.connect(self._db_path)
+            try:
+                source.backup(target)
+                pages = target.execute("PRAGMA page_count").fetchone()[0]
+            finally:
+                source.close()
+
+            if tmp_path is not None:
+                # A WAL-mode copy could not be opened with mode=ro
+                target.execute("PRAGMA journal_mode = DELETE")
+                target.close()
+                os.replace(tmp_path, self._replica_path)
+            self._swap(target if tmp_path is None else None, uri, generation,
+                       started, pages)
+
+    def _swap(self, holder: Optional[sqlite3.Connection], uri: str,
+              generation: int, started: float, pages: int) -> None:
+        """Publish a finished snapshot as the current generation."""
+        with self._lock:
+            old_holder, self._holder = self._holder, holder
+            self._uri = uri
+            self._generation = generation
+            self._refreshed_at = time.time()
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._metrics["refreshes"] += 1
+            self._metrics["last_refresh_ms"] = round(elapsed_ms, 3)
+            self._metrics["total_refresh_ms"] += elapsed_ms
+            self._metrics["pages"] = pages
+        if old_holder is not None:
+            old_holder.close()
+
+    def age(self) -> float:
+        """Seconds since the last refresh (inf if never refreshed)."""
+        return time.time() - self._refreshed_at if self._generation else float("inf")
+
+    def connection(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection to a snapshot no older
+        than max_staleness, refreshing first if needed."""
+        if self.age() > self._max_staleness:
+            with self._refresh_lock:
+                if self.age() > self._max_staleness:
+                    self.refresh()
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            if conn is not None:
+                conn.close()
+            with self._lock:
+                uri, generation = self._uri, self._generation
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            self._local.generation = generation
+        return conn
+
+    def start(self, interval: float) -> None:
+        """Refresh in a background thread every interval seconds."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+
+        def loop() -> None:
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except sqlite3.Error as e:
+                    print(f"Replica refresh error: {e}")
+
+        self._thread = threading.Thread(target=loop, name="sqlite-replica", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop background refreshing and release the in-memory copy."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            holder, self._holder = self._holder, None
+        if holder is not None:
+            holder.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get refresh cost and staleness metrics."""
+        with self._lock:
+            refreshes = self._metrics["refreshes"]
+            return {
+                **self._metrics,
+                "total_refresh_ms": round(self._metrics["total_refresh_ms"], 3),
+                "avg_refresh_ms": round(self._metrics["total_refresh_ms"] / refreshes, 3)
+                if refreshes else 0.0,
+                "generation": self._generation,
+                "age_s": round(self.age(), 3) if self._generation else None,
+                "max_staleness_s": self._max_staleness,
+            }
@@ -0,0 +1,132 @@
+"""SummaryService for trigger-maintained incident and ticket counts."""
+
+from typing import Dict, List, Tuple
+import pandas as pd
+from services.database_manager import DatabaseManager
+
+# Summary table -> (source table, source columns the dimensions read,
+#                   {dimension: SQL expression over row {r}})
+SUMMARY_TABLES: Dict[str, Tuple[str, Tuple[str, ...], Dict[str, str]]] = {
+    "incident_summary": ("cyber_incidents", ("incident_type", "severity", "status", "date"), {
+        "incident_type": "{r}.incident_type",
+        "severity": "{r}.severity",
+        "status": "{r}.status",
+        "day": "date({r}.date)",
+    }),
+    "ticket_summary": ("it_tickets", ("priority", "status", "category", "created_date"), {
+        "priority": "{r}.priority",
+        "status": "{r}.status",
+        "category": "{r}.category",
+        "day": "date({r}.created_date)",
+    }),
+}
+
+
+def _value(expression: str, row: str) -> str:
+    return f"COALESCE({expression.format(r=row)}, '')"
+
+
+def summary_sql(summary_table: str) -> List[str]:
+    """Statements creating a summary table and the triggers keeping it
+    in step with its source table."""
+    source, columns, dimensions = SUMMARY_TABLES[summary_table]
+    increment = " ".join(
+        f"INSERT INTO {summary_table} (dimension, value, count) "
+        f"VALUES ('{dim}', {_value(expr, 'new')}, 1) "
+        f"ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;"
+        for dim, expr in dimensions.items()
+    )
+    decrement = " ".join(
+        f"UPDATE {summary_table} SET count = count - 1 "
+        f"WHERE dimension = '{dim}' AND value = {_value(expr, 'old')}; "
+        f"DELETE FROM {summary_table} "
+        f"WHERE dimension = '{dim}' AND value = {_value(expr, 'old')} AND count <= 0;"
+        for dim, expr in dimensions.items()
+    )
+    return [
+        f"""CREATE TABLE IF NOT EXISTS {summary_table} (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID""",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {decrement} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_au AFTER UPDATE OF {', '.join(columns)} "
+        f"ON {source} BEGIN {decrement} {increment} END",
+    ]
+
+
+def rebuild_sql(summary_table: str) -> List[str]:
+    """Statements recomputing a summary table from its source table."""
+    source, _, dimensions = SUMMARY_TABLES[summary_table]
+    return [f"DELETE FROM {summary_table}"] + [
+        f"INSERT INTO {summary_table} (dimension, value, count) "
+        f"SELECT '{dim}', {_value(expr, source)}, COUNT(*) FROM {source} GROUP BY 2"
+        for dim, expr in dimensions.items()
+    ]
+
+
+class SummaryService:
+    """Dashboard statistics read from summary tables.
+
+    Counts per group are maintained by triggers on every write, so a
+    statistics read touches one row per group instead of every incident
+    or ticket. The tables are created (and filled) on first use.
+    """
+
+    def __init__(self, db: DatabaseManager):
+        self._db = db
+        self._ready = False
+
+    def ensure_tables(self) -> None:
+        """Create and fill any missing summary tables and their triggers."""
+        if self._ready:
+            return
+        rows = self._db.fetch_all(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?, ?)",
+            tuple(SUMMARY_TABLES),
+        )
+        existing = {row["name"] for row in rows}
+        missing = [name for name in SUMMARY_TABLES if name not in existing]
+        if missing:
+            with self._db.transaction():
+                for summary_table in missing:
+                    for sql in summary_sql(summary_table) + rebuild_sql(summary_table):
+                        self._db.execute_query(sql)
+        self._ready = True
+
+    def rebuild(self) -> None:
+        """Recompute every summary table from scratch (recovery)."""
+        self.ensure_tables()
+        with self._db.transaction():
+            for summary_table in SUMMARY_TABLES:
+                for sql in rebuild_sql(summary_table):
+                    self._db.execute_query(sql)
+
+    def get_counts(self, summary_table: str, dimension: str, label: str) -> pd.DataFrame:
+        """Counts for one dimension as a [label, "count"] DataFrame, largest first."""
+        self.ensure_tables()
+        return self._db.fetch_df(
+            f"""SELECT value AS "{label}", count FROM {summary_table}
+                WHERE dimension = ? ORDER BY count DESC""",
+            (dimension,),
+        )
+
+    def incident_statistics(self) -> Dict[str, pd.DataFrame]:
+        """Incident counts by type, severity and status."""
+        return {
+            "by_type": self.get_counts("incident_summary", "incident_type", "incident_type"),
+            "by_severity": self.get_counts("incident_summary", "severity", "severity"),
+            "by_status": self.get_counts("incident_summary", "status", "status"),
+        }
+
+    def ticket_statistics(self) -> Dict[str, pd.DataFrame]:
+        """Ticket counts by priority, status and category."""
+        return {
+            "by_priority": self.get_counts("ticket_summary", "priority", "priority"),
+            "by_status": self.get_counts("ticket_summary", "status", "status"),
+            "by_category": self.get_counts("ticket_summary", "category", "category"),
+        }
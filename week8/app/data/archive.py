@@ -0,0 +1,230 @@
+"""
+Archive module.
+Moves old, finished incidents and tickets out of the hot tables into a
+separate archive database file, attached to the connection as 'archive'.
+
+The hot tables stay small, so scans, indexes and backups of the main
+database only cover live work. History stays queryable through the TEMP
+views incidents_all and tickets_all (hot UNION ALL archive), which the
+query helpers use when called with include_archive=True.
+
+Rows are moved in windows of batch_size ids, so the archival job never
+holds the write lock for long. SQLite does not commit a transaction that
+spans two database files atomically in WAL mode, so each window is moved
+in two steps: the rows are copied and committed to the archive, then only
+rows now present (and identical) in the archive are deleted from the hot
+table. A crash in between leaves rows in both files, and the next run
+finishes the move.
+
+Archive tables keep the original ids. An archived id is never overwritten:
+if the hot table has reused it for a different row, that row stays hot
+and is reported. Summary counts and full-text search cover hot rows only.
+
+Pooled connections are detached from the archive when they are closed.
+
+Run the job from week8/:
+    python -m app.data.archive --older-than 365 --batch-size 5000
+"""
+import os
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.data.db import connect_database
+from app.data.schema import epoch_day
+
+# Archive database path
+ARCHIVE_PATH = Path(os.getenv("ARCHIVE_DB_PATH", str(Path("DATA") / "intelligence_archive.db")))
+
+# Rows older than this many days are archived by default
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "365"))
+
+# Hot table -> (union view, condition selecting archivable rows older than ?)
+ARCHIVE_TABLES = {
+    'cyber_incidents': (
+        'incidents_all',
+        "status IN ('Resolved', 'Closed') AND date_day < ?",
+    ),
+    'it_tickets': (
+        'tickets_all',
+        "status IN ('Resolved', 'Closed') AND created_day < ?",
+    ),
+}
+
+
+def _stored_columns(conn, table):
+    """Get (name, type) of the stored (non-generated) columns of a hot table."""
+    return [(row[1], row[2]) for row in conn.execute(f"PRAGMA main.table_info({table})")]
+
+
+def attach_archive(conn, archive_path=None):
+    """
+    Attach the archive database and create its tables and the union views.
+
+    Safe to call repeatedly on the same connection; if a different archive
+    file is attached, it is detached first.
+
+    Args:
+        conn: Database connection object
+        archive_path: Archive database file (default: ARCHIVE_PATH)
+    """
+    archive_path = Path(archive_path or ARCHIVE_PATH)
+    attached = {row[1]: row[2] for row in conn.execute("PRAGMA database_list")}
+    if 'archive' in attached:
+        if Path(attached['archive']).resolve() == archive_path.resolve():
+            return
+        detach_archive(conn)
+    if conn.in_transaction:
+        conn.commit()
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    conn.execute("ATTACH DATABASE ? AS archive", (str(archive_path),))
+
+    for table, (view, _) in ARCHIVE_TABLES.items():
+        columns = _stored_columns(conn, table)
+        column_defs = ", ".join(
+            f"{name} INTEGER PRIMARY KEY" if name == 'id' else f"{name} {col_type}"
+            for name, col_type in columns
+        )
+        names = ", ".join(name for name, _ in columns)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS archive.{table} ({column_defs})")
+        # Columns added to the hot table by later migrations
+        archived = {row[1] for row in conn.execute(f"PRAGMA archive.table_info({table})")}
+        for name, col_type in columns:
+            if name not in archived:
+                conn.execute(f"ALTER TABLE archive.{table} ADD COLUMN {name} {col_type}")
+        # Views over an attached database must live in the temp schema
+        conn.execute(f"""
+            CREATE TEMP VIEW IF NOT EXISTS {view} AS
+            SELECT {names} FROM main.{table}
+            UNION ALL
+            SELECT {names} FROM archive.{table}
+        """)
+    conn.commit()
+
+
+def detach_archive(conn):
+    """
+    Drop the union views and detach the archive database, if attached.
+
+    Args:
+        conn: Database connection object
+    """
+    attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+    if 'archive' not in attached:
+        return
+    if conn.in_transaction:
+        conn.commit()
+    for view, _ in ARCHIVE_TABLES.values():
+        conn.execute(f"DROP VIEW IF EXISTS temp.{view}")
+    conn.execute("DETACH DATABASE archive")
+
+
+def archive_table(conn, table, cutoff_day, batch_size=5000):
+    """
+    Move archivable rows of one table older than cutoff_day, in batches.
+
+    Args:
+        conn: Connection with the archive attached
+        table: Key of ARCHIVE_TABLES
+        cutoff_day: Epoch day; rows strictly older are moved
+        batch_size: Rows examined per committed batch
+
+    Returns:
+        int: Number of rows moved
+    """
+    _, condition = ARCHIVE_TABLES[table]
+    columns = [name for name, _ in _stored_columns(conn, table)]
+    names = ", ".join(columns)
+    same_row = " AND ".join(f"a.{name} IS {table}.{name}" for name in columns)
+    window = f"{table}.id > ? AND {table}.id <= ? AND {condition}"
+    moved = 0
+    conflicts = 0
+    last_id = 0
+
+    # Walk the table in primary-key windows of batch_size rows and move the
+    # matching rows of each window, so one run reads the hot table once.
+    while True:
+        batch_end = conn.execute(
+            f"SELECT MAX(id) FROM (SELECT id FROM main.{table} "
+            f"WHERE id > ? ORDER BY id LIMIT ?)",
+            (last_id, batch_size)
+        ).fetchone()[0]
+        if batch_end is None:
+            break
+        params = (last_id, batch_end, cutoff_day)
+
+        try:
+            # Step 1, archive file only: copy rows whose id is not archived
+            # yet (rows copied by an interrupted run are already there)
+            conn.execute(
+                f"INSERT INTO archive.{table} ({names}) "
+                f"SELECT {names} FROM main.{table} WHERE {window} "
+                f"AND NOT EXISTS (SELECT 1 FROM archive.{table} AS a WHERE a.id = {table}.id)",
+                params
+            )
+            conn.commit()
+
+            # Step 2, main file only: delete rows the archive now holds
+            cursor = conn.execute(
+                f"DELETE FROM main.{table} WHERE {window} "
+                f"AND EXISTS (SELECT 1 FROM archive.{table} AS a WHERE {same_row})",
+                params
+            )
+            moved += cursor.rowcount
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+        # Left behind: the id is archived with different contents
+        conflicts += conn.execute(
+            f"SELECT COUNT(*) FROM main.{table} WHERE {window}",
+            params
+        ).fetchone()[0]
+        last_id = batch_end
+
+    if conflicts:
+        print(f"⚠️  {conflicts:,} {table} rows kept: their id is already used "
+              f"by a different archived row")
+    return moved
+
+
+def archive_old_rows(older_than_days=None, batch_size=5000, today=None, archive_path=None):
+    """
+    Move resolved/closed incidents and tickets older than a given age
+    into the archive database.
+
+    Args:
+        older_than_days: Minimum age in days (default: ARCHIVE_AFTER_DAYS)
+        batch_size: Rows per committed batch
+        today: Reference date (default: today)
+        archive_path: Archive database file (default: ARCHIVE_PATH)
+
+    Returns:
+        dict: Rows moved per table
+    """
+    if older_than_days is None:
+        older_than_days = ARCHIVE_AFTER_DAYS
+    cutoff = (today or date.today()) - timedelta(days=older_than_days)
+    cutoff_day = epoch_day(cutoff)
+
+    conn = connect_database()
+    attach_archive(conn, archive_path)
+    summary = {}
+    for table in ARCHIVE_TABLES:
+        summary[table] = archive_table(conn, table, cutoff_day, batch_size)
+        print(f"✅ Archived {summary[table]:,} {table} rows older than {cutoff}")
+    conn.close()
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Move old finished rows to the archive database")
+    parser.add_argument("--older-than", type=int, default=ARCHIVE_AFTER_DAYS,
+                        help="minimum age in days")
+    parser.add_argument("--batch-size", type=int, default=5000,
+                        help="rows per committed batch")
+    args = parser.parse_args()
+    archive_old_rows(args.older_than, args.batch_size)
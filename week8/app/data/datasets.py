@@ -1,5 +1,10 @@
 import pandas as pd
-from app.data.db import connect_database
+from app.data.db import connect_database, iter_table, page_table, load_csv
+from app.data.schema import epoch_day, insert_hashed
+
+# Columns of the datasets_metadata table
+DATASET_COLUMNS = ('id', 'dataset_name', 'category', 'source', 'last_updated',
+                   'record_count', 'file_size_mb', 'created_at', 'last_updated_day')
 
 
 def insert_dataset(dataset_name, category, source, last_updated, record_count, file_size_mb):
@@ -20,14 +25,16 @@ def insert_dataset(dataset_name, category, source, last_updated, record_count, f
     conn = connect_database()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        INSERT INTO datasets_metadata 
-        (dataset_name, category, source, last_updated, record_count, file_size_mb)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (dataset_name, category, source, last_updated, record_count, file_size_mb))
+    dataset_id = insert_hashed(cursor, 'datasets_metadata', {
+        'dataset_name': dataset_name,
+        'category': category,
+        'source': source,
+        'last_updated': last_updated,
+        'record_count': record_count,
+        'file_size_mb': file_size_mb,
+    })
     
     conn.commit()
-    dataset_id = cursor.lastrowid
     conn.close()
     
     return dataset_id
@@ -49,6 +56,37 @@ def get_all_datasets():
     return df
 
 
+def iter_datasets(chunk_size=10000, where=None, order="id", as_rows=False):
+    """
+    Stream all datasets in chunks with bounded memory.
+    
+    Args:
+        chunk_size: Number of rows per chunk
+        where: Optional dict of {column: value} filters (e.g. {'category': 'Compliance'})
+        order: Column to order by, optionally with ASC/DESC (default: 'id')
+        as_rows: Yield lists of tuples instead of DataFrames
+        
+    Yields:
+        pandas.DataFrame: Next chunk of datasets (or list of tuples)
+    """
+    return iter_table('datasets_metadata', DATASET_COLUMNS, chunk_size, where, order, as_rows)
+
+
+def page_datasets(after_id=None, limit=50, filters=None):
+    """
+    Get one page of datasets, newest first (keyset pagination).
+    
+    Args:
+        after_id: Cursor returned by the previous page (None for the first page)
+        limit: Rows per page
+        filters: Optional dict of {column: value} filters (e.g. {'category': 'Compliance'})
+        
+    Returns:
+        tuple: (pandas.DataFrame page, next cursor or None on the last page)
+    """
+    return page_table('datasets_metadata', DATASET_COLUMNS, after_id, limit, filters)
+
+
 def get_dataset_by_id(dataset_id):
     """
     Get single dataset by ID.
@@ -125,12 +163,16 @@ def delete_dataset(dataset_id):
     return rows_deleted
 
 
-def load_datasets_from_csv(csv_path):
+def load_datasets_from_csv(csv_path, chunk_size=None):
     """
     Load datasets from CSV file.
     
+    The file is streamed in chunks, so memory use does not grow with
+    the file size.
+    
     Args:
         csv_path: Path to CSV file
+        chunk_size: Rows per chunk (default: CSV_CHUNK_SIZE)
         
     Returns:
         int: Number of rows loaded
@@ -141,19 +183,10 @@ def load_datasets_from_csv(csv_path):
         print(f"⚠️  File not found: {csv_path}")
         return 0
     
-    conn = connect_database()
-    df = pd.read_csv(csv_path)
-    
-    rows_loaded = df.to_sql(
-        'datasets_metadata',
-        conn,
-        if_exists='append',
-        index=False
-    )
-    
-    conn.close()
-    print(f"✅ Loaded {len(df)} datasets from {Path(csv_path).name}")
-    return len(df)
+    rows_loaded = load_csv(csv_path, 'datasets_metadata', DATASET_COLUMNS, chunk_size,
+                           label=Path(csv_path).name)
+    print(f"✅ Loaded {rows_loaded} datasets from {Path(csv_path).name}")
+    return rows_loaded
 
 
 def get_datasets_by_category(category):
@@ -174,3 +207,25 @@ def get_datasets_by_category(category):
     )
     conn.close()
     return df
+
+
+def get_datasets_updated_between(start, end):
+    """
+    Get datasets last updated in a date window (inclusive).
+    
+    Args:
+        start: First day (date or 'YYYY-MM-DD')
+        end: Last day (date or 'YYYY-MM-DD')
+        
+    Returns:
+        pandas.DataFrame: Matching datasets, most recently updated first
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM datasets_metadata WHERE last_updated_day BETWEEN ? AND ?
+           ORDER BY last_updated_day DESC""",
+        conn,
+        params=(epoch_day(start), epoch_day(end))
+    )
+    conn.close()
+    return df
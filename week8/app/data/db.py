@@ -1,30 +1,322 @@
 """
 Database connection module.
 Handles SQLite database connections.
+
+Connections are drawn from a small per-database pool instead of being
+opened and closed for every query. Callers keep using the usual
+connect_database() / conn.close() pattern: close() hands the connection
+back to the pool rather than tearing it down.
 """
+import base64
+import os
+import queue
 import sqlite3
+import threading
 from pathlib import Path
 
 # Database path
 DB_PATH = Path("DATA") / "intelligence_platform.db"
 
+# Number of idle connections kept open per database file
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+
+# Named pragma profiles applied to every new connection, in order.
+# journal_mode must come first: it cannot be changed once query_only is on.
+# WAL is stored in the database file itself, so it is only switched on for
+# databases the app creates; existing files keep their journal mode.
+PROFILES = {
+    "oltp": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -16000),        # ~16 MB page cache
+        ("mmap_size", 67108864),       # 64 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 5000),        # ms
+    ],
+    # Initial loads only: no rollback journal, nothing synced. Switching
+    # journal mode needs the database to itself; if another connection is
+    # open SQLite keeps the current mode.
+    "bulk_load": [
+        ("journal_mode", "MEMORY"),
+        ("synchronous", "OFF"),
+        ("cache_size", -262144),       # ~256 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 30000),
+    ],
+    "read_only_analytics": [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("cache_size", -65536),        # ~64 MB page cache
+        ("mmap_size", 268435456),      # 256 MB
+        ("temp_store", "MEMORY"),
+        ("busy_timeout", 10000),
+        ("query_only", "ON"),
+    ],
+}
+
+# Profile used when none is passed explicitly
+DEFAULT_PROFILE = os.getenv("DB_PROFILE", "oltp")
+
+
+def is_new_database(db_path):
+    """
+    Check whether a database file has not been created yet.
+
+    Args:
+        db_path: Path to the database file
+
+    Returns:
+        bool: True if the file is missing or empty
+    """
+    return not os.path.exists(db_path) or os.path.getsize(db_path) == 0
+
+
+def apply_profile(conn, profile=None, new_database=False):
+    """
+    Apply a named pragma profile to a connection.
+
+    Args:
+        conn: Database connection
+        profile: Profile name from PROFILES (default: DB_PROFILE env var)
+        new_database: The connection created the database file; only
+            then is journal_mode=WAL applied
+
+    Returns:
+        str: Name of the profile that was applied
+    """
+    profile = profile or DEFAULT_PROFILE
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{profile}'. "
+            f"Choose one of: {', '.join(PROFILES)}"
+        )
+    for pragma, value in PROFILES[profile]:
+        if pragma == "journal_mode" and value == "WAL" and not new_database:
+            continue
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return profile
+
+
+class PooledConnection(sqlite3.Connection):
+    """
+    sqlite3.Connection that returns itself to its pool on close().
+
+    It is still a real sqlite3.Connection, so pandas (read_sql_query,
+    to_sql) and cursor code work with it unchanged.
+    """
+
+    _pool = None
+    _checked_out = False
+
+    def close(self):
+        """Return the connection to its pool (or close it if unpooled)."""
+        if self._pool is None:
+            super().close()
+        elif self._checked_out:
+            self._pool.release(self)
+
+    def close_for_real(self):
+        """Close the underlying SQLite handle."""
+        self._pool = None
+        super().close()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of SQLite connections for a single database file.
+
+    acquire() hands out a healthy connection (reusing an idle one when
+    possible) and release() takes it back. At most `size` idle
+    connections are kept; extra connections opened under load are closed
+    when they are returned, so a caller that forgets to close never
+    starves the others.
+    """
+
+    def __init__(self, db_path, size=POOL_SIZE, profile=None):
+        """
+        Create a pool for one database file.
+
+        Args:
+            db_path: Path to the database file
+            size: Maximum number of idle connections to keep open
+            profile: Pragma profile applied to each new connection
+        """
+        self.db_path = str(db_path)
+        self.size = max(int(size), 1)
+        self.profile = profile or DEFAULT_PROFILE
+        if self.profile not in PROFILES:
+            raise ValueError(f"Unknown database profile '{self.profile}'")
+        self._idle = queue.LifoQueue(maxsize=self.size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.stats = {'created': 0, 'reused': 0, 'discarded': 0}
+
+        # Ensure DATA directory exists (once per pool, not per query)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
 
-def connect_database(db_path=DB_PATH):
+    def _new_connection(self):
+        new_database = is_new_database(self.db_path)
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False
+        )
+        apply_profile(conn, self.profile, new_database)
+        conn._pool = self
+        self._count('created')
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn):
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _discard(self, conn):
+        self._count('discarded')
+        try:
+            conn.close_for_real()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self):
+        """
+        Check a connection out of the pool.
+
+        Returns:
+            PooledConnection: Connection owned by the caller until close()
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("Connection pool has been closed")
+
+        conn = None
+        while conn is None:
+            try:
+                candidate = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._new_connection()
+                break
+            if self._is_healthy(candidate):
+                conn = candidate
+                self._count('reused')
+            else:
+                self._discard(candidate)
+
+        conn._checked_out = True
+        return conn
+
+    def release(self, conn):
+        """
+        Return a checked-out connection to the pool.
+
+        Any transaction left open by the caller is rolled back, and
+        attached databases (with the TEMP views over them) are detached, so
+        the next borrower starts from a clean state.
+
+        Args:
+            conn: Connection previously returned by acquire()
+        """
+        conn._checked_out = False
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+            attached = [row[1] for row in conn.execute("PRAGMA database_list")
+                        if row[1] not in ('main', 'temp')]
+            if attached:
+                views = conn.execute(
+                    "SELECT name FROM temp.sqlite_master WHERE type = 'view'"
+                ).fetchall()
+                for (view,) in views:
+                    conn.execute(f'DROP VIEW temp."{view}"')
+                for name in attached:
+                    conn.execute(f'DETACH DATABASE "{name}"')
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+
+        if self._closed:
+            self._discard(conn)
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            self._discard(conn)
+
+    def close(self):
+        """Close every idle connection and stop handing out new ones."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close_for_real()
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path=DB_PATH, size=None, profile=None):
+    """
+    Get (or create) the connection pool for a database file.
+
+    Each (file, profile) pair gets its own pool so that, for example,
+    read-only analytics connections are never handed to writers.
+
+    Args:
+        db_path: Path to the database file
+        size: Idle pool size; only used when the pool is first created
+        profile: Pragma profile name (default: DB_PROFILE env var)
+
+    Returns:
+        ConnectionPool: Pool shared by all callers of this database
+    """
+    profile = profile or DEFAULT_PROFILE
+    key = (os.path.abspath(db_path), profile)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(key[0], size or POOL_SIZE, profile)
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools():
+    """Close every pool (e.g. before deleting the database file)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close()
+        _pools.clear()
+
+
+def connect_database(db_path=DB_PATH, profile=None):
     """
     Connect to the SQLite database.
     Creates the database file if it doesn't exist.
 
+    The connection comes from the shared pool; call close() on it (or
+    close_database) to hand it back.
+
     Args:
         db_path: Path to the database file
+        profile: Pragma profile name: "oltp", "bulk_load" or
+            "read_only_analytics" (default: DB_PROFILE env var, else "oltp")
 
     Returns:
         sqlite3.Connection: Database connection object
     """
-    # Ensure DATA directory exists
-    db_path = Path(db_path)
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-
-    return sqlite3.connect(str(db_path))
+    return get_pool(db_path, profile=profile).acquire()
 
 
 def close_database(conn):
@@ -36,3 +328,305 @@ def close_database(conn):
     """
     if conn:
         conn.close()
+
+
+def iter_table(table, columns, chunk_size=10000, where=None, order="id",
+               as_rows=False):
+    """
+    Stream a table in chunks instead of loading it all at once.
+
+    Rows are stepped off a single cursor with fetchmany, so memory stays
+    bounded by chunk_size no matter how large the table is.
+
+    Args:
+        table: Table name
+        columns: Allowed column names for this table (used for validation)
+        chunk_size: Rows per chunk
+        where: Optional dict of {column: value} equality filters
+        order: Column to order by, optionally followed by ASC/DESC
+        as_rows: Yield lists of tuples instead of DataFrames
+
+    Yields:
+        pandas.DataFrame or list: One chunk of rows
+    """
+    import pandas as pd
+
+    where = where or {}
+    for column in where:
+        if column not in columns:
+            raise ValueError(f"Unknown column for {table}: {column}")
+
+    order_parts = order.split()
+    if (not order_parts or order_parts[0] not in columns or len(order_parts) > 2
+            or (len(order_parts) == 2 and order_parts[1].upper() not in ("ASC", "DESC"))):
+        raise ValueError(f"Invalid order for {table}: {order}")
+
+    sql = f"SELECT * FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(f"{column} = ?" for column in where)
+    sql += f" ORDER BY {' '.join(order_parts)}"
+    params = tuple(where.values())
+
+    conn = connect_database()
+    try:
+        cursor = conn.cursor()
+        cursor.arraysize = chunk_size
+        cursor.execute(sql, params)
+        names = [col[0] for col in cursor.description]
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            yield rows if as_rows else pd.DataFrame.from_records(rows, columns=names)
+    finally:
+        conn.close()
+
+
+def encode_cursor(last_id):
+    """
+    Build the opaque cursor token pointing after a row id.
+
+    Args:
+        last_id: id of the last row on the current page
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    return base64.urlsafe_b64encode(f"id:{int(last_id)}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """
+    Read the row id from a cursor token (plain ints are accepted as-is).
+
+    Args:
+        token: Cursor token from encode_cursor, or a row id
+
+    Returns:
+        int: Row id, or raises ValueError for malformed tokens
+    """
+    if isinstance(token, int):
+        return token
+    try:
+        text = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        prefix, value = text.split(":", 1)
+        if prefix != "id":
+            raise ValueError
+        return int(value)
+    except (ValueError, UnicodeDecodeError, TypeError):
+        raise ValueError(f"Invalid cursor: {token!r}") from None
+
+
+def page_table(table, columns, after_id=None, limit=50, filters=None):
+    """
+    Fetch one page of a table, newest first, with keyset pagination.
+
+    Instead of OFFSET (which reads and discards every earlier row), each
+    page seeks on the primary key past the last id of the previous page,
+    so page 1000 costs the same as page 1.
+
+    Args:
+        table: Table name
+        columns: Allowed column names for this table (used for validation)
+        after_id: Cursor token (or id) returned by the previous page; None
+            for the first page
+        limit: Rows per page
+        filters: Optional dict of {column: value} equality filters
+
+    Returns:
+        tuple: (pandas.DataFrame page, cursor token for the next page or
+        None if this is the last page)
+    """
+    import pandas as pd
+
+    filters = filters or {}
+    for column in filters:
+        if column not in columns:
+            raise ValueError(f"Unknown column for {table}: {column}")
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    conditions = [f"{column} = ?" for column in filters]
+    params = list(filters.values())
+    if after_id is not None:
+        conditions.append("id < ?")
+        params.append(decode_cursor(after_id))
+
+    sql = f"SELECT * FROM {table}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    # One extra row tells whether another page follows
+    sql += " ORDER BY id DESC LIMIT ?"
+    params.append(limit + 1)
+
+    conn = connect_database()
+    df = pd.read_sql_query(sql, conn, params=params)
+    conn.close()
+
+    next_cursor = None
+    if len(df) > limit:
+        df = df.iloc[:limit]
+        next_cursor = encode_cursor(df["id"].iloc[-1])
+    return df, next_cursor
+
+
+# Rows read from a CSV per chunk, and chunks written per transaction
+CSV_CHUNK_SIZE = int(os.getenv("CSV_CHUNK_SIZE", "50000"))
+CSV_CHUNKS_PER_COMMIT = int(os.getenv("CSV_CHUNKS_PER_COMMIT", "4"))
+
+
+def read_csv_batches(csv_path, table, columns, chunk_size=None, offset=0, stats=None):
+    """
+    Parse a CSV file into INSERT batches, one chunk at a time.
+
+    Batches are plain (sql, rows) pairs, so they can be written here or
+    sent to another process. Columns are parsed with the table's typed
+    schema (see app.data.validation); rows that fail validation go to the
+    file's quarantine CSV instead of the batch.
+
+    Args:
+        csv_path: Path to CSV file (header row names the columns)
+        table: Table name
+        columns: Allowed column names for this table (used for validation)
+        chunk_size: Rows per chunk (default: CSV_CHUNK_SIZE)
+        offset: Byte offset of the first row to read (0 = whole file)
+        stats: Optional dict, filled with 'quarantined' (rows rejected)
+            and 'quarantine_file' (where they were written, or None)
+
+    Yields:
+        tuple: (INSERT statement, list of row tuples)
+    """
+    import csv
+    import pandas as pd
+    from app.data.schema import HASHED_COLUMNS, insert_sql, row_hashes
+    from app.data.validation import read_dtypes, validate_chunk, quarantine
+
+    stats = stats if stats is not None else {}
+    stats.update(quarantined=0, quarantine_file=None)
+
+    with open(csv_path, 'rb') as f:
+        header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+        unknown = [c for c in header if c not in columns]
+        if unknown:
+            raise ValueError(f"Unknown column for {table}: {', '.join(unknown)}")
+        hashed = HASHED_COLUMNS.get(table)
+        names = header + ['row_hash'] if hashed else header
+        sql = insert_sql(table, names)
+
+        # Resume after the rows already loaded, reusing the header
+        f.seek(max(offset, f.tell()))
+        if not f.peek(1):
+            return
+        reader = pd.read_csv(f, header=None, names=header, dtype=read_dtypes(table, header),
+                             chunksize=chunk_size or CSV_CHUNK_SIZE)
+        for chunk in reader:
+            chunk, rejected = validate_chunk(table, chunk)
+            if len(rejected):
+                # A full re-read replaces the quarantine file, an incremental one adds to it
+                stats['quarantine_file'] = quarantine(
+                    csv_path, rejected, append=offset > 0 or stats['quarantined'] > 0
+                )
+                stats['quarantined'] += len(rejected)
+
+            if hashed:
+                chunk['row_hash'] = row_hashes(chunk, hashed)
+            # NA -> NULL, numpy/pandas scalars -> plain Python values
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            yield sql, list(chunk.itertuples(index=False, name=None))
+
+
+def write_batches(batches, chunks_per_commit=None, label="rows"):
+    """
+    Insert (sql, rows) batches with executemany, committing in groups.
+
+    Args:
+        batches: Iterable of (INSERT statement, list of row tuples)
+        chunks_per_commit: Batches per transaction (default: CSV_CHUNKS_PER_COMMIT)
+        label: Name used in progress messages
+
+    Returns:
+        int: Number of rows inserted
+    """
+    import time
+
+    chunks_per_commit = max(int(chunks_per_commit or CSV_CHUNKS_PER_COMMIT), 1)
+    conn = connect_database()
+    cursor = conn.cursor()
+    rows_loaded = 0
+    started = time.perf_counter()
+    try:
+        for number, (sql, rows) in enumerate(batches, start=1):
+            if not rows:
+                continue
+            cursor.executemany(sql, rows)
+            rows_loaded += cursor.rowcount
+            if number % chunks_per_commit == 0:
+                conn.commit()
+                elapsed = time.perf_counter() - started
+                print(f"   … {label}: {rows_loaded:,} rows "
+                      f"({rows_loaded / elapsed:,.0f} rows/s)")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    elapsed = time.perf_counter() - started
+    if rows_loaded:
+        print(f"   … {label}: {rows_loaded:,} rows in {elapsed:.2f}s "
+              f"({rows_loaded / elapsed:,.0f} rows/s)")
+    return rows_loaded
+
+
+def load_csv(csv_path, table, columns, chunk_size=None, chunks_per_commit=None,
+             label=None):
+    """
+    Stream a CSV file into a table in fixed-size chunks.
+
+    The file is never held in memory as a whole: each chunk is read,
+    inserted with a single executemany, and dropped. Chunks are committed
+    in groups of chunks_per_commit, so a multi-GB file costs a handful of
+    transactions instead of one per row. If a chunk fails, only the
+    uncommitted group is rolled back.
+
+    Loading is incremental (see app.data.ingest): an unchanged file is
+    skipped, a file that only grew has just its new rows read, and rows
+    already in the table are never inserted twice. Rows that fail
+    validation are quarantined (see app.data.validation) and reported.
+
+    Args:
+        csv_path: Path to CSV file (header row names the columns)
+        table: Table name
+        columns: Allowed column names for this table (used for validation)
+        chunk_size: Rows per chunk (default: CSV_CHUNK_SIZE)
+        chunks_per_commit: Chunks per transaction (default: CSV_CHUNKS_PER_COMMIT)
+        label: Name used in progress messages (default: table name)
+
+    Returns:
+        int: Number of rows inserted or changed
+    """
+    from app.data.ingest import get_ingest_state, save_ingest_state, plan_ingest
+
+    label = label or table
+    conn = connect_database()
+    try:
+        offset, state = plan_ingest(csv_path, get_ingest_state(conn, csv_path))
+    finally:
+        conn.close()
+    if offset is None:
+        print(f"   … {label}: unchanged since last load, skipped")
+        return 0
+
+    stats = {}
+    rows_loaded = write_batches(read_csv_batches(csv_path, table, columns, chunk_size, offset, stats),
+                                chunks_per_commit, label)
+    if stats['quarantined']:
+        print(f"⚠️  {label}: {stats['quarantined']:,} invalid rows quarantined "
+              f"in {stats['quarantine_file']}")
+
+    conn = connect_database()
+    save_ingest_state(conn, csv_path, state)
+    conn.commit()
+    conn.close()
+    return rows_loaded
@@ -1,5 +1,14 @@
 import pandas as pd
-from app.data.db import connect_database
+from app.data.db import connect_database, iter_table, page_table, load_csv
+from app.data.schema import (
+    SEVERITY_RANKS, rank_of, rank_case_sql, epoch_day, fts_query, insert_hashed
+)
+from app.data.summaries import get_summary
+from app.data.archive import attach_archive
+
+# Columns of the cyber_incidents table
+INCIDENT_COLUMNS = ('id', 'date', 'incident_type', 'severity', 'status', 'description',
+                    'reported_by', 'created_at', 'severity_rank', 'date_day')
 
 
 def insert_incident(date, incident_type, severity, status, description, reported_by=None):
@@ -20,48 +29,93 @@ def insert_incident(date, incident_type, severity, status, description, reported
     conn = connect_database()
     cursor = conn.cursor()
     
-    cursor.execute("""
-        INSERT INTO cyber_incidents 
-        (date, incident_type, severity, status, description, reported_by)
-        VALUES (?, ?, ?, ?, ?, ?)
-    """, (date, incident_type, severity, status, description, reported_by))
+    incident_id = insert_hashed(cursor, 'cyber_incidents', {
+        'date': date,
+        'incident_type': incident_type,
+        'severity': severity,
+        'status': status,
+        'description': description,
+        'reported_by': reported_by,
+    })
     
     conn.commit()
-    incident_id = cursor.lastrowid
     conn.close()
     
     return incident_id
 
 
-def get_all_incidents():
+def get_all_incidents(include_archive=False):
     """
     Get all incidents as DataFrame.
     
+    Args:
+        include_archive: Also return archived incidents (stored columns only)
+        
     Returns:
         pandas.DataFrame: All incidents
     """
     conn = connect_database()
+    source = "cyber_incidents"
+    if include_archive:
+        attach_archive(conn)
+        source = "incidents_all"
     df = pd.read_sql_query(
-        "SELECT * FROM cyber_incidents ORDER BY id DESC",
+        f"SELECT * FROM {source} ORDER BY id DESC",
         conn
     )
     conn.close()
     return df
 
 
-def get_incident_by_id(incident_id):
+def iter_incidents(chunk_size=10000, where=None, order="id", as_rows=False):
+    """
+    Stream all incidents in chunks with bounded memory.
+    
+    Args:
+        chunk_size: Number of rows per chunk
+        where: Optional dict of {column: value} filters (e.g. {'status': 'Open'})
+        order: Column to order by, optionally with ASC/DESC (default: 'id')
+        as_rows: Yield lists of tuples instead of DataFrames
+        
+    Yields:
+        pandas.DataFrame: Next chunk of incidents (or list of tuples)
+    """
+    return iter_table('cyber_incidents', INCIDENT_COLUMNS, chunk_size, where, order, as_rows)
+
+
+def page_incidents(after_id=None, limit=50, filters=None):
+    """
+    Get one page of incidents, newest first (keyset pagination).
+    
+    Args:
+        after_id: Cursor returned by the previous page (None for the first page)
+        limit: Rows per page
+        filters: Optional dict of {column: value} filters (e.g. {'status': 'Open'})
+        
+    Returns:
+        tuple: (pandas.DataFrame page, next cursor or None on the last page)
+    """
+    return page_table('cyber_incidents', INCIDENT_COLUMNS, after_id, limit, filters)
+
+
+def get_incident_by_id(incident_id, include_archive=False):
     """
     Get single incident by ID.
     
     Args:
         incident_id: ID of incident to retrieve
+        include_archive: Also look in the archive (stored columns only)
         
     Returns:
         pandas.DataFrame: Single incident or empty DataFrame
     """
     conn = connect_database()
+    source = "cyber_incidents"
+    if include_archive:
+        attach_archive(conn)
+        source = "incidents_all"
     df = pd.read_sql_query(
-        "SELECT * FROM cyber_incidents WHERE id = ?",
+        f"SELECT * FROM {source} WHERE id = ?",
         conn,
         params=(incident_id,)
     )
@@ -118,12 +172,16 @@ def delete_incident(incident_id):
     return rows_deleted
 
 
-def load_incidents_from_csv(csv_path):
+def load_incidents_from_csv(csv_path, chunk_size=None):
     """
     Load incidents from CSV file.
     
+    The file is streamed in chunks, so memory use does not grow with
+    the file size.
+    
     Args:
         csv_path: Path to CSV file
+        chunk_size: Rows per chunk (default: CSV_CHUNK_SIZE)
         
     Returns:
         int: Number of rows loaded
@@ -134,19 +192,10 @@ def load_incidents_from_csv(csv_path):
         print(f"⚠️  File not found: {csv_path}")
         return 0
     
-    conn = connect_database()
-    df = pd.read_csv(csv_path)
-    
-    rows_loaded = df.to_sql(
-        'cyber_incidents',
-        conn,
-        if_exists='append',
-        index=False
-    )
-    
-    conn.close()
-    print(f"✅ Loaded {len(df)} incidents from {Path(csv_path).name}")
-    return len(df)
+    rows_loaded = load_csv(csv_path, 'cyber_incidents', INCIDENT_COLUMNS, chunk_size,
+                           label=Path(csv_path).name)
+    print(f"✅ Loaded {rows_loaded} incidents from {Path(csv_path).name}")
+    return rows_loaded
 
 
 def get_incidents_by_severity(severity):
@@ -189,49 +238,94 @@ def get_incidents_by_status(status):
     return df
 
 
-def get_incident_statistics():
+def get_incidents_min_severity(min_severity):
     """
-    Get incident statistics (count by type, severity, status).
+    Get incidents at or above a severity level (e.g. 'High' and above).
     
+    Args:
+        min_severity: Lowest severity to include
+        
     Returns:
-        dict: Statistics dictionary
+        pandas.DataFrame: Matching incidents, most severe and newest first
     """
     conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM cyber_incidents WHERE severity_rank >= ?
+           ORDER BY severity_rank DESC, date DESC""",
+        conn,
+        params=(rank_of(min_severity, SEVERITY_RANKS),)
+    )
+    conn.close()
+    return df
+
+
+def get_incidents_between(start, end):
+    """
+    Get incidents whose date falls in a window (inclusive).
     
-    stats = {}
-    
-    # Count by type
-    df_type = pd.read_sql_query("""
-        SELECT incident_type, COUNT(*) as count 
-        FROM cyber_incidents 
-        GROUP BY incident_type 
-        ORDER BY count DESC
-    """, conn)
-    stats['by_type'] = df_type
-    
-    # Count by severity
-    df_severity = pd.read_sql_query("""
-        SELECT severity, COUNT(*) as count 
-        FROM cyber_incidents 
-        GROUP BY severity 
-        ORDER BY 
-            CASE severity 
-                WHEN 'Critical' THEN 1 
-                WHEN 'High' THEN 2 
-                WHEN 'Medium' THEN 3 
-                WHEN 'Low' THEN 4 
-            END
-    """, conn)
-    stats['by_severity'] = df_severity
-    
-    # Count by status
-    df_status = pd.read_sql_query("""
-        SELECT status, COUNT(*) as count 
-        FROM cyber_incidents 
-        GROUP BY status 
-        ORDER BY count DESC
-    """, conn)
-    stats['by_status'] = df_status
+    Args:
+        start: First day (date or 'YYYY-MM-DD')
+        end: Last day (date or 'YYYY-MM-DD')
+        
+    Returns:
+        pandas.DataFrame: Matching incidents, newest first
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM cyber_incidents WHERE date_day BETWEEN ? AND ?
+           ORDER BY date_day DESC""",
+        conn,
+        params=(epoch_day(start), epoch_day(end))
+    )
+    conn.close()
+    return df
+
+
+def search_incidents(query, limit=20):
+    """
+    Full-text search over incident descriptions, best matches first.
     
+    Args:
+        query: Search words (a trailing * matches prefixes, e.g. 'ransom*')
+        limit: Maximum number of results
+        
+    Returns:
+        pandas.DataFrame: Matching incidents plus 'score' (bm25, lower is
+        better) and 'snippet' (description excerpt with **highlighted** hits)
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT c.*, bm25(incidents_fts) AS score,
+                  snippet(incidents_fts, 0, '**', '**', '…', 12) AS snippet
+           FROM incidents_fts
+           JOIN cyber_incidents c ON c.id = incidents_fts.rowid
+           WHERE incidents_fts MATCH ?
+           ORDER BY score
+           LIMIT ?""",
+        conn,
+        params=(fts_query(query), limit)
+    )
     conn.close()
+    return df
+
+
+def get_incident_statistics():
+    """
+    Get incident statistics (count by type, severity, status and day).
+    
+    Reads the trigger-maintained incident_summary table, so the cost
+    depends on the number of groups, not the number of incidents.
+    
+    Returns:
+        dict: Statistics dictionary
+    """
+    stats = {}
+    stats['by_type'] = get_summary('incident_summary', 'incident_type')
+    stats['by_severity'] = get_summary(
+        'incident_summary', 'severity',
+        order_by=f"{rank_case_sql('value', SEVERITY_RANKS)} DESC"
+    )
+    stats['by_status'] = get_summary('incident_summary', 'status')
+    stats['by_day'] = get_summary('incident_summary', 'day', label='date',
+                                  order_by="value")
     return stats
@@ -0,0 +1,114 @@
+"""
+Incremental ingest module.
+Remembers how far each data file has been loaded so that re-running the
+setup only processes what is new.
+
+For every loaded file, ingest_state keeps its size, modification time,
+the byte offset just past the last complete line that was loaded, and a
+SHA-256 checksum of the bytes before that offset. On the next load:
+
+    size and mtime unchanged    -> skipped without reading the file
+    loaded prefix unchanged     -> only the bytes after the offset are read
+    anything else               -> the whole file is read again
+
+Re-reading is always safe: rows are matched to the ones already loaded
+(row_hash or ticket_id, see schema.CONFLICT_KEYS) and never inserted twice.
+"""
+import hashlib
+import os
+from pathlib import Path
+
+# Bytes hashed per read
+_BLOCK_SIZE = 1024 * 1024
+
+
+def _key(path):
+    return str(Path(path).resolve())
+
+
+def get_ingest_state(conn, path):
+    """
+    Get the recorded state of a previously loaded file.
+
+    Args:
+        conn: Database connection object
+        path: Data file path
+
+    Returns:
+        dict: Recorded state, or None if the file was never loaded
+    """
+    row = conn.execute(
+        "SELECT size, mtime_ns, offset, checksum FROM ingest_state WHERE path = ?",
+        (_key(path),)
+    ).fetchone()
+    if row is None:
+        return None
+    return dict(zip(('size', 'mtime_ns', 'offset', 'checksum'), row))
+
+
+def save_ingest_state(conn, path, state):
+    """
+    Record the state of a file after it has been loaded (not committed).
+
+    Args:
+        conn: Database connection object
+        path: Data file path
+        state: State returned by plan_ingest
+    """
+    conn.execute("""
+        INSERT INTO ingest_state (path, size, mtime_ns, offset, checksum)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (path) DO UPDATE SET
+            size = excluded.size, mtime_ns = excluded.mtime_ns,
+            offset = excluded.offset, checksum = excluded.checksum,
+            loaded_at = CURRENT_TIMESTAMP
+    """, (_key(path), state['size'], state['mtime_ns'], state['offset'], state['checksum']))
+
+
+def plan_ingest(path, recorded=None):
+    """
+    Decide which part of a data file needs loading.
+
+    Args:
+        path: Data file path
+        recorded: State from get_ingest_state (None if never loaded)
+
+    Returns:
+        tuple: (byte offset to start reading from, or None to skip the
+        file; new state to save once the load has finished)
+    """
+    stat = os.stat(path)
+    if (recorded and recorded['size'] == stat.st_size
+            and recorded['mtime_ns'] == stat.st_mtime_ns):
+        return None, recorded
+
+    # The state only covers complete lines: bytes after the last newline
+    # (a half-written row) are held back and read again next time
+    digest = hashlib.sha256()
+    hashed = 0
+    prefix_checksum = None
+    pending = b""
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+            data = pending + block
+            newline = data.rfind(b"\n")
+            if newline < 0:
+                pending = data
+                continue
+            complete, pending = data[:newline + 1], data[newline + 1:]
+            if recorded and prefix_checksum is None and hashed + len(complete) >= recorded['offset']:
+                before = digest.copy()
+                before.update(complete[:recorded['offset'] - hashed])
+                prefix_checksum = before.hexdigest()
+            digest.update(complete)
+            hashed += len(complete)
+
+    state = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'offset': hashed,
+        'checksum': digest.hexdigest(),
+    }
+    if recorded and prefix_checksum == recorded['checksum']:
+        return recorded['offset'], state
+    return 0, state
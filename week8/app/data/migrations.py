@@ -0,0 +1,388 @@
+"""
+Schema migration module.
+Applies ordered, versioned migrations and records the schema version in
+PRAGMA user_version.
+
+Each migration has:
+    version     Positive integer, applied in ascending order
+    name        Short description
+    statements  SQL strings (or callables taking the connection) run in
+                one transaction
+    backfills   Optional batched UPDATEs run after the statements, each a
+                dict with 'table', 'set' (SET clause) and 'pending'
+                (WHERE condition matching rows that still need the update)
+
+Backfills walk the table in rowid windows of batch_size rows and commit
+after each window, so a large table is never locked for long. The last
+finished rowid is stored in schema_migration_progress; an interrupted
+run resumes where it stopped. user_version is only bumped once every
+step of a migration has finished.
+
+Python functions in SQL_FUNCTIONS are registered on the connection before
+any migration runs, so statements and backfills can call them.
+"""
+import re
+import sqlite3
+import time
+
+from app.data.schema import (
+    INDEXES, SEVERITY_RANKS, PRIORITY_RANKS, OPEN_TICKET_CONDITION, FTS_TABLES,
+    HASHED_COLUMNS, rank_case_sql, epoch_day_sql, fts_sql, row_hash
+)
+from app.data.summaries import SUMMARY_TABLES, summary_sql, rebuild_sql
+
+MIGRATIONS = []
+
+# SQL name -> Python function available to migration SQL
+SQL_FUNCTIONS = {
+    'row_hash': row_hash,
+}
+
+_TOUCHED_TABLE = re.compile(
+    r"\b(?:ON|ALTER\s+TABLE|UPDATE|INTO|FROM)\s+[\"`\[]?(\w+)", re.IGNORECASE
+)
+
+
+def register_migration(version, name, statements=(), backfills=()):
+    """
+    Add a migration to the registry.
+
+    Args:
+        version: Schema version this migration brings the database to
+        name: Short description
+        statements: SQL strings or callables(conn) run in one transaction
+        backfills: Batched update specs (see module docstring)
+    """
+    if any(m['version'] == version for m in MIGRATIONS):
+        raise ValueError(f"Duplicate migration version {version}")
+    MIGRATIONS.append({
+        'version': version,
+        'name': name,
+        'statements': list(statements),
+        'backfills': list(backfills),
+    })
+    MIGRATIONS.sort(key=lambda m: m['version'])
+
+
+def get_schema_version(conn):
+    """
+    Get the current schema version.
+
+    Args:
+        conn: Database connection object
+
+    Returns:
+        int: Value of PRAGMA user_version
+    """
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def _ensure_progress_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_migration_progress (
+            version INTEGER NOT NULL,
+            step INTEGER NOT NULL,
+            last_rowid INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (version, step)
+        )
+    """)
+    conn.commit()
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _estimate_rows(conn, migration):
+    """Estimate the rows a migration will read or rewrite."""
+    estimate = 0
+    for statement in migration['statements']:
+        if callable(statement):
+            continue
+        match = _TOUCHED_TABLE.search(statement)
+        if match and _table_exists(conn, match.group(1)):
+            estimate += conn.execute(
+                f"SELECT COUNT(*) FROM {match.group(1)}"
+            ).fetchone()[0]
+    for backfill in migration['backfills']:
+        if _table_exists(conn, backfill['table']):
+            try:
+                estimate += conn.execute(
+                    f"SELECT COUNT(*) FROM {backfill['table']} WHERE {backfill['pending']}"
+                ).fetchone()[0]
+            except sqlite3.OperationalError:
+                # Column added by this migration doesn't exist yet: every row
+                estimate += conn.execute(
+                    f"SELECT COUNT(*) FROM {backfill['table']}"
+                ).fetchone()[0]
+    return estimate
+
+
+def _run_statements(conn, migration):
+    """Run a migration's statements once, in a single transaction."""
+    version = migration['version']
+    done = conn.execute(
+        "SELECT 1 FROM schema_migration_progress WHERE version = ? AND step = 0",
+        (version,)
+    ).fetchone()
+    if done:
+        return
+
+    conn.execute("BEGIN")
+    try:
+        for statement in migration['statements']:
+            if callable(statement):
+                statement(conn)
+            else:
+                conn.execute(statement)
+        conn.execute(
+            "INSERT INTO schema_migration_progress (version, step) VALUES (?, 0)",
+            (version,)
+        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+def _run_backfill(conn, version, step, backfill, batch_size):
+    """Run one backfill in committed rowid windows, resuming if needed."""
+    table = backfill['table']
+    row = conn.execute(
+        "SELECT last_rowid FROM schema_migration_progress WHERE version = ? AND step = ?",
+        (version, step)
+    ).fetchone()
+    last_rowid = row[0] if row else 0
+    updated = 0
+
+    while True:
+        window_end = conn.execute(
+            f"SELECT MAX(rowid) FROM (SELECT rowid FROM {table} "
+            f"WHERE rowid > ? ORDER BY rowid LIMIT ?)",
+            (last_rowid, batch_size)
+        ).fetchone()[0]
+        if window_end is None:
+            break
+
+        conn.execute("BEGIN")
+        try:
+            cursor = conn.execute(
+                f"UPDATE {table} SET {backfill['set']} "
+                f"WHERE rowid > ? AND rowid <= ? AND ({backfill['pending']})",
+                (last_rowid, window_end)
+            )
+            updated += max(cursor.rowcount, 0)
+            conn.execute("""
+                INSERT INTO schema_migration_progress (version, step, last_rowid)
+                VALUES (?, ?, ?)
+                ON CONFLICT (version, step) DO UPDATE SET last_rowid = excluded.last_rowid
+            """, (version, step, window_end))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        last_rowid = window_end
+
+    return updated
+
+
+def run_migrations(conn, target=None, dry_run=False, batch_size=10000):
+    """
+    Bring the database schema up to date.
+
+    Args:
+        conn: Database connection object
+        target: Stop at this version (default: latest)
+        dry_run: Only report pending migrations and estimated rows touched
+        batch_size: Rows per committed backfill batch
+
+    Returns:
+        list: One report dict per pending migration
+    """
+    if conn.in_transaction:
+        conn.commit()
+
+    current = get_schema_version(conn)
+    pending = [
+        m for m in MIGRATIONS
+        if m['version'] > current and (target is None or m['version'] <= target)
+    ]
+
+    reports = []
+    if not dry_run and pending:
+        _ensure_progress_table(conn)
+        for name, function in SQL_FUNCTIONS.items():
+            conn.create_function(name, -1, function, deterministic=True)
+
+    for migration in pending:
+        report = {
+            'version': migration['version'],
+            'name': migration['name'],
+            'estimated_rows': _estimate_rows(conn, migration),
+        }
+        if dry_run:
+            report['status'] = 'pending'
+            reports.append(report)
+            print(f"🔎 v{migration['version']} {migration['name']}: "
+                  f"~{report['estimated_rows']:,} rows")
+            continue
+
+        started = time.perf_counter()
+        _run_statements(conn, migration)
+        rows_updated = 0
+        for step, backfill in enumerate(migration['backfills'], start=1):
+            rows_updated += _run_backfill(conn, migration['version'], step,
+                                          backfill, batch_size)
+
+        conn.execute("BEGIN")
+        conn.execute(f"PRAGMA user_version = {int(migration['version'])}")
+        conn.execute(
+            "DELETE FROM schema_migration_progress WHERE version = ?",
+            (migration['version'],)
+        )
+        conn.commit()
+
+        report['status'] = 'applied'
+        report['rows_updated'] = rows_updated
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        reports.append(report)
+        print(f"✅ Migrated to v{migration['version']}: {migration['name']} "
+              f"({report['seconds']}s)")
+
+    return reports
+
+
+# ------------------------------------------------------------
+# Migrations (version 0 is the CREATE TABLE baseline in schema.py)
+# ------------------------------------------------------------
+register_migration(
+    1, "secondary indexes",
+    statements=[create_index_sql for _, create_index_sql in INDEXES] + ["ANALYZE"],
+)
+
+register_migration(
+    2, "integer severity/priority ranks",
+    statements=[
+        "ALTER TABLE cyber_incidents ADD COLUMN severity_rank INTEGER "
+        f"GENERATED ALWAYS AS ({rank_case_sql('severity', SEVERITY_RANKS)}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_severity_rank_date "
+        "ON cyber_incidents(severity_rank, date)",
+        "ALTER TABLE it_tickets ADD COLUMN priority_rank INTEGER "
+        f"GENERATED ALWAYS AS ({rank_case_sql('priority', PRIORITY_RANKS)}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_priority_rank_created "
+        "ON it_tickets(priority_rank, created_date)",
+        "ANALYZE",
+    ],
+)
+
+register_migration(
+    3, "epoch-day date columns",
+    statements=[
+        "ALTER TABLE cyber_incidents ADD COLUMN date_day INTEGER "
+        f"GENERATED ALWAYS AS ({epoch_day_sql('date')}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_incidents_date_day "
+        "ON cyber_incidents(date_day)",
+        "ALTER TABLE it_tickets ADD COLUMN created_day INTEGER "
+        f"GENERATED ALWAYS AS ({epoch_day_sql('created_date')}) VIRTUAL",
+        "ALTER TABLE it_tickets ADD COLUMN resolved_day INTEGER "
+        f"GENERATED ALWAYS AS ({epoch_day_sql('resolved_date')}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_created_day "
+        "ON it_tickets(created_day)",
+        "CREATE INDEX IF NOT EXISTS idx_tickets_resolved_day "
+        "ON it_tickets(resolved_day)",
+        "ALTER TABLE datasets_metadata ADD COLUMN last_updated_day INTEGER "
+        f"GENERATED ALWAYS AS ({epoch_day_sql('last_updated')}) VIRTUAL",
+        "CREATE INDEX IF NOT EXISTS idx_datasets_last_updated_day "
+        "ON datasets_metadata(last_updated_day)",
+        "ANALYZE",
+    ],
+)
+
+register_migration(
+    4, "open ticket queue partial index",
+    statements=[
+        "CREATE INDEX IF NOT EXISTS idx_tickets_open_queue "
+        "ON it_tickets(priority_rank DESC, created_date) "
+        f"WHERE {OPEN_TICKET_CONDITION}",
+        "ANALYZE",
+    ],
+)
+
+register_migration(
+    5, "full-text search",
+    statements=[sql for fts_table in FTS_TABLES for sql in fts_sql(fts_table)],
+)
+
+register_migration(
+    6, "trigger-maintained summary tables",
+    statements=[
+        sql for summary_table in SUMMARY_TABLES
+        for sql in summary_sql(summary_table) + rebuild_sql(summary_table)
+    ],
+)
+
+register_migration(
+    7, "row hashes and ingest state",
+    statements=[
+        "ALTER TABLE cyber_incidents ADD COLUMN row_hash TEXT",
+        "ALTER TABLE datasets_metadata ADD COLUMN row_hash TEXT",
+        """CREATE TABLE IF NOT EXISTS ingest_state (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            checksum TEXT NOT NULL,
+            loaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )""",
+    ],
+    backfills=[
+        {
+            'table': table,
+            'set': f"row_hash = row_hash({', '.join(columns)})",
+            'pending': "row_hash IS NULL",
+        }
+        for table, columns in HASHED_COLUMNS.items()
+    ],
+)
+
+def _unhash_duplicates(conn):
+    """
+    Clear row_hash on exact duplicates so row_hash can be made unique.
+
+    Nothing is deleted: the lowest id of each group keeps the hash and the
+    other copies stay, without one. They are reported for review.
+    """
+    for table in HASHED_COLUMNS:
+        cursor = conn.execute(
+            f"UPDATE {table} SET row_hash = NULL WHERE row_hash IS NOT NULL "
+            f"AND id NOT IN (SELECT MIN(id) FROM {table} "
+            f"WHERE row_hash IS NOT NULL GROUP BY row_hash)"
+        )
+        if cursor.rowcount > 0:
+            print(f"⚠️  {cursor.rowcount:,} {table} rows are exact copies of "
+                  f"an earlier row; kept without a row_hash for review "
+                  f"(SELECT * FROM {table} WHERE row_hash IS NULL)")
+
+
+register_migration(
+    8, "unique row hashes",
+    statements=[
+        _unhash_duplicates,
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_incidents_row_hash "
+        "ON cyber_incidents(row_hash)",
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_datasets_row_hash "
+        "ON datasets_metadata(row_hash)",
+        "ANALYZE",
+    ],
+)
+
+if __name__ == "__main__":
+    import sys
+    from app.data.db import connect_database
+
+    conn = connect_database()
+    print(f"Current schema version: {get_schema_version(conn)}")
+    run_migrations(conn, dry_run="--dry-run" in sys.argv)
+    conn.close()
@@ -107,6 +107,457 @@ def create_it_tickets_table(conn):
     print("✅ IT tickets table created successfully!")
 
 
+# Integer ranks for the ordered text enums (higher = more urgent).
+# Stored as generated columns so the text API keeps working unchanged.
+SEVERITY_RANKS = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
+PRIORITY_RANKS = {'Low': 1, 'Medium': 2, 'High': 3, 'Critical': 4}
+
+
+# Allowed status values (tickets can also be under investigation)
+INCIDENT_STATUSES = ('Open', 'Investigating', 'Resolved', 'Closed')
+TICKET_STATUSES = ('Open', 'In Progress', 'Investigating', 'Resolved', 'Closed')
+
+# Typed layout of each loadable CSV: column -> kind, one of 'text',
+# 'category' (free-form label, parsed as a pandas categorical), 'date'
+# (ISO 8601), 'int', 'float', or a tuple of allowed values (matched
+# case-insensitively and stored in their canonical spelling).
+CSV_SCHEMAS = {
+    'cyber_incidents': {
+        'date': 'date',
+        'incident_type': 'category',
+        'severity': tuple(SEVERITY_RANKS),
+        'status': INCIDENT_STATUSES,
+        'description': 'text',
+        'reported_by': 'category',
+    },
+    'it_tickets': {
+        'ticket_id': 'text',
+        'priority': tuple(PRIORITY_RANKS),
+        'status': TICKET_STATUSES,
+        'category': 'category',
+        'subject': 'text',
+        'description': 'text',
+        'created_date': 'date',
+        'resolved_date': 'date',
+        'assigned_to': 'category',
+    },
+    'datasets_metadata': {
+        'dataset_name': 'text',
+        'category': 'category',
+        'source': 'category',
+        'last_updated': 'date',
+        'record_count': 'int',
+        'file_size_mb': 'float',
+    },
+}
+
+# CSV columns every row must fill (the NOT NULL columns of each table)
+REQUIRED_COLUMNS = {
+    'cyber_incidents': ('date', 'incident_type', 'severity', 'status'),
+    'it_tickets': ('ticket_id', 'priority', 'status', 'subject'),
+    'datasets_metadata': ('dataset_name',),
+}
+
+def rank_case_sql(column, ranks):
+    """
+    Build the CASE expression that maps a text enum column to its rank.
+    
+    Args:
+        column: Text column name
+        ranks: Mapping of enum value to integer rank
+        
+    Returns:
+        str: SQL expression (unknown values rank 0)
+    """
+    whens = " ".join(
+        f"WHEN '{name.lower()}' THEN {rank}" for name, rank in ranks.items()
+    )
+    return f"CASE lower({column}) {whens} ELSE 0 END"
+
+
+def rank_of(value, ranks):
+    """
+    Look up the rank of an enum value (case-insensitive).
+    
+    Args:
+        value: Enum text such as 'High'
+        ranks: SEVERITY_RANKS or PRIORITY_RANKS
+        
+    Returns:
+        int: Rank, or raises ValueError for unknown values
+    """
+    for name, rank in ranks.items():
+        if name.lower() == str(value).lower():
+            return rank
+    raise ValueError(f"Unknown level '{value}'. Expected one of: {', '.join(ranks)}")
+
+
+# Tickets still in the work queue. Queries must use this exact text for
+# SQLite to match them to the partial index idx_tickets_open_queue.
+OPEN_TICKET_CONDITION = "status NOT IN ('Resolved', 'Closed')"
+
+
+def epoch_day_sql(column):
+    """
+    Build the SQL expression turning a TEXT date into days since 1970-01-01.
+    
+    Args:
+        column: Text date column name
+        
+    Returns:
+        str: SQL expression (NULL for missing or unparseable dates)
+    """
+    return f"CAST(julianday({column}) - 2440587.5 AS INTEGER)"
+
+
+def epoch_day(value):
+    """
+    Convert a date to days since 1970-01-01 (matches epoch_day_sql).
+    
+    Args:
+        value: datetime.date, datetime.datetime or 'YYYY-MM-DD' string
+        
+    Returns:
+        int: Epoch day
+    """
+    from datetime import date, datetime
+    
+    if isinstance(value, datetime):
+        value = value.date()
+    elif not isinstance(value, date):
+        value = date.fromisoformat(str(value)[:10])
+    return (value - date(1970, 1, 1)).days
+
+
+# FTS5 full-text mirrors: fts table -> (source table, indexed text columns).
+# External-content tables: the text lives only in the source table and the
+# index is kept in sync by triggers.
+FTS_TABLES = {
+    'incidents_fts': ('cyber_incidents', ('description',)),
+    'tickets_fts': ('it_tickets', ('subject', 'description')),
+}
+
+
+def fts_sql(fts_table):
+    """
+    Build the statements creating an FTS5 mirror, its sync triggers, and
+    indexing the rows already in the source table.
+    
+    Args:
+        fts_table: Key of FTS_TABLES
+        
+    Returns:
+        list: SQL statements
+    """
+    source, columns = FTS_TABLES[fts_table]
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    delete_old = (f"INSERT INTO {fts_table} ({fts_table}, rowid, {cols}) "
+                  f"VALUES ('delete', old.id, {old_values});")
+    insert_new = f"INSERT INTO {fts_table} (rowid, {cols}) VALUES (new.id, {new_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5("
+        f"{cols}, content='{source}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au AFTER UPDATE OF {cols} ON {source} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def fts_query(text):
+    """
+    Turn free text typed by a user into a safe FTS5 MATCH expression.
+    
+    Every word is quoted so punctuation can't break the query syntax; a
+    trailing * keeps prefix matching (e.g. 'ransom*').
+    
+    Args:
+        text: Search text
+        
+    Returns:
+        str: FTS5 query matching rows containing all words
+    """
+    terms = []
+    for word in str(text).split():
+        prefix = word.endswith('*') and len(word) > 1
+        word = word.rstrip('*').replace('"', '""')
+        if word:
+            terms.append(f'"{word}"' + ('*' if prefix else ''))
+    if not terms:
+        raise ValueError("Search text is empty")
+    return " ".join(terms)
+
+
+# Columns whose values identify a CSV row in tables without a natural
+# key. Their hash is stored in row_hash so re-loaded rows can be matched.
+# row_hash is unique; exact duplicates entered by hand (or kept from
+# before migration 8) are stored without one.
+HASHED_COLUMNS = {
+    'cyber_incidents': ('date', 'incident_type', 'severity', 'status',
+                        'description', 'reported_by'),
+    'datasets_metadata': ('dataset_name', 'category', 'source', 'last_updated',
+                          'record_count', 'file_size_mb'),
+}
+
+# Unique column that loaded CSV rows are matched on. Rows matched by
+# row_hash are identical and skipped; tickets matched by ticket_id are
+# updated in place when any column changed.
+CONFLICT_KEYS = {
+    'cyber_incidents': 'row_hash',
+    'datasets_metadata': 'row_hash',
+    'it_tickets': 'ticket_id',
+}
+
+
+def row_hash(*values):
+    """
+    Hash a row's values into a stable key (also registered as a SQL function).
+    
+    Text and numbers hash alike ('150000', 150000 and 150000.0 match), so
+    a value read from a CSV matches the same value stored in SQLite.
+    
+    Args:
+        *values: Column values, in HASHED_COLUMNS order
+        
+    Returns:
+        str: Hex SHA-1 digest
+    """
+    import hashlib
+    
+    parts = [_hash_part(value) for value in values]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _hash_part(value):
+    """Text of one value inside a row_hash key."""
+    if value is None:
+        return "\x00"
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def row_hashes(frame, columns):
+    """
+    Hash every row of a DataFrame; the digests equal row_hash's.
+    
+    Each column is turned into key text as a whole, which leaves one
+    join and one SHA-1 call per row in Python (calling row_hash per row
+    took about as long as parsing and inserting the rows).
+    
+    Args:
+        frame: DataFrame of typed values (see app.data.validation);
+            missing columns hash as NULL
+        columns: Column names, in HASHED_COLUMNS order
+        
+    Returns:
+        list: Hex SHA-1 digests, one per row
+    """
+    import hashlib
+    import numpy as np
+    from pandas.api.types import is_float_dtype
+    
+    frame = frame.reindex(columns=list(columns))
+    parts = []
+    for column in frame.columns:
+        values = frame[column]
+        if is_float_dtype(values):
+            # Whole numbers hash as ints, so go value by value
+            text = values.map(_hash_part).tolist()
+        else:
+            text = values.astype(str).tolist()
+        # Marked by position: numpy and arrow strings drop a "\x00" fill value
+        for i in np.flatnonzero(values.isna().to_numpy()):
+            text[i] = "\x00"
+        parts.append(text)
+    return [
+        hashlib.sha1("\x1f".join(key).encode("utf-8")).hexdigest()
+        for key in zip(*parts)
+    ]
+
+
+def insert_hashed(cursor, table, row):
+    """
+    Insert a row entered by hand into a HASHED_COLUMNS table, with its
+    row_hash so that a later CSV load recognises it.
+    
+    An identical row may already hold the hash; the new row is then
+    still inserted, without one.
+    
+    Args:
+        cursor: Database cursor
+        table: Key of HASHED_COLUMNS
+        row: Dict of {column: value}
+        
+    Returns:
+        int: ID of the inserted row
+    """
+    names = list(row)
+    columns = ", ".join(names + ['row_hash'])
+    marks = ", ".join("?" for _ in range(len(names) + 1))
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({marks})"
+    values = tuple(row.values())
+    digest = row_hash(*(row.get(name) for name in HASHED_COLUMNS[table]))
+    
+    cursor.execute(f"{sql} ON CONFLICT (row_hash) DO NOTHING", values + (digest,))
+    if cursor.rowcount == 0:
+        cursor.execute(sql, values + (None,))
+    return cursor.lastrowid
+
+
+def insert_sql(table, names):
+    """
+    Build the INSERT statement used to load CSV rows into a table.
+    
+    Rows that collide on the table's CONFLICT_KEYS column are skipped or
+    updated instead of being inserted twice.
+    
+    Args:
+        table: Table name
+        names: Column names, in row order
+        
+    Returns:
+        str: SQL statement with one ? per column
+    """
+    columns = ", ".join(names)
+    marks = ", ".join("?" for _ in names)
+    sql = f"INSERT INTO {table} ({columns}) VALUES ({marks})"
+    
+    key = CONFLICT_KEYS.get(table)
+    if key not in names:
+        return sql
+    others = [name for name in names if name != key]
+    if key == 'row_hash' or not others:
+        return f"{sql} ON CONFLICT ({key}) DO NOTHING"
+    # Only rewrite rows that changed, so unchanged ones fire no triggers
+    updates = ", ".join(f"{name} = excluded.{name}" for name in others)
+    changed = " OR ".join(f"{table}.{name} IS NOT excluded.{name}" for name in others)
+    return f"{sql} ON CONFLICT ({key}) DO UPDATE SET {updates} WHERE {changed}"
+
+
+# Secondary indexes backing the filtered/sorted query helpers in
+# incidents.py, tickets.py and datasets.py
+INDEXES = [
+    ("idx_incidents_severity_date",
+     "CREATE INDEX IF NOT EXISTS idx_incidents_severity_date "
+     "ON cyber_incidents(severity, date)"),
+    ("idx_incidents_status_date",
+     "CREATE INDEX IF NOT EXISTS idx_incidents_status_date "
+     "ON cyber_incidents(status, date)"),
+    ("idx_incidents_type",
+     "CREATE INDEX IF NOT EXISTS idx_incidents_type "
+     "ON cyber_incidents(incident_type)"),
+    ("idx_tickets_priority_created",
+     "CREATE INDEX IF NOT EXISTS idx_tickets_priority_created "
+     "ON it_tickets(priority, created_date)"),
+    ("idx_tickets_status_created",
+     "CREATE INDEX IF NOT EXISTS idx_tickets_status_created "
+     "ON it_tickets(status, created_date)"),
+    ("idx_tickets_assigned_to",
+     "CREATE INDEX IF NOT EXISTS idx_tickets_assigned_to "
+     "ON it_tickets(assigned_to)"),
+    ("idx_datasets_category_updated",
+     "CREATE INDEX IF NOT EXISTS idx_datasets_category_updated "
+     "ON datasets_metadata(category, last_updated)"),
+]
+
+
+def create_indexes(conn):
+    """
+    Create the secondary indexes.
+    Safe to run repeatedly and on an existing, populated database.
+    
+    Args:
+        conn: Database connection object
+    """
+    cursor = conn.cursor()
+    
+    for name, create_index_sql in INDEXES:
+        cursor.execute(create_index_sql)
+    
+    # Refresh planner statistics so the new indexes are actually chosen
+    cursor.execute("ANALYZE")
+    conn.commit()
+    print(f"✅ {len(INDEXES)} indexes created successfully!")
+
+
+def drop_indexes(conn):
+    """
+    Drop the secondary indexes (e.g. before a large bulk load).
+    
+    Args:
+        conn: Database connection object
+    """
+    cursor = conn.cursor()
+    
+    for name, _ in INDEXES:
+        cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    
+    conn.commit()
+
+
+# Tables whose indexes and triggers a bulk load defers
+BULK_LOAD_TABLES = ('cyber_incidents', 'datasets_metadata', 'it_tickets')
+
+
+def defer_indexes_and_triggers(conn, tables=BULK_LOAD_TABLES):
+    """
+    Drop the non-unique indexes and the triggers of tables about to be
+    bulk loaded, so rows are written without maintaining them.
+    
+    Unique indexes stay: loads rely on them to skip rows already present.
+    
+    Args:
+        conn: Database connection object
+        tables: Table names
+        
+    Returns:
+        list: (type, name, CREATE statement) for restore_indexes_and_triggers
+    """
+    marks = ", ".join("?" for _ in tables)
+    deferred = [
+        (obj_type, name, sql) for obj_type, name, sql in conn.execute(f"""
+            SELECT type, name, sql FROM sqlite_master
+            WHERE type IN ('index', 'trigger') AND tbl_name IN ({marks})
+              AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE %'
+        """, tuple(tables))
+    ]
+    for obj_type, name, _ in deferred:
+        conn.execute(f"DROP {obj_type.upper()} IF EXISTS {name}")
+    conn.commit()
+    return deferred
+
+
+def restore_indexes_and_triggers(conn, deferred):
+    """
+    Recreate what defer_indexes_and_triggers dropped, bring the full-text
+    indexes and summary tables back in line with the loaded rows, and
+    refresh planner statistics once.
+    
+    Args:
+        conn: Database connection object
+        deferred: Return value of defer_indexes_and_triggers
+    """
+    from app.data.summaries import rebuild_summaries
+    
+    cursor = conn.cursor()
+    for _, _, create_sql in deferred:
+        cursor.execute(create_sql)
+    for fts_table in FTS_TABLES:
+        cursor.execute(f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')")
+    conn.commit()
+    rebuild_summaries(conn)
+    
+    cursor.execute("ANALYZE")
+    conn.commit()
+    print(f"✅ Rebuilt {len(deferred)} deferred indexes and triggers")
+
+
 def create_all_tables(conn):
     """
     Create all database tables.
@@ -120,3 +571,7 @@ def create_all_tables(conn):
     create_datasets_metadata_table(conn)
     create_it_tickets_table(conn)
     print("✅ All tables created successfully!")
+    
+    # Bring indexes and later schema changes up to date
+    from app.data.migrations import run_migrations
+    run_migrations(conn)
@@ -0,0 +1,155 @@
+"""
+Summary table module.
+Keeps per-group row counts for cyber_incidents and it_tickets in small
+summary tables maintained by INSERT/UPDATE/DELETE triggers, so dashboard
+statistics read a handful of rows instead of scanning the tables.
+
+Each summary table holds (dimension, value, count) rows, e.g.
+('severity', 'High', 42) or ('day', '2024-01-15', 3). NULL values are
+counted under ''.
+
+If the counts are ever suspected to be wrong (triggers dropped for a bulk
+load, rows changed with triggers disabled, ...) rebuild them from scratch:
+    python -m app.data.summaries --rebuild
+"""
+import pandas as pd
+
+from app.data.db import connect_database
+
+# Summary table -> (source table, source columns the dimensions read,
+#                   {dimension: SQL expression over row {r}})
+SUMMARY_TABLES = {
+    'incident_summary': ('cyber_incidents', ('incident_type', 'severity', 'status', 'date'), {
+        'incident_type': "{r}.incident_type",
+        'severity': "{r}.severity",
+        'status': "{r}.status",
+        'day': "date({r}.date)",
+    }),
+    'ticket_summary': ('it_tickets', ('priority', 'status', 'category', 'created_date'), {
+        'priority': "{r}.priority",
+        'status': "{r}.status",
+        'category': "{r}.category",
+        'day': "date({r}.created_date)",
+    }),
+}
+
+
+def _value(expression, row):
+    return f"COALESCE({expression.format(r=row)}, '')"
+
+
+def summary_sql(summary_table):
+    """
+    Build the statements creating a summary table and its triggers.
+
+    Args:
+        summary_table: Key of SUMMARY_TABLES
+
+    Returns:
+        list: SQL statements (the table starts empty; see rebuild_sql)
+    """
+    source, columns, dimensions = SUMMARY_TABLES[summary_table]
+    increment = " ".join(
+        f"INSERT INTO {summary_table} (dimension, value, count) "
+        f"VALUES ('{dim}', {_value(expr, 'new')}, 1) "
+        f"ON CONFLICT (dimension, value) DO UPDATE SET count = count + 1;"
+        for dim, expr in dimensions.items()
+    )
+    decrement = " ".join(
+        f"UPDATE {summary_table} SET count = count - 1 "
+        f"WHERE dimension = '{dim}' AND value = {_value(expr, 'old')}; "
+        f"DELETE FROM {summary_table} "
+        f"WHERE dimension = '{dim}' AND value = {_value(expr, 'old')} AND count <= 0;"
+        for dim, expr in dimensions.items()
+    )
+    return [
+        f"""CREATE TABLE IF NOT EXISTS {summary_table} (
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count INTEGER NOT NULL,
+            PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID""",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {increment} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {decrement} END",
+        f"CREATE TRIGGER IF NOT EXISTS {summary_table}_au AFTER UPDATE OF {', '.join(columns)} "
+        f"ON {source} BEGIN {decrement} {increment} END",
+    ]
+
+
+def rebuild_sql(summary_table):
+    """
+    Build the statements recomputing a summary table from its source.
+
+    Args:
+        summary_table: Key of SUMMARY_TABLES
+
+    Returns:
+        list: SQL statements
+    """
+    source, _, dimensions = SUMMARY_TABLES[summary_table]
+    return [f"DELETE FROM {summary_table}"] + [
+        f"INSERT INTO {summary_table} (dimension, value, count) "
+        f"SELECT '{dim}', {_value(expr, source)}, COUNT(*) FROM {source} GROUP BY 2"
+        for dim, expr in dimensions.items()
+    ]
+
+
+def rebuild_summaries(conn):
+    """
+    Recompute every summary table from scratch in one transaction.
+
+    Args:
+        conn: Database connection object
+    """
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN")
+    try:
+        for summary_table in SUMMARY_TABLES:
+            for sql in rebuild_sql(summary_table):
+                conn.execute(sql)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    print(f"✅ {len(SUMMARY_TABLES)} summary tables rebuilt successfully!")
+
+
+def get_summary(summary_table, dimension, label=None, order_by="count DESC"):
+    """
+    Read one dimension of a summary table.
+
+    Args:
+        summary_table: Key of SUMMARY_TABLES
+        dimension: Dimension name (e.g. 'severity')
+        label: Name of the value column in the result (default: dimension)
+        order_by: ORDER BY clause over value/count
+
+    Returns:
+        pandas.DataFrame: Columns [label, 'count']
+    """
+    if dimension not in SUMMARY_TABLES[summary_table][2]:
+        raise ValueError(f"Unknown dimension '{dimension}' for {summary_table}")
+    conn = connect_database()
+    df = pd.read_sql_query(
+        f"""SELECT value AS "{label or dimension}", count
+            FROM {summary_table} WHERE dimension = ?
+            ORDER BY {order_by}""",
+        conn,
+        params=(dimension,)
+    )
+    conn.close()
+    return df
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--rebuild" not in sys.argv:
+        print("Usage: python -m app.data.summaries --rebuild")
+        sys.exit(1)
+    conn = connect_database()
+    rebuild_summaries(conn)
+    conn.close()
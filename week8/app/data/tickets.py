@@ -1,5 +1,15 @@
 import pandas as pd
-from app.data.db import connect_database
+from app.data.db import connect_database, iter_table, page_table, load_csv
+from app.data.schema import (
+    PRIORITY_RANKS, OPEN_TICKET_CONDITION, rank_of, rank_case_sql, epoch_day, fts_query
+)
+from app.data.summaries import get_summary
+from app.data.archive import attach_archive
+
+# Columns of the it_tickets table
+TICKET_COLUMNS = ('id', 'ticket_id', 'priority', 'status', 'category', 'subject',
+                  'description', 'created_date', 'resolved_date', 'assigned_to',
+                  'created_at', 'priority_rank', 'created_day', 'resolved_day')
 
 
 def insert_ticket(ticket_id, priority, status, category, subject, description, 
@@ -39,35 +49,78 @@ def insert_ticket(ticket_id, priority, status, category, subject, description,
     return id_inserted
 
 
-def get_all_tickets():
+def get_all_tickets(include_archive=False):
     """
     Get all tickets as DataFrame.
     
+    Args:
+        include_archive: Also return archived tickets (stored columns only)
+        
     Returns:
         pandas.DataFrame: All tickets
     """
     conn = connect_database()
+    source = "it_tickets"
+    if include_archive:
+        attach_archive(conn)
+        source = "tickets_all"
     df = pd.read_sql_query(
-        "SELECT * FROM it_tickets ORDER BY id DESC",
+        f"SELECT * FROM {source} ORDER BY id DESC",
         conn
     )
     conn.close()
     return df
 
 
-def get_ticket_by_id(ticket_id):
+def iter_tickets(chunk_size=10000, where=None, order="id", as_rows=False):
+    """
+    Stream all tickets in chunks with bounded memory.
+    
+    Args:
+        chunk_size: Number of rows per chunk
+        where: Optional dict of {column: value} filters (e.g. {'status': 'Open'})
+        order: Column to order by, optionally with ASC/DESC (default: 'id')
+        as_rows: Yield lists of tuples instead of DataFrames
+        
+    Yields:
+        pandas.DataFrame: Next chunk of tickets (or list of tuples)
+    """
+    return iter_table('it_tickets', TICKET_COLUMNS, chunk_size, where, order, as_rows)
+
+
+def page_tickets(after_id=None, limit=50, filters=None):
+    """
+    Get one page of tickets, newest first (keyset pagination).
+    
+    Args:
+        after_id: Cursor returned by the previous page (None for the first page)
+        limit: Rows per page
+        filters: Optional dict of {column: value} filters (e.g. {'status': 'Open'})
+        
+    Returns:
+        tuple: (pandas.DataFrame page, next cursor or None on the last page)
+    """
+    return page_table('it_tickets', TICKET_COLUMNS, after_id, limit, filters)
+
+
+def get_ticket_by_id(ticket_id, include_archive=False):
     """
     Get single ticket by ID.
     
     Args:
         ticket_id: ID of ticket to retrieve
+        include_archive: Also look in the archive (stored columns only)
         
     Returns:
         pandas.DataFrame: Single ticket or empty DataFrame
     """
     conn = connect_database()
+    source = "it_tickets"
+    if include_archive:
+        attach_archive(conn)
+        source = "tickets_all"
     df = pd.read_sql_query(
-        "SELECT * FROM it_tickets WHERE id = ?",
+        f"SELECT * FROM {source} WHERE id = ?",
         conn,
         params=(ticket_id,)
     )
@@ -132,12 +185,16 @@ def delete_ticket(ticket_id):
     return rows_deleted
 
 
-def load_tickets_from_csv(csv_path):
+def load_tickets_from_csv(csv_path, chunk_size=None):
     """
     Load tickets from CSV file.
     
+    The file is streamed in chunks, so memory use does not grow with
+    the file size.
+    
     Args:
         csv_path: Path to CSV file
+        chunk_size: Rows per chunk (default: CSV_CHUNK_SIZE)
         
     Returns:
         int: Number of rows loaded
@@ -148,19 +205,10 @@ def load_tickets_from_csv(csv_path):
         print(f"⚠️  File not found: {csv_path}")
         return 0
     
-    conn = connect_database()
-    df = pd.read_csv(csv_path)
-    
-    rows_loaded = df.to_sql(
-        'it_tickets',
-        conn,
-        if_exists='append',
-        index=False
-    )
-    
-    conn.close()
-    print(f"✅ Loaded {len(df)} tickets from {Path(csv_path).name}")
-    return len(df)
+    rows_loaded = load_csv(csv_path, 'it_tickets', TICKET_COLUMNS, chunk_size,
+                           label=Path(csv_path).name)
+    print(f"✅ Loaded {rows_loaded} tickets from {Path(csv_path).name}")
+    return rows_loaded
 
 
 def get_tickets_by_priority(priority):
@@ -203,25 +251,137 @@ def get_tickets_by_status(status):
     return df
 
 
+def get_tickets_min_priority(min_priority):
+    """
+    Get tickets at or above a priority level (e.g. 'High' and above).
+    
+    Args:
+        min_priority: Lowest priority to include
+        
+    Returns:
+        pandas.DataFrame: Matching tickets, most urgent and newest first
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM it_tickets WHERE priority_rank >= ?
+           ORDER BY priority_rank DESC, created_date DESC""",
+        conn,
+        params=(rank_of(min_priority, PRIORITY_RANKS),)
+    )
+    conn.close()
+    return df
+
+
+def get_tickets_created_between(start, end):
+    """
+    Get tickets created in a date window (inclusive).
+    
+    Args:
+        start: First day (date or 'YYYY-MM-DD')
+        end: Last day (date or 'YYYY-MM-DD')
+        
+    Returns:
+        pandas.DataFrame: Matching tickets, newest first
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM it_tickets WHERE created_day BETWEEN ? AND ?
+           ORDER BY created_day DESC""",
+        conn,
+        params=(epoch_day(start), epoch_day(end))
+    )
+    conn.close()
+    return df
+
+
+def get_tickets_resolved_between(start, end):
+    """
+    Get tickets resolved in a date window (inclusive).
+    
+    Args:
+        start: First day (date or 'YYYY-MM-DD')
+        end: Last day (date or 'YYYY-MM-DD')
+        
+    Returns:
+        pandas.DataFrame: Matching tickets, most recently resolved first
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT * FROM it_tickets WHERE resolved_day BETWEEN ? AND ?
+           ORDER BY resolved_day DESC""",
+        conn,
+        params=(epoch_day(start), epoch_day(end))
+    )
+    conn.close()
+    return df
+
+
+def search_tickets(query, limit=20):
+    """
+    Full-text search over ticket subjects and descriptions, best matches first.
+    
+    Args:
+        query: Search words (a trailing * matches prefixes, e.g. 'pass*')
+        limit: Maximum number of results
+        
+    Returns:
+        pandas.DataFrame: Matching tickets plus 'score' (bm25, lower is
+        better) and 'snippet' (best-matching excerpt with **highlighted** hits)
+    """
+    conn = connect_database()
+    df = pd.read_sql_query(
+        """SELECT t.*, bm25(tickets_fts) AS score,
+                  snippet(tickets_fts, -1, '**', '**', '…', 12) AS snippet
+           FROM tickets_fts
+           JOIN it_tickets t ON t.id = tickets_fts.rowid
+           WHERE tickets_fts MATCH ?
+           ORDER BY score
+           LIMIT ?""",
+        conn,
+        params=(fts_query(query), limit)
+    )
+    conn.close()
+    return df
+
+
 def get_open_tickets():
     """
     Get all open/unresolved tickets.
     
+    Reads the partial index idx_tickets_open_queue, which holds only open
+    tickets already in queue order, so the cost follows the size of the
+    backlog rather than of the whole table.
+    
     Returns:
-        pandas.DataFrame: Open tickets
+        pandas.DataFrame: Open tickets, highest priority and oldest first
     """
     conn = connect_database()
-    df = pd.read_sql_query("""
-        SELECT * FROM it_tickets 
-        WHERE status NOT IN ('Resolved', 'Closed') 
-        ORDER BY 
-            CASE priority 
-                WHEN 'Critical' THEN 1 
-                WHEN 'High' THEN 2 
-                WHEN 'Medium' THEN 3 
-                WHEN 'Low' THEN 4 
-            END,
-            created_date
+    df = pd.read_sql_query(f"""
+        SELECT * FROM it_tickets
+        WHERE {OPEN_TICKET_CONDITION}
+        ORDER BY priority_rank DESC, created_date
     """, conn)
     conn.close()
     return df
+
+
+def get_ticket_statistics():
+    """
+    Get ticket statistics (count by priority, status, category and day).
+    
+    Reads the trigger-maintained ticket_summary table, so the cost depends
+    on the number of groups, not the number of tickets.
+    
+    Returns:
+        dict: Statistics dictionary
+    """
+    stats = {}
+    stats['by_priority'] = get_summary(
+        'ticket_summary', 'priority',
+        order_by=f"{rank_case_sql('value', PRIORITY_RANKS)} DESC"
+    )
+    stats['by_status'] = get_summary('ticket_summary', 'status')
+    stats['by_category'] = get_summary('ticket_summary', 'category')
+    stats['by_day'] = get_summary('ticket_summary', 'day', label='created_date',
+                                  order_by="value")
+    return stats
@@ -0,0 +1,128 @@
+"""
+CSV validation module.
+Typed parsing of CSV chunks against schema.CSV_SCHEMAS.
+
+Each chunk is checked column by column: required values present, enum
+values known, dates, integers and decimals parseable. Rows that fail are
+not loaded; they are appended to a quarantine CSV (original values plus
+a 'reason' column) in QUARANTINE_DIR, named after the source file, so
+one bad row no longer aborts the whole load.
+"""
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from app.data.schema import CSV_SCHEMAS, REQUIRED_COLUMNS
+
+# Directory receiving rejected rows
+QUARANTINE_DIR = Path(os.getenv("QUARANTINE_DIR", str(Path("DATA") / "quarantine")))
+
+
+def read_dtypes(table, header):
+    """
+    Build the read_csv dtype map for a table's CSV.
+
+    Labels and enums are read as categoricals (one copy of each distinct
+    value per chunk); everything else is read as text and converted
+    during validation, so a malformed value can't fail the whole read.
+
+    Args:
+        table: Table name
+        header: Column names of the CSV file
+
+    Returns:
+        dict: {column: dtype}
+    """
+    schema = CSV_SCHEMAS.get(table, {})
+    return {
+        column: 'category'
+        if schema.get(column) == 'category' or isinstance(schema.get(column), tuple)
+        else str
+        for column in header
+    }
+
+
+def _flag(reasons, mask, message, values=None):
+    """
+    Give rows matching mask a reason, unless they already have one.
+
+    With values, the reason is message followed by the row's quoted
+    value; that text is only built for the flagged rows.
+    """
+    mask = mask & reasons.isna()
+    if mask.any():
+        if values is None:
+            reasons[mask] = message
+        else:
+            reasons[mask] = f"{message} '" + values[mask].astype(str) + "'"
+
+
+def validate_chunk(table, chunk):
+    """
+    Convert a chunk to typed values and split off invalid rows.
+
+    Args:
+        table: Table name
+        chunk: DataFrame read with read_dtypes
+
+    Returns:
+        tuple: (DataFrame of valid, typed rows; DataFrame of rejected rows
+        with their original values and a 'reason' column)
+    """
+    schema = CSV_SCHEMAS.get(table, {})
+    required = REQUIRED_COLUMNS.get(table, ())
+    reasons = pd.Series(None, index=chunk.index, dtype=object)
+    typed = {}
+
+    for column in chunk.columns:
+        kind = schema.get(column, 'text')
+        values = chunk[column]
+        missing = values.isna()
+        if column in required:
+            _flag(reasons, missing, f"missing {column}")
+
+        if isinstance(kind, tuple):
+            canonical = {value.lower(): value for value in kind}
+            mapped = values.astype(str).str.strip().str.lower().map(canonical)
+            _flag(reasons, ~missing & mapped.isna(), f"unknown {column}", values)
+            typed[column] = pd.Categorical(mapped, categories=kind)
+        elif kind == 'date':
+            parsed = pd.to_datetime(values, format='ISO8601', errors='coerce')
+            _flag(reasons, ~missing & parsed.isna(), f"invalid {column}", values)
+            # Stored as the original ISO text
+            typed[column] = values
+        elif kind in ('int', 'float'):
+            numbers = pd.to_numeric(values, errors='coerce')
+            bad = numbers.isna()
+            if kind == 'int':
+                bad |= numbers % 1 != 0
+            _flag(reasons, ~missing & bad, f"invalid {column}", values)
+            numbers = numbers.where(~bad)
+            typed[column] = numbers.astype('Int64') if kind == 'int' else numbers
+        else:
+            typed[column] = values
+
+    valid = reasons.isna()
+    clean = pd.DataFrame(typed, index=chunk.index)[valid]
+    rejected = chunk[~valid].assign(reason=reasons[~valid])
+    return clean, rejected
+
+
+def quarantine(csv_path, rejected, append=True):
+    """
+    Write rejected rows to the quarantine file of a CSV.
+
+    Args:
+        csv_path: Source CSV path (names the quarantine file)
+        rejected: Rows returned by validate_chunk
+        append: Add to an existing quarantine file instead of replacing it
+
+    Returns:
+        Path: Quarantine file
+    """
+    QUARANTINE_DIR.mkdir(parents=True, exist_ok=True)
+    path = QUARANTINE_DIR / Path(csv_path).name
+    header = not (append and path.exists())
+    rejected.to_csv(path, mode='a' if append else 'w', header=header, index=False)
+    return path
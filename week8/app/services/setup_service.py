@@ -1,10 +1,17 @@
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from app.data.db import connect_database
-from app.data.schema import create_all_tables
-from app.data.incidents import load_incidents_from_csv
-from app.data.datasets import load_datasets_from_csv
-from app.data.tickets import load_tickets_from_csv
-from app.services.user_service import migrate_users_from_file
+from app.data.db import connect_database, close_all_pools, read_csv_batches
+from app.data.schema import (
+    create_all_tables, defer_indexes_and_triggers, restore_indexes_and_triggers
+)
+from app.data.ingest import get_ingest_state, save_ingest_state, plan_ingest
+from app.data.incidents import INCIDENT_COLUMNS
+from app.data.datasets import DATASET_COLUMNS
+from app.data.tickets import TICKET_COLUMNS
+from app.services.user_service import read_user_rows, USER_INSERT_SQL
 
 
 def initialize_database():
@@ -25,10 +32,169 @@ def initialize_database():
         return False
 
 
-def load_all_data():
+# Files read by load_all_data: summary key -> file name in DATA/
+DATA_FILES = {
+    'users': "users.txt",
+    'incidents': "cyber_incidents.csv",
+    'datasets': "datasets_metadata.csv",
+    'tickets': "it_tickets.csv",
+}
+
+# Target table and allowed columns for each CSV file
+CSV_TABLES = {
+    'incidents': ('cyber_incidents', INCIDENT_COLUMNS),
+    'datasets': ('datasets_metadata', DATASET_COLUMNS),
+    'tickets': ('it_tickets', TICKET_COLUMNS),
+}
+
+
+def _read_batches(key, path, offset, stats):
+    """Yield the (sql, rows) INSERT batches for one data file."""
+    if key == 'users':
+        # INSERT OR IGNORE already skips known users; the file is tiny
+        yield USER_INSERT_SQL, read_user_rows(path)
+    else:
+        table, columns = CSV_TABLES[key]
+        yield from read_csv_batches(path, table, columns, offset=offset, stats=stats)
+
+
+def _parse_messages(key, path, recorded):
+    """
+    Parse the new part of one data file into writer messages.
+    
+    Yields ('batch', key, (sql, rows)) for every batch, then one of
+    ('done', key, (ingest state, parse stats)), ('skipped', key, None)
+    or ('error', key, message).
+    """
+    try:
+        offset, state = plan_ingest(path, recorded)
+        if offset is None:
+            yield ('skipped', key, None)
+            return
+        stats = {}
+        for batch in _read_batches(key, path, offset, stats):
+            yield ('batch', key, batch)
+    except Exception as e:
+        yield ('error', key, f"Error loading {key}: {e}")
+    else:
+        yield ('done', key, (state, stats))
+
+
+# Queue the parser processes put their messages on (set per worker)
+_parser_queue = None
+
+
+def _init_parser(out):
+    """Worker process initializer: keep the queue shared with the writer."""
+    global _parser_queue
+    _parser_queue = out
+    # Unread batches only remain after the writer gave up on a load, so
+    # a worker may exit without flushing them
+    out.cancel_join_thread()
+
+
+def _parse_file(key, path, recorded):
+    """Worker process: parse one data file onto the writer's queue."""
+    for message in _parse_messages(key, path, recorded):
+        _parser_queue.put(message)
+
+
+def _received(out, futures, files):
+    """
+    Yield the parsers' messages until all files have finished, or until
+    every parser has exited without reporting back.
+    """
+    finished = 0
+    while finished < files:
+        exited = all(f.done() for f in futures)
+        try:
+            message = out.get(timeout=1)
+        except queue.Empty:
+            # Parsers done before this wait, and nothing more arrived
+            if exited:
+                return
+            continue
+        if message[0] != 'batch':
+            finished += 1
+        yield message
+
+
+def _write_parsed(messages, jobs, summary, profile=None):
+    """
+    Single writer: insert parsed batches as they arrive.
+    
+    Each batch is its own transaction, opened with SAVEPOINT, so a batch
+    that fails is undone on its own and the rest of that file is skipped;
+    other files carry on. A file's ingest state is saved once its last
+    batch is committed.
+    """
+    conn = connect_database(profile=profile)
+    cursor = conn.cursor()
+    pending = set(jobs)
+    failed = set()
+    
+    try:
+        for kind, key, payload in messages:
+            name = Path(jobs[key]).name
+            if kind == 'batch':
+                if key in failed:
+                    continue
+                sql, rows = payload
+                # Outermost savepoint, so RELEASE commits. Nested inside an
+                # open transaction it made trigger-heavy loads ~15x slower.
+                cursor.execute("SAVEPOINT batch")
+                try:
+                    cursor.executemany(sql, rows)
+                except Exception as e:
+                    cursor.execute("ROLLBACK TO batch")
+                    failed.add(key)
+                    summary['errors'].append(f"Error loading {key}: {e}")
+                else:
+                    summary[key] += cursor.rowcount
+                cursor.execute("RELEASE batch")
+                continue
+            
+            pending.discard(key)
+            if kind == 'error':
+                summary['errors'].append(payload)
+            elif kind == 'skipped':
+                print(f"⏭️  {name} unchanged since last load, skipped")
+            elif key not in failed:
+                state, stats = payload
+                save_ingest_state(conn, jobs[key], state)
+                conn.commit()
+                if stats.get('quarantined'):
+                    summary['errors'].append(
+                        f"{stats['quarantined']} invalid rows in {name} quarantined "
+                        f"in {stats['quarantine_file']}"
+                    )
+                verb = "Migrated" if key == 'users' else "Loaded"
+                print(f"✅ {verb} {summary[key]} {key} from {name}")
+        # A parser died without reporting back
+        for key in pending:
+            summary['errors'].append(f"Error loading {key}: parser process exited")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def load_all_data(workers=None, profile=None):
     """
     Load all data from CSV files and migrate users.
     
+    With more than one worker, files are parsed in parallel worker
+    processes; this process is the only writer and inserts their batches
+    as they arrive, so the load takes about as long as the largest file
+    rather than all of them. With one worker (e.g. on a single CPU) the
+    files are parsed and written in turn in this process, which avoids
+    shipping every batch between processes.
+    Running it again only loads what changed (see app.data.ingest).
+    
+    Args:
+        workers: Number of parser processes (default: one per file, up
+            to the CPU count)
+        profile: Pragma profile of the writer connection (e.g. "bulk_load")
+    
     Returns:
         dict: Summary of loaded data
     """
@@ -43,45 +209,47 @@ def load_all_data():
     
     print("\\n📥 Loading data from files...")
     
-    # Migrate users from users.txt
-    try:
-        users_file = data_dir / "users.txt"
-        if users_file.exists():
-            summary['users'] = migrate_users_from_file(str(users_file))
+    jobs = {}
+    for key, name in DATA_FILES.items():
+        path = data_dir / name
+        if path.exists():
+            jobs[key] = str(path)
         else:
-            summary['errors'].append(f"users.txt not found in {data_dir}")
-    except Exception as e:
-        summary['errors'].append(f"Error loading users: {e}")
+            summary['errors'].append(f"{name} not found in {data_dir}")
+    if not jobs:
+        return summary
     
-    # Load cyber incidents
-    try:
-        incidents_file = data_dir / "cyber_incidents.csv"
-        if incidents_file.exists():
-            summary['incidents'] = load_incidents_from_csv(str(incidents_file))
-        else:
-            summary['errors'].append(f"cyber_incidents.csv not found in {data_dir}")
-    except Exception as e:
-        summary['errors'].append(f"Error loading incidents: {e}")
+    conn = connect_database(profile=profile)
+    recorded = {key: get_ingest_state(conn, path) for key, path in jobs.items()}
+    conn.close()
     
-    # Load datasets metadata
-    try:
-        datasets_file = data_dir / "datasets_metadata.csv"
-        if datasets_file.exists():
-            summary['datasets'] = load_datasets_from_csv(str(datasets_file))
-        else:
-            summary['errors'].append(f"datasets_metadata.csv not found in {data_dir}")
-    except Exception as e:
-        summary['errors'].append(f"Error loading datasets: {e}")
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        messages = (
+            message for key, path in jobs.items()
+            for message in _parse_messages(key, path, recorded[key])
+        )
+        _write_parsed(messages, jobs, summary, profile)
+        return summary
     
-    # Load IT tickets
-    try:
-        tickets_file = data_dir / "it_tickets.csv"
-        if tickets_file.exists():
-            summary['tickets'] = load_tickets_from_csv(str(tickets_file))
-        else:
-            summary['errors'].append(f"it_tickets.csv not found in {data_dir}")
-    except Exception as e:
-        summary['errors'].append(f"Error loading tickets: {e}")
+    # Bounded, so parsers can only run a few batches ahead of the writer.
+    # A plain queue: each batch is pickled once, straight to this process.
+    out = multiprocessing.Queue(maxsize=workers * 2)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_parser,
+                             initargs=(out,)) as pool:
+        futures = [pool.submit(_parse_file, key, path, recorded[key])
+                   for key, path in jobs.items()]
+        try:
+            _write_parsed(_received(out, futures, len(jobs)), jobs, summary, profile)
+        finally:
+            # Unblock parsers still waiting on a full queue so the pool can exit
+            for future in futures:
+                future.cancel()
+            while not all(f.done() for f in futures):
+                try:
+                    out.get(timeout=0.1)
+                except queue.Empty:
+                    pass
     
     return summary
 
@@ -112,10 +280,52 @@ def verify_database():
     return stats
 
 
-def complete_setup():
+def bulk_load_all_data(workers=None):
+    """
+    Load all data in bulk-load mode, for a large initial load.
+    
+    The writer uses the "bulk_load" profile (in-memory journal, no
+    fsync, large cache); non-unique indexes and triggers are dropped
+    first and rebuilt once at the end, followed by a single ANALYZE.
+    
+    Args:
+        workers: Number of parser processes (see load_all_data)
+    
+    Returns:
+        dict: Summary of loaded data
+    """
+    # The journal mode can only change while no other connection is open
+    conn = connect_database()
+    journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    conn.close()
+    close_all_pools()
+    conn = connect_database(profile="bulk_load")
+    deferred = defer_indexes_and_triggers(conn)
+    conn.close()
+    print(f"\\n🚚 Bulk-load mode: {len(deferred)} indexes and triggers deferred")
+    
+    try:
+        summary = load_all_data(workers, profile="bulk_load")
+    finally:
+        close_all_pools()
+        conn = connect_database(profile="bulk_load")
+        restore_indexes_and_triggers(conn, deferred)
+        # Leaving the in-memory journal resets the file to rollback mode;
+        # put WAL back if the database was using it
+        if journal_mode == "wal":
+            conn.execute("PRAGMA journal_mode = WAL")
+        conn.close()
+        close_all_pools()
+    return summary
+
+
+def complete_setup(bulk=False):
     """
     Run complete database setup: initialize, load data, and verify.
     
+    Args:
+        bulk: Load through bulk_load_all_data (for large initial loads)
+    
     Returns:
         bool: True if setup was successful
     """
@@ -130,7 +340,7 @@ def complete_setup():
     
     # Step 2: Load all data
     print("\\n" + "-"*70)
-    summary = load_all_data()
+    summary = bulk_load_all_data() if bulk else load_all_data()
     
     # Step 3: Verify
     print("\\n" + "-"*70)
@@ -181,6 +391,8 @@ def reset_database():
             return False
         
         try:
+            # Pooled connections would keep pointing at the deleted file
+            close_all_pools()
             db_path.unlink()
             print(f"\\n🗑️  Deleted {db_path}")
         except Exception as e:
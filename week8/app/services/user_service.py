@@ -64,6 +64,37 @@ def login_user(username, password):
         return False, "Invalid password."
 
 
+# Users already in the database are left untouched
+USER_INSERT_SQL = "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?)"
+
+
+def read_user_rows(filepath='DATA/users.txt'):
+    """
+    Parse users.txt into (username, password_hash, role) rows.
+    
+    Args:
+        filepath: Path to users.txt file
+        
+    Returns:
+        list: Row tuples, one per user line
+    """
+    rows = []
+    with open(filepath, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            # Parse line: username,password_hash,role (or username,password_hash)
+            parts = line.split(',')
+            if len(parts) >= 2:
+                username = parts[0].strip()
+                password_hash = parts[1].strip()
+                role = parts[2].strip() if len(parts) > 2 else 'user'
+                rows.append((username, password_hash, role))
+    return rows
+
+
 def migrate_users_from_file(filepath='DATA/users.txt'):
     """
     Migrate users from text file to database.
@@ -84,29 +115,14 @@ def migrate_users_from_file(filepath='DATA/users.txt'):
     cursor = conn.cursor()
     migrated_count = 0
     
-    with open(filepath, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse line: username,password_hash,role (or username,password_hash)
-            parts = line.split(',')
-            if len(parts) >= 2:
-                username = parts[0].strip()
-                password_hash = parts[1].strip()
-                role = parts[2].strip() if len(parts) > 2 else 'user'
-                
-                # Insert user (ignore if already exists)
-                try:
-                    cursor.execute(
-                        "INSERT OR IGNORE INTO users (username, password_hash, role) VALUES (?, ?, ?)",
-                        (username, password_hash, role)
-                    )
-                    if cursor.rowcount > 0:
-                        migrated_count += 1
-                except Exception as e:
-                    print(f"Error migrating user {username}: {e}")
+    for username, password_hash, role in read_user_rows(filepath):
+        # Insert user (ignore if already exists)
+        try:
+            cursor.execute(USER_INSERT_SQL, (username, password_hash, role))
+            if cursor.rowcount > 0:
+                migrated_count += 1
+        except Exception as e:
+            print(f"Error migrating user {username}: {e}")
     
     conn.commit()
     conn.close()
@@ -0,0 +1,106 @@
+"""
+Benchmark: initial data load, row-by-row to_sql vs bulk-load mode.
+
+Writes synthetic CSVs with --rows incidents and tickets, then loads them
+into a fresh, fully migrated database three ways:
+
+    to_sql      pd.read_csv + DataFrame.to_sql per file (the original loaders)
+    streaming   load_all_data(): per-file parsing (parallel with several
+                CPUs), chunked executemany
+    bulk        bulk_load_all_data(): as streaming, plus the bulk_load
+                profile and indexes/triggers rebuilt once at the end
+
+Usage (from week8/):
+    python benchmarks/bench_bulk_load.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data.db import connect_database, close_all_pools
+from app.data.schema import create_all_tables
+from app.services.setup_service import DATA_FILES, CSV_TABLES, load_all_data, bulk_load_all_data
+from app.services.user_service import migrate_users_from_file
+from benchmarks.synthetic import write_csvs
+
+
+def load_with_to_sql():
+    """The loaders as they were: whole file in memory, then to_sql."""
+    migrate_users_from_file(Path("DATA") / DATA_FILES['users'])
+    for key, (table, _) in CSV_TABLES.items():
+        conn = connect_database()
+        df = pd.read_csv(Path("DATA") / DATA_FILES[key])
+        df.to_sql(table, conn, if_exists='append', index=False)
+        conn.close()
+
+
+METHODS = [
+    ("to_sql", load_with_to_sql),
+    ("streaming", load_all_data),
+    ("bulk", bulk_load_all_data),
+]
+
+
+def run(method, source_dir):
+    """Load the CSVs in source_dir into a fresh database; return (seconds, rows)."""
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        data_dir = Path("DATA")
+        data_dir.mkdir()
+        for name in DATA_FILES.values():
+            os.symlink(source_dir / name, data_dir / name)
+
+        conn = connect_database()
+        create_all_tables(conn)
+        conn.close()
+
+        started = time.perf_counter()
+        method()
+        seconds = time.perf_counter() - started
+
+        conn = connect_database()
+        rows = sum(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                   for table, _ in CSV_TABLES.values())
+        conn.close()
+        close_all_pools()
+        os.chdir(ROOT)
+    return seconds, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="incident and ticket rows to generate")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as csv_dir:
+        source_dir = Path(csv_dir)
+        print(f"\n⏳ Writing {args.rows:,} incidents and tickets as CSV...")
+        write_csvs(source_dir, incidents=args.rows, tickets=args.rows,
+                   datasets=max(args.rows // 100, 100))
+
+        results = {}
+        for name, method in METHODS:
+            print(f"\n▶️  {name}")
+            results[name] = run(method, source_dir)
+
+    baseline = results["to_sql"][0]
+    print(f"\n📊 Initial load of {args.rows:,} incidents and tickets")
+    print(f"{'Method':<12} {'Seconds':>10} {'Rows':>12} {'Rows/s':>12} {'Speedup':>8}")
+    print("-" * 58)
+    for name, (seconds, rows) in results.items():
+        print(f"{name:<12} {seconds:>10.1f} {rows:>12,} {rows / seconds:>12,.0f} "
+              f"{baseline / seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
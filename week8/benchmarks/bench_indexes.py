@@ -0,0 +1,98 @@
+"""
+Benchmark: filtered queries before and after the secondary index set.
+
+Builds a throwaway database with --rows incidents and tickets, times the
+get_*_by_* helpers on the bare tables, runs create_indexes(), and times
+them again.
+
+Usage (from week8/):
+    python benchmarks/bench_indexes.py --rows 1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data.db import connect_database, close_all_pools
+from app.data.schema import (
+    create_users_table, create_cyber_incidents_table,
+    create_datasets_metadata_table, create_it_tickets_table, create_indexes
+)
+from app.data.incidents import get_incidents_by_severity, get_incidents_by_status
+from app.data.tickets import get_tickets_by_priority, get_tickets_by_status
+from app.data.datasets import get_datasets_by_category
+from benchmarks.synthetic import populate
+
+QUERIES = [
+    ("get_incidents_by_severity('Critical')", lambda: get_incidents_by_severity("Critical")),
+    ("get_incidents_by_status('Open')", lambda: get_incidents_by_status("Open")),
+    ("get_tickets_by_priority('Critical')", lambda: get_tickets_by_priority("Critical")),
+    ("get_tickets_by_status('Open')", lambda: get_tickets_by_status("Open")),
+    ("get_datasets_by_category('Compliance')", lambda: get_datasets_by_category("Compliance")),
+]
+
+
+def time_queries(repeat):
+    """Return the median wall time (ms) of each query."""
+    results = {}
+    for name, query in QUERIES:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            query()
+            samples.append((time.perf_counter() - started) * 1000)
+        results[name] = statistics.median(samples)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="incident and ticket rows to generate")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per query (median is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        conn = connect_database()
+        create_users_table(conn)
+        create_cyber_incidents_table(conn)
+        create_datasets_metadata_table(conn)
+        create_it_tickets_table(conn)
+
+        print(f"\n⏳ Generating {args.rows:,} incidents and tickets...")
+        started = time.perf_counter()
+        populate(conn, incidents=args.rows, tickets=args.rows,
+                 datasets=max(args.rows // 100, 100))
+        conn.execute("ANALYZE")
+        conn.commit()
+        print(f"   done in {time.perf_counter() - started:.1f}s")
+
+        before = time_queries(args.repeat)
+
+        started = time.perf_counter()
+        create_indexes(conn)
+        build_s = time.perf_counter() - started
+        conn.close()
+
+        after = time_queries(args.repeat)
+        close_all_pools()
+
+    print(f"\n📊 Median latency at {args.rows:,} rows (index build: {build_s:.1f}s)")
+    print(f"{'Query':<42} {'Before ms':>10} {'After ms':>10} {'Speedup':>8}")
+    print("-" * 74)
+    for name, _ in QUERIES:
+        print(f"{name:<42} {before[name]:>10.1f} {after[name]:>10.1f} "
+              f"{before[name] / after[name]:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: open-ticket queue with and without the partial index.
+
+Keeps the open backlog at a fixed size (--open tickets) while the
+resolved/closed history grows through --sizes, and times
+get_open_tickets() against the same query forced onto a full table scan
+(NOT INDEXED), which is what it cost before idx_tickets_open_queue.
+The partial index should stay flat; the scan grows with the table.
+
+Usage (from week8/):
+    python benchmarks/bench_open_queue.py --sizes 100000 300000 1000000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data.db import connect_database, close_all_pools
+from app.data.schema import create_all_tables, OPEN_TICKET_CONDITION
+from app.data.tickets import get_open_tickets
+from benchmarks.synthetic import populate
+
+FULL_SCAN_SQL = f"""
+    SELECT * FROM it_tickets NOT INDEXED
+    WHERE {OPEN_TICKET_CONDITION}
+    ORDER BY priority_rank DESC, created_date
+"""
+
+
+def median_ms(query, repeat):
+    """Return the median wall time (ms) of query()."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        query()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def full_scan():
+    conn = connect_database()
+    df = pd.read_sql_query(FULL_SCAN_SQL, conn)
+    conn.close()
+    return df
+
+
+def run_size(rows, open_tickets, repeat):
+    """Build a database of `rows` tickets with a fixed open backlog and time both paths."""
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        conn = connect_database()
+        create_all_tables(conn)
+        populate(conn, tickets=rows)
+        # Close everything beyond the first open_tickets open rows
+        conn.execute(f"""
+            UPDATE it_tickets SET status = 'Closed', resolved_date = created_date
+            WHERE {OPEN_TICKET_CONDITION} AND id NOT IN (
+                SELECT id FROM it_tickets WHERE {OPEN_TICKET_CONDITION}
+                ORDER BY id LIMIT ?
+            )
+        """, (open_tickets,))
+        conn.execute("ANALYZE")
+        conn.commit()
+        backlog = conn.execute(
+            f"SELECT COUNT(*) FROM it_tickets WHERE {OPEN_TICKET_CONDITION}"
+        ).fetchone()[0]
+        conn.close()
+
+        scan_ms = median_ms(full_scan, repeat)
+        index_ms = median_ms(get_open_tickets, repeat)
+        close_all_pools()
+        os.chdir(ROOT)
+    return backlog, scan_ms, index_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100_000, 300_000, 1_000_000],
+                        help="total ticket rows per run")
+    parser.add_argument("--open", type=int, default=2_000,
+                        help="open tickets kept in the backlog")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per query (median is reported)")
+    args = parser.parse_args()
+
+    results = []
+    for rows in args.sizes:
+        print(f"\n⏳ Building {rows:,} tickets ({args.open:,} open)...")
+        results.append((rows, *run_size(rows, args.open, args.repeat)))
+
+    print("\n📊 get_open_tickets() median latency")
+    print(f"{'Tickets':>12} {'Open':>8} {'Full scan ms':>13} {'Partial idx ms':>15} {'Speedup':>8}")
+    print("-" * 60)
+    for rows, backlog, scan_ms, index_ms in results:
+        print(f"{rows:>12,} {backlog:>8,} {scan_ms:>13.1f} {index_ms:>15.1f} "
+              f"{scan_ms / index_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
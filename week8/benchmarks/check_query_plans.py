@@ -0,0 +1,357 @@
+"""
+Query-plan regression check.
+
+Builds a synthetic database at --rows scale (all migrations applied) and:
+
+1. Runs each hot query helper in HOT_QUERIES, captures the SQL it really
+   sends, and checks its EXPLAIN QUERY PLAN: the expected index must be
+   used and no base table may be read with a full SCAN. Any violation
+   makes the script exit with status 1. The week11 app's hot queries
+   (every page's DatabaseManager.fetch_page and the SearchService
+   searches) are checked the same way, through a week11 DatabaseManager
+   on the same database (needs week11's requirements installed).
+2. Sweeps every SELECT literal in week8/app/data, week9/week10 app/db and
+   the week11 pages through EXPLAIN QUERY PLAN and reports which of them
+   scan a whole table (informational: full listings legitimately scan);
+   a sweep that finds no source files or literals fails the run.
+3. Times the hot queries and writes the medians to a JSON file. With
+   --baseline, a hot query slower than --max-slowdown x its baseline
+   also fails the run.
+
+Usage (from week8/):
+    python benchmarks/check_query_plans.py --rows 200000 --output plans.json
+    python benchmarks/check_query_plans.py --baseline plans.json
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+REPO = ROOT.parent
+
+from app.data.db import connect_database, close_all_pools, DB_PATH, POOL_SIZE
+from app.data.schema import create_all_tables
+from app.data import incidents, tickets, datasets, users
+from benchmarks.synthetic import populate
+
+# name -> (call, index the plan must use)
+HOT_QUERIES = {
+    "get_incident_by_id": (lambda: incidents.get_incident_by_id(1), "INTEGER PRIMARY KEY"),
+    "get_incidents_by_severity": (lambda: incidents.get_incidents_by_severity("Critical"),
+                                  "idx_incidents_severity_date"),
+    "get_incidents_by_status": (lambda: incidents.get_incidents_by_status("Open"),
+                                "idx_incidents_status_date"),
+    "get_incidents_min_severity": (lambda: incidents.get_incidents_min_severity("Critical"),
+                                   "idx_incidents_severity_rank_date"),
+    "get_incidents_between": (lambda: incidents.get_incidents_between("2023-01-01", "2023-01-31"),
+                              "idx_incidents_date_day"),
+    "page_incidents": (lambda: incidents.page_incidents(after_id=1000), "INTEGER PRIMARY KEY"),
+    "search_incidents": (lambda: incidents.search_incidents("ransomware server"),
+                         "incidents_fts VIRTUAL TABLE"),
+    "get_incident_statistics": (incidents.get_incident_statistics, "incident_summary"),
+    "get_ticket_by_id": (lambda: tickets.get_ticket_by_id(1), "INTEGER PRIMARY KEY"),
+    "get_tickets_by_priority": (lambda: tickets.get_tickets_by_priority("Critical"),
+                                "idx_tickets_priority_created"),
+    "get_tickets_by_status": (lambda: tickets.get_tickets_by_status("Open"),
+                              "idx_tickets_status_created"),
+    "get_tickets_min_priority": (lambda: tickets.get_tickets_min_priority("Critical"),
+                                 "idx_tickets_priority_rank_created"),
+    "get_tickets_created_between": (lambda: tickets.get_tickets_created_between("2023-01-01", "2023-01-31"),
+                                    "idx_tickets_created_day"),
+    "get_tickets_resolved_between": (lambda: tickets.get_tickets_resolved_between("2023-01-01", "2023-01-31"),
+                                     "idx_tickets_resolved_day"),
+    "get_open_tickets": (tickets.get_open_tickets, "idx_tickets_open_queue"),
+    "page_tickets": (lambda: tickets.page_tickets(after_id=1000), "INTEGER PRIMARY KEY"),
+    "search_tickets": (lambda: tickets.search_tickets("password reset"),
+                       "tickets_fts VIRTUAL TABLE"),
+    "get_ticket_statistics": (tickets.get_ticket_statistics, "ticket_summary"),
+    "get_dataset_by_id": (lambda: datasets.get_dataset_by_id(1), "INTEGER PRIMARY KEY"),
+    "get_datasets_by_category": (lambda: datasets.get_datasets_by_category("Compliance"),
+                                 "idx_datasets_category_updated"),
+    "get_datasets_updated_between": (lambda: datasets.get_datasets_updated_between("2023-01-01", "2023-12-31"),
+                                     "idx_datasets_last_updated_day"),
+    "get_user_by_username": (lambda: users.get_user_by_username("alice"),
+                             "sqlite_autoindex_users_1"),
+}
+
+# Week11 pages, whose db.fetch_page(...) queries are hot queries too
+APP_PAGES = ("week11/pages", "*.py")
+
+# Source files whose SELECT literals are swept
+SWEEP_GLOBS = [
+    ("week8/app/data", "*.py"),
+    ("week9/app/db", "*.py"),
+    ("week10/app/db", "*.py"),
+    ("week11/pages", "*.py"),
+]
+
+# "SCAN t" without an index; SCAN ... USING [COVERING] INDEX is a bounded walk
+_FULL_SCAN = re.compile(
+    r"^SCAN (?:\w+\.)?(?!CONSTANT ROW)(\w+)\b(?! USING (?:COVERING )?INDEX| VIRTUAL TABLE)"
+)
+_TRACED = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+# FTS5 reads its own shadow tables (tiny, fixed size) with internal statements
+_FTS_SHADOW = re.compile(r"_fts_(?:config|data|idx|docsize|content)$")
+
+
+def explain(conn, sql, params=()):
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def full_scans(plan):
+    """Tables a plan reads with a full scan."""
+    return [m.group(1) for m in map(_FULL_SCAN.match, plan)
+            if m and not _FTS_SHADOW.search(m.group(1))]
+
+
+def capture_sql(call, conns=None):
+    """
+    Run call() and return the SELECT statements it sent to SQLite.
+
+    conns are the connections to trace (default: every pooled connection
+    the helper might be handed).
+    """
+    captured = []
+
+    def trace(statement):
+        if _TRACED.match(statement) and statement.strip() != "SELECT 1":
+            captured.append(statement)
+
+    def set_trace(callback):
+        targets = conns or [connect_database() for _ in range(POOL_SIZE)]
+        for target in targets:
+            target.set_trace_callback(callback)
+        if not conns:
+            for target in targets:
+                target.close()
+
+    set_trace(trace)
+    try:
+        call()
+    finally:
+        set_trace(None)
+    return captured
+
+
+def page_queries(path):
+    """Yield (line, sql, key) for every fetch_page call on a SQL literal."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                and node.func.attr == "fetch_page" and node.args
+                and isinstance(node.args[0], ast.Constant)
+                and isinstance(node.args[0].value, str)):
+            key = next((kw.value.value for kw in node.keywords
+                        if kw.arg == "key" and isinstance(kw.value, ast.Constant)), "id")
+            yield node.lineno, node.args[0].value, key
+
+
+def app_hot_queries(db_path):
+    """
+    Open a week11 DatabaseManager on db_path and build its hot queries.
+
+    Returns:
+        tuple: (DatabaseManager, {name: (call, index the plan must use)})
+    """
+    app_root = str(REPO / "week11")
+    if app_root not in sys.path:
+        sys.path.append(app_root)
+    from services.database_manager import DatabaseManager
+    from services.search_service import SearchService
+
+    db = DatabaseManager(str(db_path))
+    search = SearchService(db)
+    # Once, outside the trace: it reads sqlite_master
+    search.ensure_index()
+
+    queries = {}
+    folder, pattern = APP_PAGES
+    for path in sorted((REPO / folder).glob(pattern)):
+        for line, sql, key in page_queries(path):
+            # A later page seeks past a key; the first page is a bounded walk
+            queries[f"fetch_page {path.stem}:{line}"] = (
+                lambda sql=sql, key=key: db.fetch_page(sql, after=1000, key=key),
+                "INTEGER PRIMARY KEY",
+            )
+    queries["SearchService.search_incidents"] = (
+        lambda: search.search_incidents("ransomware server"), "incidents_fts VIRTUAL TABLE")
+    queries["SearchService.search_tickets"] = (
+        lambda: search.search_tickets("password reset"), "tickets_fts VIRTUAL TABLE")
+    return db, queries
+
+
+def check_hot_queries(conn, queries, conns=None):
+    """Check the plan of every hot query; return (results, failures)."""
+    results, failures = {}, []
+    for name, (call, expected) in queries.items():
+        statements = capture_sql(call, conns)
+        plans = [explain(conn, sql) for sql in statements]
+        plan_text = "\n".join(line for plan in plans for line in plan)
+        scans = sorted({table for plan in plans for table in full_scans(plan)})
+
+        problems = []
+        if not statements:
+            problems.append("no SQL captured")
+        if expected not in plan_text:
+            problems.append(f"expected {expected}")
+        if scans:
+            problems.append(f"full scan of {', '.join(scans)}")
+        results[name] = {"expected": expected, "plans": plans, "ok": not problems}
+        if problems:
+            failures.append(f"{name}: {'; '.join(problems)}")
+    return results, failures
+
+
+def sql_literals(path):
+    """Yield (line, sql) for every plain string literal that is a SELECT."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in ast.walk(tree):
+        # Case-sensitive: the repo's SQL is upper case, UI labels such as
+        # "Select Incident" are not
+        if (isinstance(node, ast.Constant) and isinstance(node.value, str)
+                and re.match(r"\s*SELECT\b", node.value)):
+            yield node.lineno, node.value
+
+
+def sweep_sources():
+    """Source files matched by SWEEP_GLOBS under REPO."""
+    return [path for folder, pattern in SWEEP_GLOBS
+            for path in sorted((REPO / folder).glob(pattern))]
+
+
+def sweep(conn, sources):
+    """EXPLAIN every SELECT literal in the swept sources."""
+    report = []
+    for path in sources:
+        for line, sql in sql_literals(path):
+            entry = {"source": f"{path.relative_to(REPO)}:{line}",
+                     "sql": " ".join(sql.split())}
+            try:
+                plan = explain(conn, sql, [None] * sql.count("?"))
+            except Exception as e:
+                entry["error"] = str(e)
+            else:
+                entry["plan"] = plan
+                entry["full_scans"] = full_scans(plan)
+            report.append(entry)
+    return report
+
+
+def time_hot_queries(queries, repeat):
+    """Return the median wall time (ms) of each hot query."""
+    timings = {}
+    for name, (call, _) in queries.items():
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            call()
+            samples.append((time.perf_counter() - started) * 1000)
+        timings[name] = round(statistics.median(samples), 3)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000,
+                        help="incident and ticket rows to generate")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per hot query (median is reported)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="write plans and timings to this JSON file")
+    parser.add_argument("--baseline", type=Path, default=None,
+                        help="JSON from an earlier run to compare timings against")
+    parser.add_argument("--max-slowdown", type=float, default=2.0,
+                        help="fail when a hot query is this many times slower than baseline")
+    args = parser.parse_args()
+    output = args.output.resolve() if args.output else None
+    baseline = json.loads(args.baseline.read_text()) if args.baseline else None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        conn = connect_database()
+        create_all_tables(conn)
+        print(f"\n⏳ Generating {args.rows:,} incidents and tickets...")
+        populate(conn, incidents=args.rows, tickets=args.rows,
+                 datasets=max(args.rows // 100, 100))
+        conn.execute("INSERT INTO users (username, password_hash) VALUES ('alice', 'x')")
+        conn.execute("ANALYZE")
+        conn.commit()
+
+        hot, failures = check_hot_queries(conn, HOT_QUERIES)
+        app_db, app_queries = app_hot_queries(DB_PATH)
+        # Reads run on the calling thread's connection
+        app_hot, app_failures = check_hot_queries(conn, app_queries, [app_db._reader()])
+        hot.update(app_hot)
+        failures += app_failures
+        if not any(name.startswith("fetch_page") for name in app_queries):
+            failures.append(f"app: no fetch_page queries found in {APP_PAGES[0]}")
+        sources = sweep_sources()
+        swept = sweep(conn, sources)
+        conn.close()
+        timings = time_hot_queries(HOT_QUERIES, args.repeat)
+        timings.update(time_hot_queries(app_queries, args.repeat))
+        app_db.close()
+        close_all_pools()
+        os.chdir(ROOT)
+
+    print(f"\n🔍 Hot query plans ({len(hot)} queries)")
+    for name, result in hot.items():
+        mark = "✅" if result["ok"] else "❌"
+        print(f"  {mark} {name:<32} {timings[name]:>9.2f} ms   uses {result['expected']}")
+
+    scanning = [entry for entry in swept if entry.get("full_scans")]
+    errors = [entry for entry in swept if "error" in entry]
+    print(f"\n📄 Swept {len(swept)} SQL literals: {len(scanning)} full scans, "
+          f"{len(errors)} not explainable against this schema")
+    for entry in scanning:
+        print(f"  SCAN {', '.join(entry['full_scans']):<20} {entry['source']}")
+    # A sweep that found nothing checked nothing (e.g. run outside the repo)
+    if not sources:
+        failures.append(f"sweep: no source files found under {REPO}")
+    elif not swept:
+        failures.append(f"sweep: no SQL literals found in {len(sources)} source files")
+
+    if baseline:
+        print(f"\n⏱️  Compared with {args.baseline}")
+        for name, ms in timings.items():
+            before = baseline.get("timings_ms", {}).get(name)
+            if not before:
+                continue
+            ratio = ms / before
+            flag = ""
+            if ratio > args.max_slowdown:
+                flag = "  ❌ slower than allowed"
+                failures.append(f"{name}: {ratio:.1f}x slower than baseline")
+            print(f"  {name:<32} {before:>9.2f} -> {ms:>9.2f} ms ({ratio:.2f}x){flag}")
+
+    if output:
+        output.write_text(json.dumps({
+            "generated": date.today().isoformat(),
+            "rows": args.rows,
+            "timings_ms": timings,
+            "hot_queries": hot,
+            "sweep": swept,
+        }, indent=2))
+        print(f"\n💾 Results written to {output}")
+
+    if failures:
+        print("\n❌ Query plan regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ All hot queries use their indexes")
+
+
+if __name__ == "__main__":
+    main()
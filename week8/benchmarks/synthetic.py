@@ -0,0 +1,129 @@
+"""
+Synthetic data generator for benchmarks.
+Fills the platform tables with realistic, skewed data at any scale.
+"""
+import csv
+import random
+from datetime import date, timedelta
+
+SEVERITIES = [("Critical", 5), ("High", 15), ("Medium", 40), ("Low", 40)]
+INCIDENT_STATUSES = [("Open", 4), ("Investigating", 6), ("Resolved", 70), ("Closed", 20)]
+INCIDENT_TYPES = ["Phishing", "Malware", "DDoS", "Data Breach", "Ransomware",
+                  "Insider Threat", "Unauthorized Access", "SQL Injection"]
+PRIORITIES = [("Critical", 5), ("High", 20), ("Medium", 45), ("Low", 30)]
+TICKET_STATUSES = [("Open", 3), ("In Progress", 2), ("Resolved", 70), ("Closed", 25)]
+TICKET_CATEGORIES = ["Hardware", "Software", "Network", "Access", "Email", "Printer"]
+DATASET_CATEGORIES = ["Threat Intelligence", "Network Logs", "Audit Logs",
+                      "Vulnerability Data", "Incident Reports", "Compliance"]
+STAFF = ["alice", "bob", "charlie", "david", "eve", "frank", "grace", "heidi"]
+WORDS = ["ransomware", "phishing", "server", "laptop", "vpn", "email", "firewall",
+         "database", "credential", "outage", "malware", "printer", "password",
+         "access", "network", "backup", "alert", "suspicious", "login", "update"]
+
+START_DATE = date(2020, 1, 1)
+DAYS = 5 * 365
+
+
+def _weighted(rng, choices, n):
+    values = [value for value, _ in choices]
+    weights = [weight for _, weight in choices]
+    return rng.choices(values, weights=weights, k=n)
+
+
+def _day(rng):
+    return (START_DATE + timedelta(days=rng.randrange(DAYS))).isoformat()
+
+
+def _sentence(rng, words=8):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def incident_rows(n, seed=42):
+    """Yield n synthetic cyber_incidents rows."""
+    rng = random.Random(seed)
+    for severity, status in zip(_weighted(rng, SEVERITIES, n),
+                                _weighted(rng, INCIDENT_STATUSES, n)):
+        yield (_day(rng), rng.choice(INCIDENT_TYPES), severity, status,
+               _sentence(rng), rng.choice(STAFF))
+
+
+def ticket_rows(n, seed=43):
+    """Yield n synthetic it_tickets rows."""
+    rng = random.Random(seed)
+    for i, (priority, status) in enumerate(zip(_weighted(rng, PRIORITIES, n),
+                                               _weighted(rng, TICKET_STATUSES, n))):
+        created = _day(rng)
+        resolved = created if status in ("Resolved", "Closed") else None
+        yield (f"TKT-{seed}-{i:09d}", priority, status, rng.choice(TICKET_CATEGORIES),
+               _sentence(rng, 4), _sentence(rng), created, resolved, rng.choice(STAFF))
+
+
+def dataset_rows(n, seed=44):
+    """Yield n synthetic datasets_metadata rows."""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield (f"Dataset {i}", rng.choice(DATASET_CATEGORIES), rng.choice(STAFF),
+               _day(rng), rng.randrange(1_000, 5_000_000), round(rng.uniform(1, 5000), 2))
+
+
+def populate(conn, incidents=0, tickets=0, datasets=0):
+    """
+    Insert synthetic rows into the platform tables.
+
+    Args:
+        conn: Database connection (tables must already exist)
+        incidents: Number of cyber_incidents rows
+        tickets: Number of it_tickets rows
+        datasets: Number of datasets_metadata rows
+    """
+    cursor = conn.cursor()
+    cursor.executemany("""
+        INSERT INTO cyber_incidents
+        (date, incident_type, severity, status, description, reported_by)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, incident_rows(incidents))
+    cursor.executemany("""
+        INSERT INTO it_tickets
+        (ticket_id, priority, status, category, subject, description,
+         created_date, resolved_date, assigned_to)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, ticket_rows(tickets))
+    cursor.executemany("""
+        INSERT INTO datasets_metadata
+        (dataset_name, category, source, last_updated, record_count, file_size_mb)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, dataset_rows(datasets))
+    conn.commit()
+
+
+def write_csvs(data_dir, incidents=0, tickets=0, datasets=0):
+    """
+    Write synthetic rows as the CSV files load_all_data reads, plus a
+    one-user users.txt.
+
+    Args:
+        data_dir: Directory to write into (created if missing)
+        incidents: Number of cyber_incidents.csv rows
+        tickets: Number of it_tickets.csv rows
+        datasets: Number of datasets_metadata.csv rows
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    files = [
+        ("cyber_incidents.csv",
+         ["date", "incident_type", "severity", "status", "description", "reported_by"],
+         incident_rows(incidents)),
+        ("it_tickets.csv",
+         ["ticket_id", "priority", "status", "category", "subject", "description",
+          "created_date", "resolved_date", "assigned_to"],
+         ticket_rows(tickets)),
+        ("datasets_metadata.csv",
+         ["dataset_name", "category", "source", "last_updated", "record_count",
+          "file_size_mb"],
+         dataset_rows(datasets)),
+    ]
+    for name, header, rows in files:
+        with open(data_dir / name, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+    (data_dir / "users.txt").write_text("alice,x,analyst\n")
@@ -8,6 +8,7 @@ from app.data.incidents import (
 )
 from app.data.datasets import load_datasets_from_csv, get_all_datasets
 from app.data.tickets import load_tickets_from_csv, get_all_tickets
+from app.services.setup_service import complete_setup
 
 
 def setup_database():
@@ -129,10 +130,18 @@ def show_statistics():
         print(stats['by_status'].to_string(index=False))
 
 
-def main():
-    """Main function to run all demonstrations."""
+def main(bulk=False):
+    """
+    Main function to run all demonstrations.
+
+    Args:
+        bulk: Set the database up with the bulk-load path (large initial loads)
+    """
     # Step 1: Setup database
-    setup_database()
+    if bulk:
+        complete_setup(bulk=True)
+    else:
+        setup_database()
 
     # Step 2: Test authentication
     test_authentication()
@@ -151,4 +160,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Week 8 database setup and demonstrations")
+    parser.add_argument("--bulk", action="store_true",
+                        help="load data in bulk-load mode (deferred indexes, no journal sync)")
+    args = parser.parse_args()
+    main(bulk=args.bulk)